@@ -0,0 +1,130 @@
+"""
+Notion record 변환 성능 측정
+
+stub 워크스페이스로 10k 행의 합성 member data source 응답을 만들어, 기존 방식(행마다 dict를 직접 탐색한 뒤 pydantic 검증)과
+스키마로부터 만들어진 decoder의 초당 처리 행 수를 비교합니다.
+두 방식 모두 pydantic 검증을 거치며, 결과 record가 같은지도 확인합니다.
+
+backend 디렉토리에서 실행하십시오.
+    python -m benchmarks.bench_decoder
+"""
+
+import gc
+import time
+
+from src.services.notion.decoder import get_decoder
+from src.services.notion.notion import MemberRecord
+from src.services.notion.stub import generate_workspace
+from src.utils.constants import Role, Sync
+
+ROWS = 10_000
+REPEAT = 5
+
+
+def synthetic_response(rows: int) -> dict:
+    workspace = generate_workspace(members=rows, events=0)
+    return {"object": "list", "results": workspace.member.pages, "has_more": False}
+
+
+def legacy_text_to_sync(text: str) -> Sync:
+    """decoder 도입 이전의 Sync.text_to_sync (순차 탐색)"""
+    for sync in Sync:
+        if text == sync.value[0]:
+            return sync
+    raise ValueError(f"{text}는 올바르지 않는 Sync Status입니다.")
+
+
+def legacy_text_to_role(text: str) -> Role:
+    """decoder 도입 이전의 Role.text_to_role (순차 탐색)"""
+    for role in Role:
+        if text == role.value:
+            return role
+    raise ValueError(f"{text}는 올바르지 않은 Role입니다.")
+
+
+def legacy_extract(row: dict) -> dict:
+    """decoder 도입 이전의 MemberRecord.extract"""
+    properties = row.get("properties", {})
+    sync_select = properties.get("Sync Status", {}).get("select")
+    status = (
+        legacy_text_to_sync(sync_select.get("name")) if sync_select else Sync.Writing
+    )
+    title_list = properties.get("Name", {}).get("title", [])
+    name = title_list[0].get("plain_text", "") if title_list else ""
+    student_id_list = properties.get("Student ID", {}).get("rich_text", [])
+    student_id = (
+        int(student_id_list[0].get("plain_text", "0")) if student_id_list else 0
+    )
+    email = properties.get("Email", {}).get("email", "")
+    role_select = properties.get("Role", {}).get("select")
+    try:
+        role = (
+            legacy_text_to_role(role_select.get("name")) if role_select else Role.Guest
+        )
+    except ValueError:
+        role = Role.Guest
+    groups = [g.get("id", "") for g in properties.get("Groups", {}).get("relation", [])]
+    phone = properties.get("Phone", {}).get("phone_number", "") or ""
+    discord_id_list = properties.get("Discord ID", {}).get("rich_text", [])
+    discord_id = discord_id_list[0].get("plain_text", "") if discord_id_list else ""
+    log_list = properties.get("Log", {}).get("rich_text", [])
+    log = log_list[0].get("plain_text", "") if log_list else ""
+    return {
+        "status": status,
+        "name": name,
+        "student_id": student_id,
+        "email": email,
+        "role": role,
+        "groups": groups,
+        "phone": phone,
+        "notion_id": row.get("id", ""),
+        "discord_id": discord_id,
+        "log": log,
+    }
+
+
+def measure(name: str, func, response: dict) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        # timeit과 같이 측정 중에는 GC를 끄고, 측정 사이에 이전 결과를 정리
+        records = None
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            records = func(response)
+            best = min(best, time.perf_counter() - started)
+        finally:
+            gc.enable()
+    assert len(records) == len(response["results"])
+    rate = len(records) / best
+    print(f"{name:<28} {best * 1000:8.1f} ms  {rate:12,.0f} rows/s")
+    return rate
+
+
+def main():
+    response = synthetic_response(ROWS)
+    decoder = get_decoder(MemberRecord)
+
+    print(f"{ROWS:,} rows, best of {REPEAT}")
+    legacy = measure(
+        "legacy extract + validate",
+        lambda r: [
+            MemberRecord.model_validate(legacy_extract(row)) for row in r["results"]
+        ],
+        response,
+    )
+    decoded = measure("decoder + validate", decoder.decode_results, response)
+    # decoder는 last_edited_time도 채우므로 나머지 필드가 같은지 확인
+    exclude = {"last_edited_time"}
+    assert [
+        r.model_dump(exclude=exclude) for r in decoder.decode_results(response)
+    ] == [
+        MemberRecord.model_validate(legacy_extract(row)).model_dump(exclude=exclude)
+        for row in response["results"]
+    ]
+    print(f"speedup: {decoded / legacy:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
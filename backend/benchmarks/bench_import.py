@@ -0,0 +1,98 @@
+"""
+모듈 import 시간 측정 (DB 없음)
+
+각 진입 모듈을 새로운 인터프리터에서 `python -X importtime`으로 import하고,
+전체 소요 시간과 가장 오래 걸린 하위 모듈을 출력합니다.
+import 중에 DB 연결이나 네트워크 요청이 발생하지 않아야 하므로, DB가 없는 환경에서 실행하십시오.
+
+backend 디렉토리에서 실행하십시오.
+    python -m benchmarks.bench_import --top 5
+    python -m benchmarks.bench_import --module src.services.gmail
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+# 측정할 진입 모듈 (CLI, worker, API 서버가 처음 import하는 모듈)
+ENTRY_MODULES = [
+    "src.utils.constants",
+    "src.core.database",
+    "src.utils.env",
+    "src.models.group",
+    "src.services.notion.notion",
+    "src.services.notion.sync",
+    "src.services.discord",
+    "src.services.gmail",
+    "src.services.reminder",
+]
+
+
+def parse_importtime(stderr: str) -> list[tuple[int, int, str]]:
+    """
+    -X importtime 출력을 파싱합니다.
+
+    :param stderr: 인터프리터의 stderr
+    :return: (self 시간(us), 누적 시간(us), 모듈 이름) 목록
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+def measure(module: str) -> tuple[float, list[tuple[int, int, str]], str]:
+    """
+    새로운 인터프리터에서 모듈을 import합니다.
+
+    :param module: 모듈 이름
+    :return: (인터프리터 실행부터 종료까지 걸린 시간(초), importtime 목록, 에러 메시지)
+    """
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - started
+    rows = parse_importtime(result.stderr)
+    error = ""
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1]
+    return elapsed, rows, error
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--module", action="append", help="측정할 모듈 (여러 번 지정 가능)")
+    parser.add_argument("--top", type=int, default=3, help="출력할 하위 모듈 수")
+    args = parser.parse_args()
+
+    baseline, _, _ = measure("sys")
+    print(f"{'interpreter':32} {baseline * 1000:8.1f}ms")
+
+    for module in args.module or ENTRY_MODULES:
+        elapsed, rows, error = measure(module)
+        own = next((cum for _, cum, name in rows if name == module), 0)
+        print(
+            f"{module:32} {elapsed * 1000:8.1f}ms "
+            f"(import {own / 1000:.1f}ms, {len(rows)} modules)"
+        )
+        if error:
+            print(f"    error: {error}")
+            continue
+        # 최상위 패키지 기준으로 가장 오래 걸린 모듈
+        top_level = {}
+        for _, cum, name in rows:
+            if "." not in name:
+                top_level[name] = max(top_level.get(name, 0), cum)
+        for name, cum in sorted(top_level.items(), key=lambda x: -x[1])[: args.top]:
+            print(f"    {name:28} {cum / 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Notion 조회 경로 부하 측정 (네트워크 없음)
+
+stub 워크스페이스를 대상으로 data source 해석, 스키마 검증, member 전체 조회를 실행하고
+소요 시간과 endpoint별 요청 수를 출력합니다.
+
+backend 디렉토리에서 실행하십시오.
+    python -m benchmarks.bench_notion_query --size 10k --latency 0.05
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.services.notion.stub import (
+    SIZES,
+    StubTransport,
+    generate_workspace,
+    stub_notion,
+)
+
+
+async def run(size: str, latency: float, rate: float, rate_limit_every: int):
+    started = time.perf_counter()
+    workspace = generate_workspace(SIZES[size])
+    print(
+        f"workspace {size}: {len(workspace.member.pages):,} members, "
+        f"{len(workspace.group.pages):,} groups, {len(workspace.event.pages):,} events "
+        f"({time.perf_counter() - started:.2f}s)"
+    )
+
+    transport = StubTransport(
+        workspace, latency=latency, rate_limit_every=rate_limit_every
+    )
+    notion = stub_notion(workspace, rate=rate, transport=transport)
+
+    started = time.perf_counter()
+    await notion.validate_schemas()
+    print(f"resolve + validate schemas   {time.perf_counter() - started:8.3f}s")
+
+    started = time.perf_counter()
+    count = 0
+    async for _ in notion.iter_member_records():
+        count += 1
+    elapsed = time.perf_counter() - started
+    print(
+        f"stream members               {elapsed:8.3f}s  {count / elapsed:12,.0f} rows/s"
+    )
+
+    for (method, endpoint), requests in sorted(transport.requests.items()):
+        print(f"  {method:<6} {endpoint:<28} {requests:6,}")
+    await notion.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", choices=SIZES, default="10k")
+    parser.add_argument("--latency", type=float, default=0.0, help="요청당 지연(초)")
+    parser.add_argument(
+        "--rate", type=float, default=1000.0, help="초당 요청 수 제한 (Notion: 3)"
+    )
+    parser.add_argument(
+        "--rate-limit-every", type=int, default=0, help="N번째 요청마다 429 응답"
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.size, args.latency, args.rate, args.rate_limit_every))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+repository loading profile별 쿼리 수 측정 (메모리 SQLite)
+
+profile마다 목록을 조회하고 profile에 포함된 관계를 모두 읽었을 때의 쿼리 수를 행 수별로 출력합니다.
+profile의 쿼리 수는 행 수와 관계없이 같아야 하며, 다르면 종료 코드 1로 끝납니다.
+(selectinload는 id를 500개씩 나누어 조회하므로 500행을 넘으면 관계마다 500행당 쿼리가 하나씩 늘어납니다)
+비교를 위해 기본 lazy loading으로 같은 관계를 읽은 쿼리 수도 출력합니다.
+
+backend 디렉토리에서 실행하십시오.
+    python -m benchmarks.bench_repository --sizes 10 100 500
+"""
+
+import argparse
+import random
+import sys
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import Session
+
+from src.core.repository import Profile, list_events, list_groups, list_members
+from src.models.base import Base
+from src.models.event import Event
+from src.models.group import Group
+from src.models.user import User
+
+# relationship을 설정하기 위해 모든 model을 import
+import src.models.system_setting
+
+LIST_FUNCTIONS = {User: list_members, Group: list_groups, Event: list_events}
+
+
+def seed(db: Session, size: int):
+    """사용자 size명, 그룹 size/10개, 일정 size/10개를 만들고 무작위로 연결합니다."""
+    rng = random.Random(size)
+    now = datetime.now()
+    groups = [
+        Group(title=f"g{i}", notion_id=f"g{i}") for i in range(max(size // 10, 1))
+    ]
+    users = [
+        User(
+            username=f"u{i}",
+            email=f"u{i}@pusan.ac.kr",
+            hashed_password="",
+            notion_id=f"u{i}",
+            groups=rng.sample(groups, min(2, len(groups))),
+        )
+        for i in range(size)
+    ]
+    events = [
+        Event(
+            title=f"e{i}",
+            notion_id=f"e{i}",
+            start_time=now + timedelta(hours=i),
+            end_time=now + timedelta(hours=i + 1),
+            users=rng.sample(users, min(5, len(users))),
+            groups=rng.sample(groups, 1),
+        )
+        for i in range(max(size // 10, 1))
+    ]
+    db.add_all(users + groups + events)
+    db.commit()
+
+
+def touch(rows: list, profile: Profile):
+    """profile에 포함된 관계를 모두 읽습니다."""
+    for row in rows:
+        for path in profile.paths:
+            targets = [row]
+            for attr in path:
+                targets = [t for target in targets for t in getattr(target, attr.key)]
+
+
+def count_queries(engine, func) -> int:
+    count = 0
+
+    def on_execute(*args):
+        nonlocal count
+        count += 1
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        func()
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500])
+    args = parser.parse_args()
+
+    engines = {}
+    for size in args.sizes:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine) as db:
+            seed(db, size)
+        engines[size] = engine
+
+    print(f"{'profile':34}" + "".join(f"{f'n={s}':>16}" for s in args.sizes))
+    ok = True
+    for profile in Profile:
+        counts, lazy_counts = [], []
+        for size, engine in engines.items():
+            with Session(engine) as db:
+                counts.append(
+                    count_queries(
+                        engine,
+                        lambda: touch(
+                            LIST_FUNCTIONS[profile.model](db, profile), profile
+                        ),
+                    )
+                )
+            with Session(engine) as db:
+                lazy_counts.append(
+                    count_queries(
+                        engine,
+                        lambda: touch(list(db.scalars(select(profile.model))), profile),
+                    )
+                )
+        constant = len(set(counts)) == 1
+        ok = ok and constant
+        print(
+            f"{profile.name:34}"
+            + "".join(f"{f'{c} (lazy {l})':>16}" for c, l in zip(counts, lazy_counts))
+            + ("" if constant else "  <- not constant")
+        )
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
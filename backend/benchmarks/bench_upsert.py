@@ -0,0 +1,108 @@
+"""
+Notion record -> db upsert 성능 측정
+
+member record를 orm으로 한 건씩(조회 후 add) 쓰는 방식과 upsert_records를 비교합니다.
+upsert_records는 새로운 행 insert, 변경 없는 재실행, 일부 행만 바뀐 재실행을 각각 측정합니다.
+
+backend 디렉토리에서 실행하십시오. --url을 지정하지 않으면 메모리 SQLite를 사용합니다.
+    python -m benchmarks.bench_upsert --rows 10000
+    python -m benchmarks.bench_upsert --url postgresql+psycopg://user:pw@localhost:5432/bench
+"""
+
+import argparse
+import time
+
+from sqlalchemy import create_engine, delete, select
+from sqlalchemy.orm import Session
+
+from src.models.base import Base
+from src.models.user import User
+
+# relationship을 설정하기 위해 모든 model을 import
+import src.models.event, src.models.group, src.models.system_setting
+from src.services.notion.notion import MemberRecord
+from src.services.notion.upsert import member_row, upsert_records
+from src.utils.constants import Sync
+
+
+def make_records(count: int, changed_every: int = 0) -> list[MemberRecord]:
+    """member record를 생성합니다. changed_every번째 record마다 이름을 바꿉니다."""
+    return [
+        MemberRecord(
+            status=Sync.Synced,
+            notion_id=f"{i:032x}",
+            log="",
+            name=f"member{i}"
+            + ("*" if changed_every and i % changed_every == 0 else ""),
+            student_id=202400000 + i,
+            email=f"m{i}@pusan.ac.kr",
+            phone=f"010-{i // 10000:04d}-{i % 10000:04d}",
+            discord_id=str(10**17 + i),
+        )
+        for i in range(count)
+    ]
+
+
+def orm_upsert(db: Session, records: list[MemberRecord]):
+    """record마다 notion_id로 조회한 뒤 add하거나 속성을 수정합니다."""
+    for record in records:
+        row = member_row(record)
+        user = db.scalar(select(User).where(User.notion_id == row["notion_id"]))
+        if user is None:
+            db.add(User(**row))
+        else:
+            for key, value in row.items():
+                if key != "hashed_password":
+                    setattr(user, key, value)
+    db.commit()
+
+
+def timed(label: str, rows: int, func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - started
+    print(f"{label:32} {elapsed:8.3f}s  {rows / elapsed:12,.0f} rows/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--url", default="sqlite://", help="db url (기본값: 메모리 SQLite)"
+    )
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument(
+        "--changed-every", type=int, default=10, help="재실행 시 N번째 행마다 값 변경"
+    )
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    Base.metadata.create_all(engine)
+    records = make_records(args.rows)
+
+    with Session(engine) as db:
+        db.execute(delete(User))
+        db.commit()
+        timed("orm add (one by one)", args.rows, orm_upsert, db, records)
+        db.execute(delete(User))
+        db.commit()
+
+        def upsert(records):
+            result = upsert_records(db, records)
+            db.commit()
+            return result
+
+        result = timed("upsert insert", args.rows, upsert, records)
+        print(f"  written {result.written:,}, unchanged {result.unchanged:,}")
+        result = timed("upsert unchanged", args.rows, upsert, records)
+        print(f"  written {result.written:,}, unchanged {result.unchanged:,}")
+        changed = make_records(args.rows, args.changed_every)
+        result = timed("upsert partially changed", args.rows, upsert, changed)
+        print(f"  written {result.written:,}, unchanged {result.unchanged:,}")
+
+        db.execute(delete(User))
+        db.commit()
+
+
+if __name__ == "__main__":
+    main()
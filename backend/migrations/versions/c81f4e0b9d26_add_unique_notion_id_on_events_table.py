@@ -0,0 +1,36 @@
+"""add unique notion_id on events table
+
+Revision ID: c81f4e0b9d26
+Revises: a3c9d27e51f4
+Create Date: 2026-10-17 15:26:48.710394
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81f4e0b9d26'
+down_revision: Union[str, Sequence[str], None] = 'a3c9d27e51f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ON CONFLICT (notion_id) upsert를 위해 필요
+    op.create_unique_constraint('events_notion_id_key', 'events', ['notion_id'])
+    # 노션에서 가져온 그룹은 디스코드 카테고리를 만들기 전까지 category_id가 없음
+    op.alter_column('groups', 'category_id',
+               existing_type=sa.BigInteger(),
+               nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('groups', 'category_id',
+               existing_type=sa.BigInteger(),
+               nullable=False)
+    op.drop_constraint('events_notion_id_key', 'events', type_='unique')
@@ -0,0 +1,146 @@
+import uuid
+from typing import Iterable
+
+from pydantic import BaseModel
+from sqlalchemy import Column, MetaData, Table, Uuid, delete, exists, insert, select
+from sqlalchemy.orm import Session
+
+from src.models.assiciation import (
+    group_event_association,
+    user_event_association,
+    user_group_association,
+)
+
+# 원하는 (left_id, right_id) 쌍을 올려두고 table과 비교하기 위한 임시 table
+# PostgreSQL에서는 commit될 때 삭제되어, connection pool로 재사용되는 connection에 남지 않음
+_pairs = Table(
+    "tmp_association_pairs",
+    MetaData(),
+    Column("left_id", Uuid, primary_key=True),
+    Column("right_id", Uuid, primary_key=True),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+
+class AssociationSyncResult(BaseModel):
+    """association table 동기화 결과"""
+
+    added: int = 0
+    removed: int = 0
+
+
+def sync_association(
+    db: Session,
+    table: Table,
+    pairs: Iterable[tuple[uuid.UUID, uuid.UUID]],
+    scope: Iterable[uuid.UUID] | None = None,
+    scope_column: str | None = None,
+) -> AssociationSyncResult:
+    """
+    association table이 pairs와 같아지도록 바뀐 행만 추가, 삭제합니다.
+
+    orm relationship 목록(User.groups 등)을 수정하면 collection 전체를 읽고 행마다 INSERT/DELETE가 발생하지만,
+    이 함수는 원하는 쌍을 임시 table에 한 번에 올린 뒤, 차이를 SQL로 계산하여 INSERT ... SELECT 한 번과 DELETE 한 번으로 반영합니다.
+    이미 session에 로드된 relationship 목록은 갱신되지 않으므로, 필요하면 expire 하십시오. commit은 호출한 쪽에서 합니다.
+
+    Example:
+        >>> # 그룹 g1의 멤버를 u1, u2로 맞춤 (다른 그룹의 멤버는 건드리지 않음)
+        >>> sync_association(db, user_group_association, [(u1, g1), (u2, g1)], scope=[g1], scope_column="group_id")
+
+    :param db: DB Session
+    :param table: association table. primary key 컬럼 두 개를 (left, right) 순서로 사용합니다.
+    :param pairs: 원하는 (left_id, right_id) 쌍 목록
+    :param scope: 동기화할 범위의 id 목록. 이 id에 속한 행만 삭제 대상이 되며, 범위 밖의 쌍은 무시합니다.
+        None이면 table 전체를 pairs와 같게 맞춥니다.
+    :param scope_column: scope가 가리키는 컬럼 이름 (기본값: left 컬럼)
+    :return: 추가, 삭제된 행 수
+    """
+    left, right = table.primary_key.columns
+    pairs = set(pairs)
+    scope_filter = None
+    if scope is not None:
+        scope = set(scope)
+        scope_col = table.c[scope_column] if scope_column else left
+        index = 0 if scope_col is left else 1
+        pairs = {pair for pair in pairs if pair[index] in scope}
+        scope_filter = scope_col.in_(scope)
+
+    bind = db.connection()
+    # 실패하면 호출한 쪽의 rollback으로 임시 table도 함께 사라지므로, 성공했을 때만 삭제
+    _pairs.create(bind, checkfirst=True)
+    # 실패 후 rollback 대신 commit한 경우 등, 이전 호출의 쌍이 남아있을 수 있으므로 비우고 시작
+    db.execute(delete(_pairs))
+    if pairs:
+        db.execute(
+            insert(_pairs),
+            [{"left_id": left_id, "right_id": right_id} for left_id, right_id in pairs],
+        )
+    # table의 행과 원하는 쌍이 같은지. 바깥 구문의 table에 따라 자동으로 correlate됨
+    matches = exists().where(_pairs.c.left_id == left, _pairs.c.right_id == right)
+
+    # 원하는 쌍 중 table에 없는 쌍을 추가
+    added = db.execute(
+        insert(table).from_select(
+            [left.name, right.name],
+            select(_pairs.c.left_id, _pairs.c.right_id).where(~matches),
+        )
+    ).rowcount
+
+    # 범위 안에서 원하는 쌍에 없는 행을 삭제
+    stmt = delete(table).where(~matches)
+    if scope_filter is not None:
+        stmt = stmt.where(scope_filter)
+    removed = db.execute(stmt).rowcount
+
+    _pairs.drop(bind)
+    return AssociationSyncResult(added=added, removed=removed)
+
+
+def sync_user_groups(
+    db: Session,
+    pairs: Iterable[tuple[uuid.UUID, uuid.UUID]],
+    user_ids: Iterable[uuid.UUID] | None = None,
+) -> AssociationSyncResult:
+    """
+    사용자의 그룹 목록을 동기화합니다.
+
+    :param db: DB Session
+    :param pairs: (user id, group id) 목록
+    :param user_ids: 동기화할 사용자 id 목록. None이면 모든 사용자
+    """
+    return sync_association(db, user_group_association, pairs, user_ids)
+
+
+def sync_event_users(
+    db: Session,
+    pairs: Iterable[tuple[uuid.UUID, uuid.UUID]],
+    event_ids: Iterable[uuid.UUID] | None = None,
+) -> AssociationSyncResult:
+    """
+    일정의 참석자 목록을 동기화합니다.
+
+    :param db: DB Session
+    :param pairs: (user id, event id) 목록
+    :param event_ids: 동기화할 일정 id 목록. None이면 모든 일정
+    """
+    return sync_association(
+        db, user_event_association, pairs, event_ids, scope_column="event_id"
+    )
+
+
+def sync_event_groups(
+    db: Session,
+    pairs: Iterable[tuple[uuid.UUID, uuid.UUID]],
+    event_ids: Iterable[uuid.UUID] | None = None,
+) -> AssociationSyncResult:
+    """
+    일정에 할당된 그룹 목록을 동기화합니다.
+
+    :param db: DB Session
+    :param pairs: (group id, event id) 목록
+    :param event_ids: 동기화할 일정 id 목록. None이면 모든 일정
+    """
+    return sync_association(
+        db, group_event_association, pairs, event_ids, scope_column="event_id"
+    )
@@ -1,5 +1,11 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, sessionmaker
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -7,9 +13,7 @@ from dotenv import load_dotenv
 # .env 로드
 BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent
 dotenv_path = BASE_DIR / ".env"
-print(f"dotenv_path = {dotenv_path}")
 if dotenv_path.exists():
-    print(f".env detected")
     load_dotenv(dotenv_path)
 
 # 데이터베이스 연결 정보
@@ -20,10 +24,67 @@ db_host = os.getenv("DB_HOST")
 db_port = os.getenv("DB_PORT")
 
 DATABASE_URL = f"postgresql://{user}:{password}@{db_host}:{db_port}/{db_name}"
+# 비동기 engine은 psycopg(3)의 async 드라이버를 사용
+ASYNC_DATABASE_URL = (
+    f"postgresql+psycopg://{user}:{password}@{db_host}:{db_port}/{db_name}"
+)
 
-print(f" DATABASE_URL = {DATABASE_URL}")
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# engine은 처음 session을 만들 때 생성됨 (DB 드라이버 import와 연결 설정을 import 시점에 하지 않기 위함)
+_engine: Engine | None = None
+
+
+def get_engine() -> Engine:
+    """engine을 반환합니다. 처음 호출할 때 생성하고, SessionLocal에 연결합니다."""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(DATABASE_URL)
+        # 비밀번호는 가려서 출력
+        print(f" DATABASE_URL = {_engine.url.render_as_string(hide_password=True)}")
+        SessionLocal.configure(bind=_engine)
+    return _engine
+
+
+class LazySessionMaker(sessionmaker):
+    """처음 session을 만들 때 engine을 생성하는 sessionmaker"""
+
+    def __call__(self, **local_kw) -> Session:
+        if "bind" not in local_kw and self.kw.get("bind") is None:
+            get_engine()
+        return super().__call__(**local_kw)
+
+
+SessionLocal = LazySessionMaker(autocommit=False, autoflush=False)
+
+_async_engine: AsyncEngine | None = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """비동기 engine을 반환합니다. 처음 호출할 때 생성하고, AsyncSessionLocal에 연결합니다."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(ASYNC_DATABASE_URL)
+        AsyncSessionLocal.configure(bind=_async_engine)
+    return _async_engine
+
+
+class LazyAsyncSessionMaker(async_sessionmaker):
+    """처음 session을 만들 때 비동기 engine을 생성하는 async_sessionmaker"""
+
+    def __call__(self, **local_kw) -> AsyncSession:
+        if "bind" not in local_kw and self.kw.get("bind") is None:
+            get_async_engine()
+        return super().__call__(**local_kw)
+
+
+# async session에서는 commit 후 속성에 접근할 때 암묵적인 조회(await 불가)가 일어나지 않도록 만료시키지 않음
+AsyncSessionLocal = LazyAsyncSessionMaker(autoflush=False, expire_on_commit=False)
+
+
+def __getattr__(name: str):
+    # 하위 호환성: `from src.core.database import engine`
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_db():
@@ -33,3 +94,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """FastAPI dependency for async database session"""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,229 @@
+import uuid
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.core.session_watch import SessionWatcher
+from src.models.base import Base
+from src.models.event import Event
+from src.models.group import Group
+from src.models.user import User
+
+
+def normalize_notion_id(notion_id: str) -> str:
+    """
+    Notion id를 db에 저장되는 형식(하이픈 없는 32자)으로 변환합니다.
+    relation 속성의 page id는 하이픈이 포함된 형식으로 전달됩니다.
+    """
+    return notion_id.replace("-", "")
+
+
+class TableIndex:
+    """
+    table 하나의 notion_id <-> id, discord_id <-> id 양방향 index입니다.
+    """
+
+    def __init__(self, model: type[Base], has_discord_id: bool):
+        """
+        :param model: index를 만들 orm 클래스. id, notion_id 컬럼이 있어야 합니다.
+        :type model: type[Base]
+        :param has_discord_id: discord_id 컬럼도 index에 포함할지 여부
+        :type has_discord_id: bool
+        """
+        self.model = model
+        self.has_discord_id = has_discord_id
+        self._by_notion: dict[str, uuid.UUID] = {}
+        self._notion_by_id: dict[uuid.UUID, str] = {}
+        self._by_discord: dict[int, uuid.UUID] = {}
+        self._discord_by_id: dict[uuid.UUID, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._notion_by_id)
+
+    def load(self, db: Session):
+        """
+        table 전체를 쿼리 한 번으로 읽어 index를 다시 만듭니다.
+        orm 객체 대신 필요한 컬럼만 조회합니다.
+
+        :param db: DB Session
+        :type db: Session
+        """
+        columns = [self.model.id, self.model.notion_id]
+        if self.has_discord_id:
+            columns.append(self.model.discord_id)
+
+        self.clear()
+        for row in db.execute(select(*columns)):
+            self.put(*row)
+
+    def clear(self):
+        self._by_notion.clear()
+        self._notion_by_id.clear()
+        self._by_discord.clear()
+        self._discord_by_id.clear()
+
+    def put(
+        self,
+        id: uuid.UUID,
+        notion_id: str | None,
+        discord_id: int | None = None,
+    ):
+        """
+        행 하나를 index에 추가하거나 갱신합니다. 이전 notion_id / discord_id 매핑은 제거됩니다.
+
+        :param id: 행의 id
+        :type id: uuid.UUID
+        :param notion_id: 행의 notion_id
+        :type notion_id: str | None
+        :param discord_id: 행의 discord_id. has_discord_id가 False면 무시됩니다.
+        :type discord_id: int | None
+        """
+        self.remove(id)
+        if notion_id:
+            notion_id = normalize_notion_id(notion_id)
+            self._by_notion[notion_id] = id
+            self._notion_by_id[id] = notion_id
+        if self.has_discord_id and discord_id is not None:
+            self._by_discord[discord_id] = id
+            self._discord_by_id[id] = discord_id
+
+    def put_row(self, row: Base):
+        """orm 객체의 현재 값으로 index를 갱신합니다."""
+        self.put(
+            row.id,
+            row.notion_id,
+            row.discord_id if self.has_discord_id else None,
+        )
+
+    def remove(self, id: uuid.UUID):
+        notion_id = self._notion_by_id.pop(id, None)
+        if notion_id is not None and self._by_notion.get(notion_id) == id:
+            del self._by_notion[notion_id]
+        discord_id = self._discord_by_id.pop(id, None)
+        if discord_id is not None and self._by_discord.get(discord_id) == id:
+            del self._by_discord[discord_id]
+
+    def id_of(self, notion_id: str) -> uuid.UUID | None:
+        """notion_id에 해당하는 행의 id. 없으면 None"""
+        return self._by_notion.get(normalize_notion_id(notion_id))
+
+    def notion_id_of(self, id: uuid.UUID) -> str | None:
+        return self._notion_by_id.get(id)
+
+    def id_of_discord(self, discord_id: int) -> uuid.UUID | None:
+        """discord_id에 해당하는 행의 id. 없으면 None"""
+        return self._by_discord.get(discord_id)
+
+    def discord_id_of(self, id: uuid.UUID) -> int | None:
+        return self._discord_by_id.get(id)
+
+    def resolve(self, notion_ids: Iterable[str]) -> tuple[list[uuid.UUID], list[str]]:
+        """
+        relation 속성의 notion id 목록을 id 목록으로 변환합니다.
+
+        :param notion_ids: Notion page id 목록
+        :type notion_ids: Iterable[str]
+        :return: (찾은 id 목록, index에 없는 notion id 목록)
+        :rtype: tuple[list[uuid.UUID], list[str]]
+        """
+        ids, missing = [], []
+        for notion_id in notion_ids:
+            id = self._by_notion.get(normalize_notion_id(notion_id))
+            if id is None:
+                missing.append(notion_id)
+            else:
+                ids.append(id)
+        return ids, missing
+
+
+class IdIndex(SessionWatcher):
+    """
+    users, groups, events table의 id를 notion_id, discord_id로 찾기 위한 메모리 index입니다.
+
+    table마다 쿼리 한 번으로 전체를 읽어오고, 이후에는 upsert된 행만 갱신합니다.
+    watch한 session에서 commit된 변경은 자동으로 반영됩니다. (SessionWatcher)
+    동기화 중 relation 속성(notion id 목록)을 id로 변환할 때 행마다 쿼리하지 않고 index를 사용합니다.
+
+    Example:
+        >>> index = IdIndex()
+        >>> index.load(db)
+        >>> index.watch(db)
+        >>> group_ids, missing = index.groups.resolve(record.groups)
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.users = TableIndex(User, has_discord_id=True)
+        self.groups = TableIndex(Group, has_discord_id=True)
+        self.events = TableIndex(Event, has_discord_id=False)
+        self._tables: dict[type[Base], TableIndex] = {
+            User: self.users,
+            Group: self.groups,
+            Event: self.events,
+        }
+        self.loaded = False
+
+    def load(self, db: Session):
+        """
+        모든 table의 index를 다시 만듭니다. table마다 쿼리를 한 번씩 실행합니다.
+
+        :param db: DB Session
+        :type db: Session
+        """
+        for table in self._tables.values():
+            table.load(db)
+        self.loaded = True
+
+    def ensure_loaded(self, db: Session):
+        """index가 아직 만들어지지 않았다면 만듭니다."""
+        if not self.loaded:
+            self.load(db)
+
+    def table_of(self, row: Base) -> TableIndex | None:
+        return self._tables.get(type(row))
+
+    def put(self, row: Base):
+        """
+        upsert된 orm 객체로 index를 갱신합니다. index 대상이 아닌 객체는 무시합니다.
+
+        :param row: User, Group, Event 객체
+        :type row: Base
+        """
+        table = self.table_of(row)
+        if table is not None:
+            table.put_row(row)
+
+    def remove(self, row: Base):
+        table = self.table_of(row)
+        if table is not None:
+            table.remove(row.id)
+
+    def _collect(self, session: Session, pending: dict):
+        for row in session.new | session.dirty:
+            table = self.table_of(row)
+            if table is not None:
+                discord_id = row.discord_id if table.has_discord_id else None
+                pending[(table, row.id)] = (row.notion_id, discord_id)
+        for row in session.deleted:
+            table = self.table_of(row)
+            if table is not None:
+                pending[(table, row.id)] = None
+
+    def _collect_bulk(self, model: type[Base], rows: list[dict], pending: dict):
+        table = self._tables.get(model)
+        if table is None:
+            return
+        for row in rows:
+            discord_id = row.get("discord_id") if table.has_discord_id else None
+            pending[(table, row["id"])] = (row["notion_id"], discord_id)
+
+    def _apply(self, pending: dict):
+        for (table, row_id), values in pending.items():
+            if values is None:
+                table.remove(row_id)
+            else:
+                table.put(row_id, *values)
+
+
+id_index = IdIndex()
@@ -0,0 +1,167 @@
+import uuid
+from datetime import datetime
+from enum import Enum
+from typing import Iterable
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session, raiseload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from src.models.base import Base
+from src.models.event import Event
+from src.models.group import Group
+from src.models.user import User
+
+
+class Profile(Enum):
+    """
+    조회할 때 함께 불러올 관계를 정의하는 loading profile입니다.
+
+    profile에 포함된 관계는 selectinload로 관계마다 쿼리 한 번에 불러오고,
+    포함되지 않은 관계에 접근하면 행마다 쿼리를 보내는 대신 예외가 발생합니다. (raiseload)
+    따라서 profile마다 조회 행 수와 관계없이 쿼리 수가 일정합니다.
+    (selectinload는 id를 500개씩 나누어 조회하므로, 500행을 넘으면 관계마다 500행당 쿼리가 하나씩 늘어납니다)
+    """
+
+    # (model, 관계 경로 목록)
+    MEMBER = (User, ())
+    MEMBER_WITH_GROUPS = (User, ((User.groups,),))
+    MEMBER_WITH_GROUPS_AND_EVENTS = (User, ((User.groups,), (User.evnets,)))
+    GROUP = (Group, ())
+    GROUP_WITH_MEMBERS = (Group, ((Group.users,),))
+    EVENT = (Event, ())
+    EVENT_WITH_ATTENDEES = (Event, ((Event.users,),))
+    EVENT_WITH_ATTENDEES_AND_GROUPS = (Event, ((Event.users,), (Event.groups,)))
+    # 그룹 멘션 대신 그룹의 멤버까지 필요한 경우
+    EVENT_WITH_GROUP_MEMBERS = (Event, ((Event.users,), (Event.groups, Group.users)))
+
+    def __init__(self, model: type[Base], paths: tuple[tuple, ...]):
+        self.model = model
+        self.paths = paths
+
+    @property
+    def options(self) -> list[LoaderOption]:
+        """query에 적용할 loader option 목록"""
+        options = []
+        for path in self.paths:
+            loader = selectinload(path[0])
+            for attr in path[1:]:
+                loader = loader.selectinload(attr)
+            options.append(loader)
+        # profile에 없는 관계는 lazy loading(N+1) 대신 접근할 때 예외 발생
+        options.append(raiseload("*"))
+        return options
+
+
+def _apply(stmt: Select, model: type[Base], profile: Profile) -> Select:
+    if profile.model is not model:
+        raise ValueError(
+            f"{profile.name}은 {profile.model.__name__}의 profile입니다. ({model.__name__} 조회)"
+        )
+    return stmt.options(*profile.options)
+
+
+# --- [ 사용자 ] ---
+
+
+def list_members(
+    db: Session,
+    profile: Profile = Profile.MEMBER,
+    ids: Iterable[uuid.UUID] | None = None,
+) -> list[User]:
+    """
+    사용자 목록을 조회합니다.
+
+    :param db: DB Session
+    :param profile: loading profile (예: Profile.MEMBER_WITH_GROUPS)
+    :param ids: 조회할 사용자 id 목록. None이면 전체
+    """
+    stmt = select(User).order_by(User.username)
+    if ids is not None:
+        stmt = stmt.where(User.id.in_(set(ids)))
+    return list(db.scalars(_apply(stmt, User, profile)))
+
+
+def get_member(
+    db: Session, id: uuid.UUID, profile: Profile = Profile.MEMBER
+) -> User | None:
+    """
+    사용자 한 명을 조회합니다.
+
+    :param db: DB Session
+    :param id: 사용자 id
+    :param profile: loading profile
+    """
+    return db.scalar(_apply(select(User).where(User.id == id), User, profile))
+
+
+# --- [ 그룹 ] ---
+
+
+def list_groups(
+    db: Session,
+    profile: Profile = Profile.GROUP,
+    ids: Iterable[uuid.UUID] | None = None,
+) -> list[Group]:
+    """
+    그룹 목록을 조회합니다.
+
+    :param db: DB Session
+    :param profile: loading profile (예: Profile.GROUP_WITH_MEMBERS)
+    :param ids: 조회할 그룹 id 목록. None이면 전체
+    """
+    stmt = select(Group).order_by(Group.title)
+    if ids is not None:
+        stmt = stmt.where(Group.id.in_(set(ids)))
+    return list(db.scalars(_apply(stmt, Group, profile)))
+
+
+def get_group(
+    db: Session, id: uuid.UUID, profile: Profile = Profile.GROUP
+) -> Group | None:
+    """
+    그룹 하나를 조회합니다.
+
+    :param db: DB Session
+    :param id: 그룹 id
+    :param profile: loading profile
+    """
+    return db.scalar(_apply(select(Group).where(Group.id == id), Group, profile))
+
+
+# --- [ 일정 ] ---
+
+
+def list_events(
+    db: Session,
+    profile: Profile = Profile.EVENT,
+    ids: Iterable[uuid.UUID] | None = None,
+    since: datetime | None = None,
+) -> list[Event]:
+    """
+    일정 목록을 시작 시간 순서로 조회합니다.
+
+    :param db: DB Session
+    :param profile: loading profile (예: Profile.EVENT_WITH_ATTENDEES_AND_GROUPS)
+    :param ids: 조회할 일정 id 목록. None이면 전체
+    :param since: 이 시간 이후에 시작하는 일정만 조회
+    """
+    stmt = select(Event).order_by(Event.start_time)
+    if ids is not None:
+        stmt = stmt.where(Event.id.in_(set(ids)))
+    if since is not None:
+        stmt = stmt.where(Event.start_time >= since)
+    return list(db.scalars(_apply(stmt, Event, profile)))
+
+
+def get_event(
+    db: Session, id: uuid.UUID, profile: Profile = Profile.EVENT
+) -> Event | None:
+    """
+    일정 하나를 조회합니다.
+
+    :param db: DB Session
+    :param id: 일정 id
+    :param profile: loading profile
+    """
+    return db.scalar(_apply(select(Event).where(Event.id == id), Event, profile))
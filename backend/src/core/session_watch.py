@@ -0,0 +1,118 @@
+import weakref
+from abc import ABC, abstractmethod
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.models.base import Base
+
+# session.info에서 session을 watch 중인 watcher 목록을 저장하는 key
+WATCHERS_KEY = "session_watchers"
+
+
+class SessionWatcher(ABC):
+    """
+    session에서 commit된 변경을 메모리 상태(index, 예약 등)에 반영하는 listener의 기반 클래스입니다.
+
+    flush된 행을 session별 pending에 모아두었다가 commit이 성공하면 반영하고, rollback되면 버립니다.
+    같은 session을 여러 번 watch해도 listener는 한 번만 등록되며, unwatch로 해제할 수 있습니다.
+    하위 클래스는 _collect와 _apply를 구현해야 하며, 구현하지 않으면 생성할 때 TypeError가 발생합니다.
+    """
+
+    def __init__(self):
+        # session -> (event 이름 -> listener, pending)
+        # listener는 session을 참조하지 않으므로, session이 사라지면 항목도 함께 사라짐
+        self._watched: weakref.WeakKeyDictionary[
+            Session, tuple[dict[str, Callable], dict]
+        ] = weakref.WeakKeyDictionary()
+
+    @abstractmethod
+    def _collect(self, session: Session, pending: dict):
+        """
+        flush된 행의 변경을 pending에 저장합니다.
+        commit 후에는 객체가 만료되어 속성 접근 시 쿼리가 발생하므로, flush 시점의 값을 저장해야 합니다.
+
+        :param session: flush된 session
+        :param pending: 이 session에서 commit을 기다리는 변경
+        """
+
+    @abstractmethod
+    def _apply(self, pending: dict):
+        """
+        commit된 변경을 반영합니다.
+
+        :param pending: _collect가 모은 변경
+        """
+
+    def _collect_bulk(self, model: type[Base], rows: list[dict], pending: dict):
+        """
+        orm을 거치지 않고 쓴 행(INSERT ... ON CONFLICT 등)의 변경을 pending에 저장합니다.
+        기본 동작은 무시이며, bulk write를 반영해야 하는 하위 클래스에서 구현합니다.
+
+        :param model: 행이 쓰여진 table의 orm 클래스
+        :param rows: 쓰여진 행의 컬럼 이름 -> 값
+        :param pending: 이 session에서 commit을 기다리는 변경
+        """
+
+    def is_watching(self, db: Session) -> bool:
+        return db in self._watched
+
+    def watch(self, db: Session):
+        """
+        session에서 commit된 변경을 자동으로 반영합니다. 이미 watch 중인 session이면 아무것도 하지 않습니다.
+
+        :param db: DB Session
+        """
+        if db in self._watched:
+            return
+        pending: dict = {}
+
+        def after_flush(session: Session, flush_context):
+            self._collect(session, pending)
+
+        def after_commit(session: Session):
+            self._apply(pending)
+            pending.clear()
+
+        def after_rollback(session: Session):
+            pending.clear()
+
+        listeners = {
+            "after_flush": after_flush,
+            "after_commit": after_commit,
+            "after_rollback": after_rollback,
+        }
+        for name, listener in listeners.items():
+            event.listen(db, name, listener)
+        self._watched[db] = (listeners, pending)
+        db.info.setdefault(WATCHERS_KEY, []).append(self)
+
+    def unwatch(self, db: Session):
+        """
+        watch로 등록한 listener를 해제합니다. commit되지 않은 변경은 버립니다.
+
+        :param db: DB Session
+        """
+        entry = self._watched.pop(db, None)
+        if entry is None:
+            return
+        listeners, _ = entry
+        for name, listener in listeners.items():
+            event.remove(db, name, listener)
+        db.info[WATCHERS_KEY].remove(self)
+
+
+def notify_bulk_write(db: Session, model: type[Base], rows: list[dict]):
+    """
+    orm을 거치지 않고 쓴 행을 session을 watch 중인 watcher에 전달합니다.
+    Core 구문으로 쓴 행은 session.new, session.dirty에 나타나지 않으므로, 쓴 쪽에서 직접 알려야 합니다.
+    전달된 변경은 orm 변경과 같이 commit되면 반영되고, rollback되면 버려집니다.
+
+    :param db: 행을 쓴 DB Session
+    :param model: 행이 쓰여진 table의 orm 클래스
+    :param rows: 쓰여진 행의 컬럼 이름 -> 값 (RETURNING 결과 등)
+    """
+    for watcher in db.info.get(WATCHERS_KEY, ()):
+        _, pending = watcher._watched[db]
+        watcher._collect_bulk(model, rows, pending)
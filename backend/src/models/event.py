@@ -59,7 +59,7 @@ class Event(Base):
     )
 
     # notion id
-    notion_id: Mapped[str] = mapped_column(String(32), nullable=False)
+    notion_id: Mapped[str] = mapped_column(String(32), unique=True, nullable=False)
 
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
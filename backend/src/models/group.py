@@ -64,8 +64,10 @@ class Group(Base):
     discord_id: Mapped[int | None] = mapped_column(
         BigInteger, unique=True, nullable=True
     )
-    # 디스코드에 추가되는 권한 전용 채널 카테고리의 id
-    category_id: Mapped[int] = mapped_column(BigInteger, unique=True, nullable=False)
+    # 디스코드에 추가되는 권한 전용 채널 카테고리의 id. 노션에서 가져온 그룹은 디스코드 리소스를 만들기 전까지 비어있음
+    category_id: Mapped[int | None] = mapped_column(
+        BigInteger, unique=True, nullable=True
+    )
 
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
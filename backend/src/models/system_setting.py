@@ -1,4 +1,5 @@
-from sqlalchemy import Uuid, String, DateTime, func
+from sqlalchemy import Uuid, String, DateTime, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, Session
 
 import uuid
@@ -79,6 +80,56 @@ class SystemSetting(Base):
         os.environ[key] = value
         return db_setting
 
+    @staticmethod
+    async def get_config_async(db: AsyncSession, key: str):
+        """
+        get_config의 비동기 버전입니다. 이벤트 루프를 막지 않고 db에서 특정 환경변수를 가져옵니다.
+
+        :param db: 비동기 DB Session
+        :type db: AsyncSession
+        :param key: 가져올 환경변수 Key값
+        :type key: str
+        """
+        db_setting = await db.scalar(
+            select(SystemSetting).where(SystemSetting.key == key)
+        )
+        if db_setting:
+            return decrypt_value(db_setting.value)
+        else:
+            value = os.getenv(key)
+            await SystemSetting.update_config_async(db, key, value)
+            return value
+
+    @staticmethod
+    async def update_config_async(db: AsyncSession, key: str, value: str):
+        """
+        update_config의 비동기 버전입니다. 이를 직접적으로 사용하지 말고, utils/env.py의 함수를 사용하시길 바랍니다.
+
+        :param db: 비동기 DB Session
+        :type db: AsyncSession
+        :param key: 환경변수 Key값
+        :type key: str
+        :param value: 환경변수 값
+        :type value: str
+        """
+        db_setting = await db.scalar(
+            select(SystemSetting).where(SystemSetting.key == key)
+        )
+
+        # cipher value
+        c_value = encrypt_value(value)
+
+        if db_setting:
+            db_setting.value = c_value
+        else:
+            db_setting = SystemSetting(key=key, value=c_value)
+            db.add(db_setting)
+
+        await db.commit()
+        await db.refresh(db_setting)
+        os.environ[key] = value
+        return db_setting
+
     @staticmethod
     def init_config(db: Session):
         """
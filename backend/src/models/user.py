@@ -40,8 +40,8 @@ class User(Base):
     email: Mapped[str] = mapped_column(String(30), unique=True, nullable=False)
     # 전화번호
     phone: Mapped[int | None] = mapped_column(Integer, unique=False)
-    # 학번
-    student_id: Mapped[int | None] = mapped_column(Integer, unique=False)
+    # 학번. 디스코드 입장 인증 시 학번으로 사용자를 찾으므로 index를 생성
+    student_id: Mapped[int | None] = mapped_column(Integer, unique=False, index=True)
     # discord 시스템에서 식별 가능한 사용자 id
     discord_id: Mapped[int | None] = mapped_column(BigInteger, unique=True)
     # notion 시스템에서 식별 가능한 사용자 id
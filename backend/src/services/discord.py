@@ -8,8 +8,15 @@ import certifi
 
 os.environ["SSL_CERT_FILE"] = certifi.where()
 
-from src.utils.env import get_env
+from src.utils.env import get_env, get_env_async
 from src.utils.constants import Color
+from src.services.discord_cache import ChannelCache, MemberCache
+from src.services.discord_outbox import OutboundQueue
+from src.services.discord_roles import RoleSyncResult, plan_roles
+from src.services.discord_ratelimit import DiscordRateLimiter
+from src.services.discord_invites import InvitePool
+from src.services.verification import VerificationQueue
+from src.services.reminder import ReminderScheduler
 
 class Discord:
     def __init__(self):
@@ -35,6 +42,8 @@ class Discord:
         self.httpx_client.headers.update({
             "Authorization": f"Bot {get_env("DISCORD_BOT_TOKEN")}"
         })
+        # REST 요청은 rate limit bucket별로 조절하여 전송
+        self.rest : DiscordRateLimiter = DiscordRateLimiter(self.httpx_client)
 
         # discord 봇 설정
         self.bot : commands.Bot = None # Lazy initialization
@@ -42,6 +51,18 @@ class Discord:
         
         self.guild : Guild = None
 
+        # gateway 이벤트로 갱신되는 길드 멤버 캐시
+        self.members : MemberCache = MemberCache()
+        # 채널 조회 캐시와, 채널별로 알림을 묶어 보내는 큐
+        self.channels : ChannelCache = ChannelCache()
+        self.outbox : OutboundQueue = OutboundQueue(self._send_batch)
+        # 미리 만들어둔 1회용 초대 링크
+        self.invites : InvitePool = InvitePool(self.create_invite)
+        # 새로 입장한 멤버의 학번 인증 작업 큐
+        self.verification : VerificationQueue = VerificationQueue(self)
+        # 일정 시작 전 알림 스케줄러
+        self.reminders : ReminderScheduler = ReminderScheduler(self)
+
     def change_api_key(self, api_key:str):
         """런타임 중 API 키 변경"""
         self.httpx_client.headers.update({
@@ -55,17 +76,36 @@ class Discord:
             intents.message_content = True
             intents.members = True
             self.bot = commands.Bot(command_prefix='!', intents=intents)
-            if get_env("DISCORD_BOT_TOKEN"):
-                await self.bot.login(get_env("DISCORD_BOT_TOKEN"))
+            self.members.attach(self.bot)
+            self.verification.attach(self.bot)
+            self.verification.start()
+            # 초대 링크 pool은 봇이 준비되면 채우기 시작함
+            self.invites.attach(self.bot)
+            # 일정 알림은 봇이 준비되면 db에서 예약을 다시 만든 뒤 시작함
+            self.reminders.attach(self.bot)
+            token = await get_env_async("DISCORD_BOT_TOKEN")
+            if token:
+                await self.bot.login(token)
+
+    async def request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """
+        Discord REST API로 요청을 보냅니다. 요청 한도에 도달하면 실패하지 않고 초기화될 때까지 기다린 뒤 재시도합니다.
+
+        :param method: HTTP method
+        :param path: API 경로 (예: /v10/users/@me)
+        :param kwargs: httpx.AsyncClient.request에 그대로 전달할 인자
+        :return: 응답
+        """
+        return await self.rest.request(method, f"{self.url}{path}", **kwargs)
 
     async def check_health(self) -> bool:
         """
         Discord 봇 API 상태를 확인합니다.
 
         :return: 상태가 정상이면 True 반환
-        :raises Exception: 인증 실패(401), 잘못된 요청(400), 호출 한도 초과(429) 등의 경우 예외 발생
+        :raises Exception: 인증 실패(401), 잘못된 요청(400), 재시도 후에도 호출 한도 초과(429) 등의 경우 예외 발생
         """
-        response = await self.httpx_client.get(f"{self.url}/v10/users/@me")
+        response = await self.request("GET", "/v10/users/@me")
         if response.status_code == 200:
             return True
         elif response.status_code == 401:
@@ -85,7 +125,7 @@ class Discord:
         :return: 실행 성공 시 True
         :rtype: bool
         """
-        if not get_env("DISCORD_BOT_TOKEN"):
+        if not await get_env_async("DISCORD_BOT_TOKEN"):
              print("Discord Bot Token is missing")
              return False
 
@@ -112,6 +152,18 @@ class Discord:
         self.guild = self._get_guild(guild_id)
         
 
+    async def get_guild(self, guild_id:int= None) -> Guild:
+        """
+        길드 객체를 반환합니다. 처음 조회한 길드는 캐시하여 다시 사용합니다.
+        guild_id가 없으면 환경변수 DISCORD_GUILD_ID를 사용합니다.
+
+        :param guild_id: 조회할 길드 ID
+        :type guild_id: int, optional
+        :return: Discord Guild 객체
+        :raises ValueError: 길드가 존재하지 않거나 접근할 수 없는 경우
+        """
+        return await self._get_guild(guild_id)
+
     async def _get_guild(self, guild_id:int= None):
         """
         지정된 ID의 길드 객체를 반환합니다. 
@@ -125,7 +177,7 @@ class Discord:
         if self.guild:
              return self.guild
 
-        guild_id = guild_id or int(get_env("DISCORD_GUILD_ID"))
+        guild_id = guild_id or int(await get_env_async("DISCORD_GUILD_ID"))
         
         # 먼저 캐시에서 확인
         guild = self.bot.get_guild(guild_id)
@@ -308,9 +360,11 @@ class Discord:
         :return: 성공 시 True, 사용자 없음 시 False
         """
         guild = await self._get_guild(guild_id)
-        member = await guild.fetch_member(user_id) # 멤버 정보는 API로 최신화
+        # 멤버 정보는 gateway 이벤트로 최신화된 캐시에서 가져오고, 없을 때만 API로 조회
+        member = await self.members.fetch(guild, user_id)
         if member:
             await member.kick(reason=reason)
+            self.members.remove(guild.id, user_id)
             return True
         return False
 
@@ -324,7 +378,7 @@ class Discord:
         :return: 성공 시 True, 멤버나 역할이 없으면 False
         """
         guild = await self._get_guild(guild_id)
-        member = await guild.fetch_member(user_id)
+        member = await self.members.fetch(guild, user_id)
         role = guild.get_role(role_id)
         
         if member and role:
@@ -342,7 +396,7 @@ class Discord:
         :return: 성공 시 True, 멤버나 역할이 없으면 False
         """
         guild = await self._get_guild(guild_id)
-        member = await guild.fetch_member(user_id)
+        member = await self.members.fetch(guild, user_id)
         role = guild.get_role(role_id)
         
         if member and role:
@@ -350,6 +404,45 @@ class Discord:
             return True
         return False
 
+    async def sync_roles(self, desired: dict[int, set[int]], managed: set[int] = None, guild_id: int = None, concurrency: int = 5) -> list[RoleSyncResult]:
+        """
+        여러 멤버의 역할을 한 번에 맞춥니다.
+        멤버마다 현재 역할과 가져야 하는 역할을 비교하여, 바뀐 부분을 멤버 수정 요청 한 번으로 반영합니다.
+        변경이 없는 멤버에게는 요청을 보내지 않습니다.
+
+        :param desired: 디스코드 사용자 ID -> 가져야 하는 역할 ID 목록 (discord_roles.desired_roles 참고)
+        :param managed: 동기화 대상 역할 ID 목록 (예: 모든 그룹의 역할). 없으면 desired에 등장하는 역할 전체.
+            이 목록에 없는 역할은 회수하지 않습니다.
+        :param guild_id: 길드 ID
+        :param concurrency: 동시에 보낼 멤버 수정 요청 수. 요청 한도(429)는 discord.py가 route별로 처리합니다.
+        :return: 멤버별 결과
+        :rtype: list[RoleSyncResult]
+        """
+        guild = await self._get_guild(guild_id)
+        if managed is None:
+            managed = set().union(*desired.values())
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def apply(user_id: int, roles: set[int]) -> RoleSyncResult:
+            async with semaphore:
+                try:
+                    member = await self.members.fetch(guild, user_id)
+                    if not member:
+                        return RoleSyncResult(user_id=user_id, ok=False, error="서버에 없는 사용자입니다.")
+
+                    current = {r.id for r in member.roles if r.id != guild.default_role.id}
+                    added, removed = plan_roles(current, roles, managed)
+                    if not added and not removed:
+                        return RoleSyncResult(user_id=user_id, ok=True, unchanged=True)
+
+                    role_ids = (current - removed) | added
+                    await member.edit(roles=[guild.get_role(rid) or discord.Object(id=rid) for rid in role_ids])
+                    return RoleSyncResult(user_id=user_id, ok=True, added=sorted(added), removed=sorted(removed))
+                except discord.HTTPException as e:
+                    return RoleSyncResult(user_id=user_id, ok=False, error=f"{e.status} - {e.text}")
+
+        return await asyncio.gather(*(apply(user_id, roles) for user_id, roles in desired.items()))
+
     # --- [ 메시지 관리 ] ---
 
     async def send_message(self, channel_id: int, content: str = None, embed: dict = None):
@@ -363,25 +456,58 @@ class Discord:
         :raises ValueError: 채널을 찾을 수 없는 경우
         :raises discord.Forbidden: 전송 권한이 없는 경우
         """
-        # channel = self.bot.get_channel(channel_id)
-        # get_channel은 캐시에서만 찾으므로, fetch_channel을 사용하여 API로 직접 가져옴
+        channel = await self._get_channel(channel_id)
+        discord_embed = discord.Embed.from_dict(embed) if isinstance(embed, dict) else embed
+
+        try:
+            await channel.send(content=content, embed=discord_embed)
+            return True
+        except discord.Forbidden:
+            raise discord.Forbidden("메시지 전송 실패: 권한이 없습니다.")
+
+    async def _get_channel(self, channel_id: int):
+        """
+        메시지를 보낼 채널을 가져옵니다.
+        get_channel은 캐시에서만 찾으므로, 캐시에 없으면 fetch_channel로 API에서 가져와 일정 시간 저장합니다.
+
+        :param channel_id: 채널 ID
+        :raises ValueError: 채널을 찾을 수 없는 경우
+        :raises discord.Forbidden: 채널에 접근할 권한이 없는 경우
+        """
         try:
-            channel = await self.bot.fetch_channel(channel_id)
-        except discord.NotFound:
-             channel = None
+            channel = await self.channels.fetch(self.bot, channel_id)
         except discord.Forbidden:
              raise discord.Forbidden("채널에 접근할 권한이 없습니다.")
-             
+
         if not channel:
             raise ValueError(f"채널(ID: {channel_id})을 찾을 수 없어 메시지를 보내지 못했습니다.")
+        return channel
+
+    async def _send_batch(self, channel_id: int, content: str | None, embeds: list[discord.Embed]):
+        """outbox가 묶은 메시지 하나를 전송합니다."""
+        channel = await self._get_channel(channel_id)
+        await channel.send(content=content, embeds=embeds)
+
+    def queue_message(self, channel_id: int, content: str = None, embed: dict = None):
+        """
+        메시지를 바로 보내지 않고 채널별 큐에 넣습니다.
+        잠시 뒤 같은 채널로 들어온 메시지와 함께 최소한의 메시지(최대 2000자, embed 10개)로 묶어 전송합니다.
+        알림처럼 여러 메시지가 한꺼번에 발생하는 경우에 사용하십시오.
 
+        :param channel_id: 메시지를 보낼 채널 ID
+        :param content: 메시지 텍스트 내용
+        :param embed: 임베드 메시지 (dict 또는 discord.Embed 객체)
+        """
         discord_embed = discord.Embed.from_dict(embed) if isinstance(embed, dict) else embed
+        self.outbox.put(channel_id, content, discord_embed)
 
-        try:
-            await channel.send(content=content, embed=discord_embed)
-            return True
-        except discord.Forbidden:
-            raise discord.Forbidden("메시지 전송 실패: 권한이 없습니다.")
+    async def flush_messages(self) -> int:
+        """
+        큐에 쌓인 메시지를 즉시 전송합니다.
+
+        :return: 전송한 메시지 수
+        """
+        return await self.outbox.flush()
     
     async def create_invite(self, max_age=86400, max_uses=1):
         """
@@ -413,8 +539,25 @@ class Discord:
         """
         Discord 봇 연결을 종료합니다.
         """
+        await self.flush_messages()
+        await self.invites.stop()
+        await self.verification.stop()
+        await self.reminders.stop()
         if self.bot:
             await self.bot.close()
 
-# 싱글턴 패턴
-discord_client = Discord()
\ No newline at end of file
+# 싱글턴 패턴. 생성할 때 DB에서 봇 토큰을 읽으므로, import 시점이 아니라 처음 사용할 때 생성함
+_discord_client: Discord | None = None
+
+def get_discord_client() -> Discord:
+    """Discord 클라이언트 싱글톤을 반환합니다. 처음 호출할 때 생성합니다."""
+    global _discord_client
+    if _discord_client is None:
+        _discord_client = Discord()
+    return _discord_client
+
+def __getattr__(name: str):
+    # 하위 호환성: `from src.services.discord import discord_client`
+    if name == "discord_client":
+        return get_discord_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
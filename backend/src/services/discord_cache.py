@@ -0,0 +1,181 @@
+import time
+
+import discord
+from discord.ext import commands
+from discord.guild import Guild
+
+# 채널 캐시 유지 시간(초)
+CHANNEL_TTL = 300
+# 존재하지 않는 채널을 다시 조회하지 않는 시간(초)
+CHANNEL_NEGATIVE_TTL = 60
+
+
+class MemberCache:
+    """
+    gateway 이벤트로 최신 상태를 유지하는 길드 멤버 캐시입니다.
+
+    봇이 준비되면(on_ready) 길드 멤버 전체를 gateway chunk로 한 번 불러오고,
+    이후에는 멤버 입장/퇴장/수정 이벤트로 캐시를 갱신합니다.
+    캐시에 없는 멤버만 REST API(fetch_member)로 조회하므로, 역할 부여/회수나 추방 시 추가 요청이 발생하지 않습니다.
+
+    Example:
+        >>> cache = MemberCache()
+        >>> cache.attach(bot)
+        >>> member = await cache.fetch(guild, user_id)
+    """
+
+    def __init__(self):
+        # 길드 id -> 사용자 id -> 멤버
+        self._members: dict[int, dict[int, discord.Member]] = {}
+        # 전체 멤버를 불러온 길드 id
+        self._loaded: set[int] = set()
+        # REST 조회 없이 캐시로 처리한 횟수 / REST로 조회한 횟수
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return sum(len(members) for members in self._members.values())
+
+    def attach(self, bot: commands.Bot):
+        """
+        봇에 gateway 이벤트 listener를 등록합니다.
+
+        :param bot: 이벤트를 받을 봇
+        """
+        bot.add_listener(self._on_ready(bot), "on_ready")
+        bot.add_listener(self.on_member_join, "on_member_join")
+        bot.add_listener(self.on_member_update, "on_member_update")
+        bot.add_listener(self.on_raw_member_remove, "on_raw_member_remove")
+
+    def _on_ready(self, bot: commands.Bot):
+        async def on_ready():
+            for guild in bot.guilds:
+                await self.load(guild)
+
+        return on_ready
+
+    async def load(self, guild: Guild, force: bool = False) -> int:
+        """
+        길드 멤버 전체를 캐시에 불러옵니다. 이미 불러온 길드는 force가 아니면 다시 불러오지 않습니다.
+
+        :param guild: 불러올 길드
+        :param force: 이미 불러온 길드도 다시 불러올지 여부
+        :return: 캐시된 멤버 수
+        """
+        if guild.id in self._loaded and not force:
+            return len(self._members.get(guild.id, {}))
+
+        try:
+            # gateway로 멤버 목록을 chunk 단위로 받아옴 (멤버 수와 관계없이 REST 요청 없음)
+            members = guild.members if guild.chunked else await guild.chunk()
+        except (discord.ClientException, discord.HTTPException) as e:
+            # gateway에 연결되지 않은 길드(fetch_guild로 얻은 길드 등)는 필요할 때 REST로 조회
+            print(f"Failed to chunk guild {guild.id}: {e}")
+            return 0
+
+        self._members[guild.id] = {member.id: member for member in members}
+        self._loaded.add(guild.id)
+        return len(members)
+
+    def put(self, member: discord.Member):
+        self._members.setdefault(member.guild.id, {})[member.id] = member
+
+    def remove(self, guild_id: int, user_id: int):
+        self._members.get(guild_id, {}).pop(user_id, None)
+
+    def get(self, guild_id: int, user_id: int) -> discord.Member | None:
+        """캐시에서만 멤버를 찾습니다. 없으면 None을 반환합니다."""
+        return self._members.get(guild_id, {}).get(user_id)
+
+    async def fetch(self, guild: Guild, user_id: int) -> discord.Member | None:
+        """
+        멤버를 찾습니다. 캐시 -> 봇 내부 캐시 -> REST API 순으로 조회합니다.
+
+        :param guild: 길드
+        :param user_id: 사용자 ID
+        :return: 멤버. 길드에 없는 사용자면 None
+        """
+        member = self.get(guild.id, user_id) or guild.get_member(user_id)
+        if member:
+            self.hits += 1
+            return member
+
+        self.misses += 1
+        try:
+            member = await guild.fetch_member(user_id)
+        except discord.NotFound:
+            return None
+        self.put(member)
+        return member
+
+    # --- [ gateway 이벤트 ] ---
+
+    async def on_member_join(self, member: discord.Member):
+        self.put(member)
+
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        self.put(after)
+
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent):
+        self.remove(payload.guild_id, payload.user.id)
+
+
+class ChannelCache:
+    """
+    채널 조회 결과 캐시입니다.
+
+    봇 내부(gateway) 캐시를 먼저 확인하고, 없을 때만 REST API(fetch_channel)로 조회한 뒤 ttl초 동안 저장합니다.
+    존재하지 않는 채널도 negative_ttl초 동안 저장하여, 삭제된 채널로 알림을 보낼 때마다 요청이 발생하지 않도록 합니다.
+    """
+
+    def __init__(
+        self, ttl: float = CHANNEL_TTL, negative_ttl: float = CHANNEL_NEGATIVE_TTL
+    ):
+        """
+        :param ttl: 조회한 채널을 저장할 시간(초)
+        :param negative_ttl: 존재하지 않는 채널을 저장할 시간(초)
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        # 채널 id -> (만료 시간, 채널). 채널이 None이면 존재하지 않는 채널
+        self._entries: dict[int, tuple[float, discord.abc.Messageable | None]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self, channel_id: int = None):
+        """캐시된 채널을 삭제합니다. channel_id가 없으면 전체를 삭제합니다."""
+        if channel_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(channel_id, None)
+
+    async def fetch(
+        self, bot: commands.Bot, channel_id: int
+    ) -> discord.abc.Messageable | None:
+        """
+        채널을 찾습니다. 봇 내부 캐시 -> 이 캐시 -> REST API 순으로 조회합니다.
+
+        :param bot: 봇
+        :param channel_id: 채널 ID
+        :return: 채널. 존재하지 않는 채널이면 None
+        :raises discord.Forbidden: 채널에 접근할 권한이 없는 경우 (캐시하지 않음)
+        """
+        channel = bot.get_channel(channel_id)
+        if channel:
+            self.hits += 1
+            return channel
+
+        now = time.monotonic()
+        entry = self._entries.get(channel_id)
+        if entry and now < entry[0]:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        try:
+            channel = await bot.fetch_channel(channel_id)
+        except discord.NotFound:
+            self._entries[channel_id] = (now + self.negative_ttl, None)
+            return None
+        self._entries[channel_id] = (now + self.ttl, channel)
+        return channel
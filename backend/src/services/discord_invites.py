@@ -0,0 +1,190 @@
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable
+
+from discord.ext import commands
+
+# 미리 만들어둘 초대 링크 수
+INVITE_POOL_SIZE = 20
+# 초대 링크 유효 시간(초)
+INVITE_MAX_AGE = 86400
+# 만료까지 이 시간보다 적게 남은 초대 링크는 나눠주지 않고 새로 만듦 (메일을 늦게 확인하는 경우를 고려)
+INVITE_REFRESH_BEFORE = 6 * 3600
+# 초대 링크를 만들지 못했을 때 다시 시도하기까지 기다리는 시간(초)
+INVITE_RETRY_DELAY = 60
+
+# (max_age, max_uses)로 초대 링크를 만들어 url을 반환하는 함수
+CreateInvite = Callable[..., Awaitable[str]]
+
+
+class InvitePool:
+    """
+    1회용 초대 링크를 미리 만들어두는 pool입니다.
+
+    초대 메일을 보낼 때마다 초대 링크를 만들지 않고, 미리 만들어둔 링크를 꺼내 사용합니다.
+    꺼낸 링크는 기록하여 같은 링크를 두 번 나눠주지 않으며,
+    꺼낸 만큼의 링크와 만료가 가까운 링크는 background에서 다시 채웁니다.
+
+    Example:
+        >>> pool = InvitePool(discord_client.create_invite)
+        >>> pool.attach(bot)  # 혹은 이벤트 루프 안에서 pool.start()
+        >>> url = await pool.acquire()
+    """
+
+    def __init__(
+        self,
+        create: CreateInvite,
+        size: int = INVITE_POOL_SIZE,
+        max_age: int = INVITE_MAX_AGE,
+        refresh_before: int = INVITE_REFRESH_BEFORE,
+        concurrency: int = 3,
+    ):
+        """
+        :param create: 초대 링크를 만드는 함수 (Discord.create_invite)
+        :param size: 미리 만들어둘 초대 링크 수
+        :param max_age: 초대 링크 유효 시간(초)
+        :param refresh_before: 만료까지 이 시간보다 적게 남은 링크는 버림(초)
+        :param concurrency: 동시에 만들 초대 링크 수
+        """
+        self.create = create
+        self.size = size
+        self.max_age = max_age
+        self.refresh_before = refresh_before
+        self.concurrency = concurrency
+        # (만료 시간, url). 만들어진 순서이므로 만료 시간 순서와 같음
+        self._invites: deque[tuple[float, str]] = deque()
+        # 나눠준 url
+        self._issued: set[str] = set()
+        self._refill = asyncio.Event()
+        self._fill_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        """나눠줄 수 있는 초대 링크 수"""
+        self._drop_expiring()
+        return len(self._invites)
+
+    def _drop_expiring(self):
+        deadline = time.time() + self.refresh_before
+        while self._invites and self._invites[0][0] <= deadline:
+            self._invites.popleft()
+
+    async def _create_one(
+        self, semaphore: asyncio.Semaphore
+    ) -> tuple[float, str] | None:
+        async with semaphore:
+            try:
+                url = await self.create(max_age=self.max_age, max_uses=1)
+            except Exception as e:
+                print(f"Failed to create invite: {e}")
+                return None
+        return time.time() + self.max_age, url
+
+    async def fill(self, size: int = None) -> int:
+        """
+        나눠줄 수 있는 초대 링크가 size개가 되도록 채웁니다.
+
+        :param size: 채울 초대 링크 수 (기본값: pool 크기)
+        :return: 새로 만든 초대 링크 수
+        """
+        async with self._fill_lock:
+            self._drop_expiring()
+            missing = (size or self.size) - len(self._invites)
+            if missing <= 0:
+                return 0
+            semaphore = asyncio.Semaphore(self.concurrency)
+            created = await asyncio.gather(
+                *(self._create_one(semaphore) for _ in range(missing))
+            )
+            for invite in created:
+                if invite is not None and invite[1] not in self._issued:
+                    self._invites.append(invite)
+            return sum(invite is not None for invite in created)
+
+    def _take(self) -> str | None:
+        self._drop_expiring()
+        while self._invites:
+            _, url = self._invites.popleft()
+            if url not in self._issued:
+                self._issued.add(url)
+                return url
+        return None
+
+    async def acquire(self) -> str:
+        """
+        사용하지 않은 초대 링크를 하나 꺼냅니다. pool이 비어있다면 바로 만듭니다.
+
+        :return: 초대 링크 url
+        """
+        url = self._take()
+        if url is None:
+            await self.fill(1)
+            url = self._take()
+        self._refill.set()
+        if url is None:
+            raise Exception("초대 링크를 만들지 못했습니다.")
+        return url
+
+    async def acquire_many(self, count: int) -> list[str]:
+        """
+        초대 링크를 count개 꺼냅니다. 부족한 만큼은 동시에 만듭니다.
+
+        :param count: 꺼낼 초대 링크 수
+        :return: 초대 링크 url 목록
+        """
+        await self.fill(count)
+        urls = [url for url in (self._take() for _ in range(count)) if url]
+        self._refill.set()
+        if len(urls) < count:
+            urls += [await self.acquire() for _ in range(count - len(urls))]
+        return urls
+
+    def attach(self, bot: commands.Bot):
+        """
+        봇이 준비되면(on_ready) pool을 채우기 시작하도록 listener를 등록합니다.
+        초대 링크를 만들 채널 목록은 gateway에 연결된 뒤에 알 수 있으므로, 그 전에는 시작하지 않습니다.
+
+        :param bot: 이벤트를 받을 봇
+        """
+        bot.add_listener(self.on_ready, "on_ready")
+
+    async def on_ready(self):
+        self.start()
+
+    def start(self):
+        """background에서 pool을 채우는 작업을 시작합니다. 실행 중인 이벤트 루프에서 호출해야 합니다."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            self._refill.clear()
+            await self.fill()
+            # 가장 먼저 만료되는 링크를 버려야 할 때, 혹은 링크를 꺼내갔을 때 다시 채움
+            timeout = None
+            if self._invites:
+                timeout = max(
+                    0.0, self._invites[0][0] - self.refresh_before - time.time()
+                )
+            if len(self._invites) < self.size:
+                # 일부를 만들지 못했다면 잠시 후 다시 시도
+                timeout = min(
+                    INVITE_RETRY_DELAY if timeout is None else timeout,
+                    INVITE_RETRY_DELAY,
+                )
+            try:
+                # wait_for는 이벤트와 취소가 동시에 발생하면 취소를 무시할 수 있으므로 timeout을 사용
+                async with asyncio.timeout(timeout):
+                    await self._refill.wait()
+            except TimeoutError:
+                pass
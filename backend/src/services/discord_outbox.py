@@ -0,0 +1,155 @@
+import asyncio
+from typing import Awaitable, Callable
+
+import discord
+
+# Discord 메시지 하나에 담을 수 있는 최대 글자 수 / embed 수
+MAX_CONTENT_LENGTH = 2000
+MAX_EMBEDS = 10
+
+# 같은 채널의 알림을 모으는 시간(초)
+DEFAULT_BATCH_DELAY = 1.0
+
+# (채널 ID, 내용, embed 목록)으로 메시지 하나를 전송하는 함수
+SendFunc = Callable[[int, str | None, list[discord.Embed]], Awaitable[None]]
+
+
+def split_content(content: str) -> list[str]:
+    """MAX_CONTENT_LENGTH를 넘는 내용을 줄 단위로, 줄이 너무 길면 글자 수로 나눕니다."""
+    chunks, current = [], ""
+    for line in content.split("\n"):
+        while len(line) > MAX_CONTENT_LENGTH:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:MAX_CONTENT_LENGTH])
+            line = line[MAX_CONTENT_LENGTH:]
+        candidate = f"{current}\n{line}" if current else line
+        if len(candidate) > MAX_CONTENT_LENGTH:
+            chunks.append(current)
+            candidate = line
+        current = candidate
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def pack_messages(
+    items: list[tuple[str | None, discord.Embed | None]],
+) -> list[tuple[str | None, list[discord.Embed]]]:
+    """
+    알림 목록을 최소한의 메시지로 묶습니다.
+    알림의 순서를 유지하며, 메시지 하나는 MAX_CONTENT_LENGTH자와 MAX_EMBEDS개의 embed를 넘지 않습니다.
+
+    :param items: (내용, embed) 목록
+    :return: (내용, embed 목록) 목록
+    """
+    messages: list[tuple[str | None, list[discord.Embed]]] = []
+    content, embeds = "", []
+
+    def push():
+        nonlocal content, embeds
+        if content or embeds:
+            messages.append((content or None, embeds))
+        content, embeds = "", []
+
+    for text, embed in items:
+        for chunk in split_content(text) if text else []:
+            candidate = f"{content}\n{chunk}" if content else chunk
+            if len(candidate) > MAX_CONTENT_LENGTH:
+                push()
+                candidate = chunk
+            content = candidate
+        if embed is not None:
+            if len(embeds) >= MAX_EMBEDS:
+                push()
+            embeds.append(embed)
+    push()
+    return messages
+
+
+class OutboundQueue:
+    """
+    채널별로 알림을 모았다가 최소한의 메시지로 묶어 전송하는 큐입니다.
+
+    알림이 들어오면 delay초 뒤에 해당 채널의 알림을 한꺼번에 전송합니다.
+    그 사이에 같은 채널로 들어온 알림은 같은 메시지(최대 2000자, embed 10개)로 합쳐집니다.
+
+    Example:
+        >>> queue = OutboundQueue(send)
+        >>> queue.put(channel_id, "일정 알림 1")
+        >>> queue.put(channel_id, "일정 알림 2")
+        >>> await queue.flush()  # 메시지 하나로 전송
+    """
+
+    def __init__(self, send: SendFunc, delay: float = DEFAULT_BATCH_DELAY):
+        """
+        :param send: 메시지 하나를 전송하는 함수
+        :param delay: 같은 채널의 알림을 모으는 시간(초). 0이면 flush를 호출할 때만 전송합니다.
+        """
+        self.send = send
+        self.delay = delay
+        # 채널 ID -> (내용, embed) 목록
+        self._pending: dict[int, list[tuple[str | None, discord.Embed | None]]] = {}
+        self._timers: dict[int, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        """전송 대기 중인 알림 수"""
+        return sum(len(items) for items in self._pending.values())
+
+    def put(self, channel_id: int, content: str = None, embed: discord.Embed = None):
+        """
+        알림을 큐에 추가합니다.
+
+        :param channel_id: 채널 ID
+        :param content: 메시지 내용
+        :param embed: embed
+        """
+        if not content and embed is None:
+            return
+        self._pending.setdefault(channel_id, []).append((content, embed))
+        if self.delay and channel_id not in self._timers:
+            loop = asyncio.get_running_loop()
+            self._timers[channel_id] = loop.call_later(
+                self.delay, self._schedule_flush, channel_id
+            )
+
+    def _schedule_flush(self, channel_id: int):
+        self._timers.pop(channel_id, None)
+        task = asyncio.create_task(self.flush_channel(channel_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def flush_channel(self, channel_id: int) -> int:
+        """
+        채널의 대기 중인 알림을 전송합니다.
+
+        :param channel_id: 채널 ID
+        :return: 전송한 메시지 수
+        """
+        timer = self._timers.pop(channel_id, None)
+        if timer is not None:
+            timer.cancel()
+        items = self._pending.pop(channel_id, [])
+        sent = 0
+        for content, embeds in pack_messages(items):
+            try:
+                await self.send(channel_id, content, embeds)
+                sent += 1
+            except (ValueError, discord.HTTPException) as e:
+                print(f"Failed to send message to channel {channel_id}: {e}")
+        return sent
+
+    async def flush(self) -> int:
+        """
+        모든 채널의 대기 중인 알림을 전송합니다. 채널들은 동시에 전송됩니다.
+
+        :return: 전송한 메시지 수
+        """
+        results = await asyncio.gather(
+            *(self.flush_channel(channel_id) for channel_id in list(self._pending))
+        )
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+        return sum(results)
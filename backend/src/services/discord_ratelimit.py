@@ -0,0 +1,260 @@
+import asyncio
+import re
+import time
+
+import httpx
+
+from src.utils.ratelimit import TokenBucket, parse_retry_after
+
+# Discord는 봇 토큰 당 초당 50회의 전역 요청 한도가 있습니다.
+DISCORD_GLOBAL_RATE_LIMIT = 50.0
+
+# 이 리소스의 id는 route가 같아도 서로 다른 rate limit bucket을 사용합니다.
+MAJOR_PARAMETERS = frozenset({"channels", "guilds", "webhooks"})
+
+_API_PREFIX = re.compile(r"^/api(/v\d+)?")
+
+
+def route_key(method: str, url: str) -> tuple[str, str]:
+    """
+    요청의 route와 major parameter를 구합니다.
+    route는 id를 {id}로 치환한 경로이며, major parameter는 channel/guild/webhook id(와 webhook token)입니다.
+
+    :param method: HTTP method
+    :param url: 요청 url
+    :return: (route, major parameter)
+
+    Example:
+        >>> route_key("PATCH", "https://discord.com/api/v10/guilds/1/members/2")
+        ('PATCH /guilds/{id}/members/{id}', '1')
+    """
+    path = _API_PREFIX.sub("", httpx.URL(url).path)
+    parts = path.strip("/").split("/")
+    template, major = [], []
+    for i, part in enumerate(parts):
+        previous = parts[i - 1] if i > 0 else ""
+        if part.isdigit():
+            template.append("{id}")
+            if previous in MAJOR_PARAMETERS and not major:
+                major.append(part)
+        elif i >= 2 and parts[i - 2] == "webhooks" and major:
+            # webhook token도 major parameter에 포함됨
+            template.append("{token}")
+            major.append(part)
+        else:
+            template.append(part)
+    return f"{method.upper()} /{'/'.join(template)}", "/".join(major)
+
+
+class RateLimitBucket:
+    """
+    Discord rate limit bucket 하나입니다.
+    응답의 X-RateLimit-Remaining / X-RateLimit-Reset-After 헤더로 남은 요청 수와 초기화 시간을 추적하며,
+    남은 요청이 없으면 초기화될 때까지 요청을 도착한 순서대로 대기시킵니다.
+    """
+
+    def __init__(self, key: str):
+        """
+        :param key: bucket을 구분하는 key (bucket hash 혹은 route + major parameter)
+        """
+        self.key = key
+        self.limit: int | None = None
+        # 헤더를 받기 전에는 한도를 모르므로 한 번에 하나씩 보냄
+        self.remaining = 1
+        self.reset_at = 0.0
+        # rate limit 헤더가 없는 route라면 True
+        self.unlimited = False
+        # 대기 중인 요청 수 / 응답을 기다리는 요청 수
+        self.waiting = 0
+        self.in_flight = 0
+        self._lock = asyncio.Lock()
+        self._changed = asyncio.Event()
+
+    async def acquire(self):
+        """요청을 하나 보낼 수 있을 때까지 기다립니다."""
+        self.waiting += 1
+        try:
+            # lock을 잡은 채로 기다리므로, 대기 중인 요청은 도착한 순서대로 전송됨
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    if self.reset_at and now >= self.reset_at:
+                        self.remaining = max(self.remaining, self.limit or 1)
+                        self.reset_at = 0.0
+
+                    if self.unlimited or self.remaining > 0:
+                        self.remaining -= 1
+                        self.in_flight += 1
+                        return
+                    if self.reset_at:
+                        await asyncio.sleep(self.reset_at - now)
+                        continue
+                    # 한도를 모르는 상태이므로 먼저 보낸 요청의 응답을 기다림
+                    self._changed.clear()
+                    await self._changed.wait()
+        finally:
+            self.waiting -= 1
+
+    def update(self, headers: httpx.Headers):
+        """
+        응답 헤더로 bucket 상태를 갱신합니다.
+
+        :param headers: 응답 헤더
+        """
+        self.in_flight = max(0, self.in_flight - 1)
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_after = headers.get("X-RateLimit-Reset-After")
+        if remaining is None or reset_after is None:
+            self.unlimited = True
+        else:
+            self.unlimited = False
+            self.limit = int(headers.get("X-RateLimit-Limit", remaining))
+            # 아직 응답을 받지 못한 요청도 한도를 사용하고 있으므로 제외함
+            self.remaining = max(0, int(remaining) - self.in_flight)
+            self.reset_at = time.monotonic() + float(reset_after)
+        self._changed.set()
+
+    def release(self):
+        """응답을 받지 못한 요청의 한도를 돌려줍니다."""
+        self.in_flight = max(0, self.in_flight - 1)
+        self.remaining += 1
+        self._changed.set()
+
+    def block(self, seconds: float):
+        """seconds 동안 이 bucket의 요청을 멈춥니다."""
+        self.unlimited = False
+        self.remaining = 0
+        self.reset_at = max(self.reset_at, time.monotonic() + seconds)
+        self._changed.set()
+
+
+class DiscordRateLimiter:
+    """
+    Discord REST API 요청을 rate limit bucket별로 조절하여 보내는 스케줄러입니다.
+
+    - 요청은 route마다 X-RateLimit-Bucket 헤더로 알려진 bucket의 큐에서 대기하며,
+      남은 요청 수가 없으면 X-RateLimit-Reset-After 만큼 정확히 기다린 뒤 전송됩니다.
+    - 모든 요청은 전역 한도(초당 50회)를 넘지 않도록 전송되며, 전역 429를 받으면 모든 요청을 멈춥니다.
+    - 429 응답은 실패로 처리하지 않고 retry_after 만큼 기다린 뒤 재시도합니다.
+
+    Example:
+        >>> limiter = DiscordRateLimiter(httpx_client)
+        >>> response = await limiter.request("GET", f"{url}/v10/users/@me")
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        global_rate: float = DISCORD_GLOBAL_RATE_LIMIT,
+        max_retries: int = 5,
+    ):
+        """
+        :param client: 요청을 보낼 httpx 클라이언트
+        :param global_rate: 초당 최대 요청 수
+        :param max_retries: 429 응답의 최대 재시도 횟수
+        """
+        self.client = client
+        self.global_bucket = TokenBucket(global_rate)
+        self.max_retries = max_retries
+        # route -> bucket hash
+        self._hashes: dict[str, str] = {}
+        # bucket key -> bucket
+        self._buckets: dict[str, RateLimitBucket] = {}
+
+    def _unique_buckets(self) -> list[RateLimitBucket]:
+        # hash를 알기 전의 route key와 hash key가 같은 bucket을 가리킬 수 있음
+        return list({id(bucket): bucket for bucket in self._buckets.values()}.values())
+
+    @property
+    def queue_depth(self) -> int:
+        """모든 bucket에서 대기 중인 요청 수"""
+        return sum(bucket.waiting for bucket in self._unique_buckets())
+
+    def queue_depths(self) -> dict[str, int]:
+        """bucket별 대기 중인 요청 수 (대기 중인 요청이 있는 bucket만)"""
+        return {
+            bucket.key: bucket.waiting
+            for bucket in self._unique_buckets()
+            if bucket.waiting
+        }
+
+    def _bucket_key(self, route: str, major: str) -> str:
+        return f"{self._hashes.get(route, route)}:{major}"
+
+    def _get_bucket(self, route: str, major: str) -> RateLimitBucket:
+        key = self._bucket_key(route, major)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = RateLimitBucket(key)
+        return bucket
+
+    def _learn_hash(
+        self, route: str, major: str, bucket: RateLimitBucket, headers: httpx.Headers
+    ):
+        """응답으로 알게 된 bucket hash를 route에 연결합니다. 같은 hash를 쓰는 route는 같은 bucket을 공유합니다."""
+        bucket_hash = headers.get("X-RateLimit-Bucket")
+        if not bucket_hash:
+            return
+        self._hashes[route] = bucket_hash
+        key = self._bucket_key(route, major)
+        # route key로 대기 중인 요청과 이후 hash key로 들어오는 요청이 같은 bucket을 사용하도록 함
+        if key not in self._buckets:
+            bucket.key = key
+            self._buckets[key] = bucket
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        요청을 보내고 응답을 반환합니다. 429 응답은 기다린 뒤 재시도하며,
+        재시도 횟수를 넘으면 마지막 429 응답을 반환합니다.
+
+        :param method: HTTP method
+        :param url: 요청 url
+        :param kwargs: httpx.AsyncClient.request에 그대로 전달할 인자
+        :return: 응답
+        :rtype: httpx.Response
+        """
+        route, major = route_key(method, url)
+        attempt = 0
+        while True:
+            bucket = self._get_bucket(route, major)
+            await bucket.acquire()
+            try:
+                # 전역 한도를 기다리는 중에 취소되어도 route bucket의 한도를 돌려주어야 함
+                await self.global_bucket.acquire()
+                response = await self.client.request(method, url, **kwargs)
+            except BaseException:
+                bucket.release()
+                raise
+
+            bucket.update(response.headers)
+            self._learn_hash(route, major, bucket, response.headers)
+            if response.status_code != 429 or attempt >= self.max_retries:
+                return response
+
+            retry_after = self._retry_after(response)
+            if response.headers.get("X-RateLimit-Global") or self._is_global(response):
+                print(f"Discord API 전역 요청 제한 - {retry_after:.2f}초 후 재시도")
+                self.global_bucket.block(retry_after)
+            else:
+                print(
+                    f"Discord API 요청 제한 ({route}) - {retry_after:.2f}초 후 재시도"
+                )
+                bucket.block(retry_after)
+            attempt += 1
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> float:
+        try:
+            retry_after = response.json().get("retry_after")
+        except ValueError:
+            retry_after = None
+        if retry_after is None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        return float(retry_after) if retry_after is not None else 1.0
+
+    @staticmethod
+    def _is_global(response: httpx.Response) -> bool:
+        try:
+            return bool(response.json().get("global"))
+        except ValueError:
+            return False
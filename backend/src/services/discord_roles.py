@@ -0,0 +1,50 @@
+from typing import Iterable, TYPE_CHECKING
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from src.models.user import User
+
+
+class RoleSyncResult(BaseModel):
+    """멤버 한 명에 대한 역할 동기화 결과"""
+
+    user_id: int
+    ok: bool
+    # 부여한 역할 id 목록
+    added: list[int] = []
+    # 회수한 역할 id 목록
+    removed: list[int] = []
+    # 변경할 역할이 없어 요청을 보내지 않았다면 True
+    unchanged: bool = False
+    error: str = ""
+
+
+def desired_roles(users: Iterable["User"]) -> dict[int, set[int]]:
+    """
+    사용자가 속한 그룹으로부터 멤버별로 가져야 하는 역할 목록을 구합니다.
+    디스코드 계정이 연결되지 않은 사용자와 역할이 없는 그룹은 제외합니다.
+
+    :param users: groups가 로드된 User 목록
+    :return: 디스코드 사용자 ID -> 역할 ID 목록
+    """
+    return {
+        user.discord_id: {g.discord_id for g in user.groups if g.discord_id}
+        for user in users
+        if user.discord_id
+    }
+
+
+def plan_roles(
+    current: set[int], desired: set[int], managed: set[int]
+) -> tuple[set[int], set[int]]:
+    """
+    멤버의 현재 역할과 가져야 하는 역할을 비교합니다.
+    managed에 포함되지 않은 역할(관리자 역할 등)은 건드리지 않습니다.
+
+    :param current: 멤버의 현재 역할 ID 목록
+    :param desired: 멤버가 가져야 하는 역할 ID 목록
+    :param managed: 동기화 대상 역할 ID 목록
+    :return: (부여할 역할, 회수할 역할)
+    """
+    return desired - current, (current & managed) - desired
@@ -1,17 +1,47 @@
+import asyncio
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
-from src.services.discord import discord_client
-from src.utils.env import get_env
+from src.utils.env import get_env, get_env_async
+
+# 여러 명에게 메일을 보낼 때 동시에 여는 SMTP 연결 수
+MAIL_CONCURRENCY = 4
 
 def send_test_mail(to_email:str):
     send_gmail(to_email, "CIS 테스트 메일입니다.", "메일이 성공적으로 전송되었습니다.")
 
-async def send_invite_mail(to_email:str):
-    invite_url = await discord_client.create_invite()
-    invite_title = "[CIS] Discord Invitation"
-    invite_content = f"""
+async def get_gmail_credentials() -> tuple[str, str]:
+    """
+    메일 전송에 사용할 Gmail 계정과 앱 비밀번호를 이벤트 루프를 막지 않고 가져옵니다.
+
+    :return: (GMAIL_USER, GMAIL_PASSWORD)
+    """
+    return await get_env_async("GMAIL_USER"), await get_env_async("GMAIL_PASSWORD")
+
+async def send_invite_mail(to_email:str, invite_url:str=None, credentials:tuple[str, str]=None):
+    """
+    디스코드 초대 메일을 전송합니다.
+    초대 링크는 미리 만들어둔 pool에서 꺼내 사용합니다.
+    SMTP 전송은 blocking이므로 별도 thread에서 실행합니다.
+
+    :param to_email: 받는 사람 이메일
+    :param invite_url: 초대 링크. None이면 pool에서 꺼냄
+    :param credentials: (Gmail 계정, 앱 비밀번호). None이면 설정에서 읽음
+    """
+    # discord 패키지는 import가 느리므로, 초대 메일을 보낼 때만 import
+    from src.services.discord import get_discord_client
+
+    invite_url = invite_url or await get_discord_client().invites.acquire()
+    credentials = credentials or await get_gmail_credentials()
+    await asyncio.to_thread(
+        send_gmail, to_email, "[CIS] Discord Invitation", invite_content(invite_url), "html", credentials
+    )
+
+
+def invite_content(invite_url:str) -> str:
+    """초대 링크를 담은 초대 메일 본문(html)을 만듭니다."""
+    return f"""
     <html>
         <body style="font-family: Arial, sans-serif; color: #333;">
             <div style="max-width: 600px; margin: 0 auto; padding: 20px; border: 1px solid #ddd; border-radius: 10px;">
@@ -35,16 +65,37 @@ async def send_invite_mail(to_email:str):
         </body>
     </html>
     """
-    send_gmail(to_email, subject=invite_title, content=invite_content, subtype="html")
 
 
-def send_gmail(to_email:str, subject:str, content:str, subtype:str="plain"):
+async def send_invite_mails(to_emails:list[str]):
+    """
+    여러 명에게 디스코드 초대 메일을 전송합니다.
+    필요한 초대 링크를 한 번에 꺼내므로, 메일 전송이 초대 링크 생성을 기다리지 않습니다.
+    계정 정보는 한 번만 읽고, 메일은 최대 MAIL_CONCURRENCY개씩 별도 thread에서 동시에 전송합니다.
+    """
+    from src.services.discord import get_discord_client
+
+    invite_urls = await get_discord_client().invites.acquire_many(len(to_emails))
+    credentials = await get_gmail_credentials()
+    semaphore = asyncio.Semaphore(MAIL_CONCURRENCY)
+
+    async def send(to_email:str, invite_url:str):
+        async with semaphore:
+            await send_invite_mail(to_email, invite_url, credentials)
+
+    await asyncio.gather(*(send(to_email, invite_url) for to_email, invite_url in zip(to_emails, invite_urls)))
+
+
+def send_gmail(to_email:str, subject:str, content:str, subtype:str="plain", credentials:tuple[str, str]=None):
     """
     이메일을 전송합니다. 
     subtype은 html 혹은 plain이어야 합니다.
+    SMTP 연결과 설정 조회가 blocking이므로, async 함수에서는 asyncio.to_thread로 실행하십시오.
+    credentials가 없으면 설정에서 Gmail 계정과 앱 비밀번호를 읽습니다.
     """
-    GOOGLE_EMAIL = get_env("GMAIL_USER")
-    GOOGLE_APP_PASSWORD = get_env("GMAIL_PASSWORD")
+    if credentials is None:
+        credentials = get_env("GMAIL_USER"), get_env("GMAIL_PASSWORD")
+    GOOGLE_EMAIL, GOOGLE_APP_PASSWORD = credentials
 
     msg = MIMEMultipart()
     msg['From'] = GOOGLE_EMAIL
@@ -53,6 +104,7 @@ def send_gmail(to_email:str, subject:str, content:str, subtype:str="plain"):
 
     msg.attach(MIMEText(content, subtype))
 
+    server = None
     try:
         # 3. SMTP 서버 연결 (Gmail)
         smtp_server = "smtp.gmail.com"
@@ -73,7 +125,8 @@ def send_gmail(to_email:str, subject:str, content:str, subtype:str="plain"):
         
     finally:
         # 연결 종료
-        server.quit()
+        if server is not None:
+            server.quit()
 
 # --- 실행 테스트 ---
 if __name__ == "__main__":
@@ -0,0 +1,177 @@
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+from src.services.notion.schema import PropType, prop_types
+from src.utils.constants import ROLE_BY_TEXT, SYNC_BY_TEXT, Role, Sync
+
+# --- [ 속성 타입별 추출 함수 ] ---
+# Notion API의 속성 객체(prop)에서 값을 꺼냅니다. 속성이 없거나 비어있으면 빈 값을 반환합니다.
+
+
+def _text(key: str) -> Callable[[dict | None], str]:
+    def get(prop: dict | None) -> str:
+        items = prop.get(key) if prop else None
+        return items[0].get("plain_text", "") if items else ""
+
+    return get
+
+
+def _value(key: str) -> Callable[[dict | None], str]:
+    def get(prop: dict | None) -> str:
+        return (prop.get(key) if prop else None) or ""
+
+    return get
+
+
+def _select(prop: dict | None) -> str | None:
+    select = prop.get("select") if prop else None
+    return select.get("name") if select else None
+
+
+def _relation(prop: dict | None) -> list[str]:
+    relation = prop.get("relation") if prop else None
+    return [r.get("id", "") for r in relation] if relation else []
+
+
+def _date(prop: dict | None) -> tuple[str, str]:
+    date = prop.get("date") if prop else None
+    if not date:
+        return "", ""
+    return date.get("start") or "", date.get("end") or ""
+
+
+GETTERS: dict[PropType, Callable[[dict | None], Any]] = {
+    PropType.title: _text("title"),
+    PropType.rich_text: _text("rich_text"),
+    PropType.email: _value("email"),
+    PropType.phone_number: _value("phone_number"),
+    PropType.select: _select,
+    PropType.relation: _relation,
+    PropType.date: _date,
+}
+
+
+# --- [ record 필드 타입별 변환 함수 ] ---
+# 추출한 값을 record 필드 타입으로 변환합니다. 기존 extract의 기본값 규칙을 그대로 따릅니다.
+# 없는 Sync Status는 text_to_sync가 ValueError를 발생시키고, 없는 Role은 Guest로 취급합니다.
+
+
+def _to_int(value: str) -> int:
+    return int(value) if value else 0
+
+
+def _to_sync(value: str | None) -> Sync:
+    if not value:
+        return Sync.Writing
+    return SYNC_BY_TEXT.get(value) or Sync.text_to_sync(value)
+
+
+def _to_role(value: str | None) -> Role:
+    return ROLE_BY_TEXT.get(value, Role.Guest) if value else Role.Guest
+
+
+CONVERTERS: dict[Any, Callable[[Any], Any]] = {
+    int: _to_int,
+    Sync: _to_sync,
+    Role: _to_role,
+}
+
+
+class RecordDecoder:
+    """
+    Notion data source의 행을 record로 변환하는 decoder입니다.
+
+    record 클래스의 PROPERTIES(속성 이름 -> 필드 이름)와 CONDITION(data source 스키마)으로부터
+    (속성 이름, 추출 함수, 변환 함수, 필드 이름) 목록을 한 번만 만들고, 모든 행에 같은 목록을 적용합니다.
+    스키마에서 채우지 않는 필드는 pydantic 기본값을 사용합니다.
+    """
+
+    def __init__(self, record_type: type[BaseModel]):
+        """
+        :param record_type: 변환 결과 record 클래스. PROPERTIES와 CONDITION을 정의해야 합니다.
+        :type record_type: type[BaseModel]
+        """
+        self.record_type = record_type
+        self.plan = self._plan(record_type)
+
+    @staticmethod
+    def _plan(record_type: type[BaseModel]) -> list[tuple]:
+        """
+        record 타입의 속성마다 값을 꺼내 필드에 넣는 방법을 정합니다.
+
+        :param record_type: record 클래스
+        :type record_type: type[BaseModel]
+        :return: (속성 이름, 추출 함수, 변환 함수 혹은 None, 필드 이름 튜플, 나눠 담을지 여부) 목록
+        """
+        types = prop_types(record_type.CONDITION)
+        fields = record_type.model_fields
+        plan = []
+        for prop_name, targets in record_type.PROPERTIES.items():
+            if isinstance(targets, str):
+                targets = (targets,)
+            prop_type = types[prop_name]
+            # date 속성은 (start, end) 두 필드로 나눠 담고, 나머지는 같은 값을 여러 필드에 넣을 수 있음
+            split = prop_type == PropType.date
+            converter = None if split else CONVERTERS.get(fields[targets[0]].annotation)
+            plan.append((prop_name, GETTERS[prop_type], converter, targets, split))
+        return plan
+
+    def extract(self, row: dict) -> dict:
+        """
+        행 하나를 record 생성을 위한 dict로 변환합니다.
+
+        :param row: Data source query의 결과물 record
+        :type row: dict
+        :raises ValueError: Sync Status, Student ID 등의 값이 올바르지 않은 경우
+        """
+        properties = row.get("properties") or {}
+        data = {
+            "notion_id": row.get("id", ""),
+            "last_edited_time": row.get("last_edited_time", ""),
+        }
+        for prop_name, get, converter, targets, split in self.plan:
+            value = get(properties.get(prop_name))
+            if split:
+                data[targets[0]], data[targets[1]] = value
+                continue
+            if converter is not None:
+                value = converter(value)
+            for target in targets:
+                data[target] = value
+        return data
+
+    def decode(self, row: dict) -> BaseModel:
+        """
+        행 하나를 record로 변환합니다.
+
+        :param row: Data source query의 결과물 record
+        :type row: dict
+        """
+        return self.record_type.model_validate(self.extract(row))
+
+    def decode_results(self, data: dict) -> list[BaseModel]:
+        """
+        data source query 응답 한 페이지를 record 리스트로 변환합니다.
+
+        :param data: notion data_source query 결과
+        :type data: dict
+        """
+        return [self.decode(row) for row in data.get("results", [])]
+
+
+_decoders: dict[type, RecordDecoder] = {}
+
+
+def get_decoder(record_type: type[BaseModel]) -> RecordDecoder:
+    """
+    record 클래스의 decoder를 반환합니다. decoder는 처음 요청될 때 한 번만 생성됩니다.
+
+    :param record_type: record 클래스
+    :type record_type: type[BaseModel]
+    :rtype: RecordDecoder
+    """
+    decoder = _decoders.get(record_type)
+    if decoder is None:
+        decoder = _decoders[record_type] = RecordDecoder(record_type)
+    return decoder
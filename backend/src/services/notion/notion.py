@@ -1,201 +1,157 @@
+import asyncio
+import inspect
+import time
 import httpx
 from enum import Enum
+from typing import AsyncIterator, Callable, ClassVar, Self
 from pydantic import BaseModel, Field, model_validator
 
-from src.services.notion.schema import PropType
-from src.utils.env import get_env
+from src.services.notion.scheduler import RequestScheduler
+from src.services.notion.decoder import get_decoder
+from src.services.notion.query import (
+    LAST_EDITED_TIME,
+    Prop,
+    Query,
+    sync_status_in,
+)
+from src.services.notion.schema import (
+    EventCondition,
+    GroupCondition,
+    MemberCondition,
+    PropType,
+    prop_types,
+)
+from src.utils.env import get_env, get_env_async
 from src.utils.constants import Sync, Role
 
 
 class NotionRecord(BaseModel):
+    # Notion 속성 이름 -> record 필드 이름. 튜플이면 같은 값을 여러 필드에 넣습니다.
+    # date 속성은 (start 필드, end 필드)로 나뉩니다.
+    PROPERTIES: ClassVar[dict[str, str | tuple[str, ...]]] = {}
+    # data source 스키마 (services/notion/schema.py)
+    CONDITION: ClassVar[Callable[[], dict]]
+
     status: Sync
     notion_id: str
     log: str
-
-
-class MemberRecord(NotionRecord):
-    name: str = ""
-    student_id: int = 0
-    email: str = ""
-    role: Role = Role.Guest
-    groups: list[str] = Field(default_factory=list)
-    phone: str = ""
-    discord_id: str = ""
+    # 행이 마지막으로 수정된 시간 (ISO 8601). 증분 동기화의 기준점으로 사용됨
+    last_edited_time: str = ""
 
     @model_validator(mode="before")
     @classmethod
-    def transform(cls, data: dict) -> list["MemberRecord"]:
-        """API로 받은 member database의 record를 단순화합니다.
+    def transform(cls, data: dict) -> dict:
+        """API로 받은 data source의 행(page 객체)을 단순화합니다.
+        이미 단순화된 dict가 들어오면 그대로 통과시킵니다.
 
         Args:
-            data (dict): notion data_source query 결과
+            data (dict): notion data_source query 결과의 행 하나
 
         Returns:
-            list[MemberRecord]: 변환된 MemberRecord 리스트
+            dict: record 생성을 위한 데이터
         """
-        results = data.get("results", [])
-        return [cls.extract(result) for result in results]
+        if isinstance(data, dict) and "properties" in data:
+            return cls.extract(data)
+        return data
 
-    @staticmethod
-    def extract(row: dict) -> dict:
-        """Data_source의 행을 NotionRecord 타입으로 변경합니다.
+    @classmethod
+    def extract(cls, row: dict) -> dict:
+        """Data_source의 행을 record 생성을 위한 dict로 변경합니다.
+        스키마로부터 한 번만 만들어진 decoder를 사용합니다.
 
         Args:
             row (dict): Data source query의 결과물 record
 
         Raises:
-            NotionDBInvalidPropError: 필수 속성이 없거나 형식이 잘못된 경우
+            ValueError: Sync Status, Student ID 등의 값이 올바르지 않은 경우
 
         Returns:
-            dict: MemberRecord 생성을 위한 데이터
+            dict: record 생성을 위한 데이터
         """
-        properties = row.get("properties", {})
+        return get_decoder(cls).extract(row)
 
-        # Sync Status 추출
-        sync_status_prop = properties.get("Sync Status", {})
-        sync_select = sync_status_prop.get("select")
-        status = (
-            Sync.text_to_sync(sync_select.get("name")) if sync_select else Sync.Writing
-        )
-
-        # Name 추출
-        name_prop = properties.get("Name", {})
-        title_list = name_prop.get("title", [])
-        name = title_list[0].get("plain_text", "") if title_list else ""
-
-        # Student ID 추출
-        student_id_prop = properties.get("Student ID", {})
-        student_id_list = student_id_prop.get("rich_text", [])
-        student_id = (
-            int(student_id_list[0].get("plain_text", "0")) if student_id_list else 0
-        )
+    @classmethod
+    def prop(cls, name: str) -> Prop:
+        """스키마에 정의된 속성 타입으로 filter / 정렬 조건을 만들 수 있는 속성을 반환합니다.
 
-        # Email 추출
-        email_prop = properties.get("Email", {})
-        email = email_prop.get("email", "")
+        Example:
+            >>> MemberRecord.prop("Role").equals(Role.Admin.value)
 
-        # Role 추출
-        role_prop = properties.get("Role", {})
-        role_select = role_prop.get("select")
-        try:
-            role = (
-                Role.text_to_role(role_select.get("name"))
-                if role_select
-                else Role.Guest
-            )
-        except ValueError:
-            role = Role.Guest
-
-        # Groups 추출
-        groups_prop = properties.get("Groups", {})
-        groups_relation = groups_prop.get("relation", [])
-        groups = [g.get("id", "") for g in groups_relation]
-
-        # Phone 추출
-        phone_prop = properties.get("Phone", {})
-        phone = phone_prop.get("phone_number", "") or ""
-
-        # Notion ID
-        notion_id = row.get("id", "")
-
-        # Discord ID 추출
-        discord_id_prop = properties.get("Discord ID", {})
-        discord_id_list = discord_id_prop.get("rich_text", [])
-        discord_id = discord_id_list[0].get("plain_text", "") if discord_id_list else ""
-
-        # Log 추출
-        log_prop = properties.get("Log", {})
-        log_list = log_prop.get("rich_text", [])
-        log = log_list[0].get("plain_text", "") if log_list else ""
-
-        return {
-            "status": status,
-            "name": name,
-            "student_id": student_id,
-            "email": email,
-            "role": role,
-            "groups": groups,
-            "phone": phone,
-            "notion_id": notion_id,
-            "discord_id": discord_id,
-            "log": log,
-        }
+        Args:
+            name (str): Notion 속성 이름
 
+        Raises:
+            KeyError: 스키마에 없는 속성인 경우
 
-class GroupRecord(NotionRecord):
-    name: str = ""
-    description: str = ""
+        Returns:
+            Prop: 속성
+        """
+        return Prop(name, prop_types(cls.CONDITION)[name])
 
-    @model_validator(mode="before")
     @classmethod
-    def transform(cls, data: dict) -> list["GroupRecord"]:
-        """API로 받은 group database의 record를 단순화합니다.
+    def from_results(cls, data: dict) -> list[Self]:
+        """data source query 응답 한 페이지를 record 리스트로 변환합니다.
 
         Args:
             data (dict): notion data_source query 결과
 
         Returns:
-            list[GroupRecord]: 변환된 GroupRecord 리스트
+            list[Self]: 변환된 record 리스트
         """
-        results = data.get("results", [])
-        return [cls.extract(result) for result in results]
+        return get_decoder(cls).decode_results(data)
 
-    @staticmethod
-    def extract(row: dict) -> dict:
-        """Data_source의 행을 GroupRecord 타입으로 변경합니다.
 
-        Args:
-            row (dict): Data source query의 결과물 record
-
-        Returns:
-            dict: GroupRecord 생성을 위한 데이터
-        """
-        properties = row.get("properties", {})
-
-        # Sync Status 추출
-        sync_status_prop = properties.get("Sync Status", {})
-        sync_select = sync_status_prop.get("select")
-        status = (
-            Sync.text_to_sync(sync_select.get("name")) if sync_select else Sync.Writing
-        )
+class MemberRecord(NotionRecord):
+    PROPERTIES = {
+        "Sync Status": "status",
+        "Name": "name",
+        "Student ID": "student_id",
+        "Email": "email",
+        "Role": "role",
+        "Groups": "groups",
+        "Phone": "phone",
+        "Discord ID": "discord_id",
+        "Log": "log",
+    }
+    CONDITION = MemberCondition
 
-        # Name 추출
-        name_prop = properties.get("Name", {})
-        title_list = name_prop.get("title", [])
-        name = title_list[0].get("plain_text", "") if title_list else ""
-
-        # Description 추출
-        desc_prop = properties.get("Description", {})
-        desc_list = desc_prop.get("rich_text", [])
-        description = desc_list[0].get("plain_text", "") if desc_list else ""
-
-        # Discord Role ID 추출
-        discord_role_prop = properties.get("Discord Role ID", {})
-        discord_role_list = discord_role_prop.get("rich_text", [])
-        discord_role_id = (
-            discord_role_list[0].get("plain_text", "") if discord_role_list else ""
-        )
+    name: str = ""
+    student_id: int = 0
+    email: str = ""
+    role: Role = Role.Guest
+    groups: list[str] = Field(default_factory=list)
+    phone: str = ""
+    discord_id: str = ""
 
-        # Log 추출
-        log_prop = properties.get("Log", {})
-        log_list = log_prop.get("rich_text", [])
-        log = log_list[0].get("plain_text", "") if log_list else ""
 
-        # Notion ID
-        notion_id = row.get("id", "")
+class GroupRecord(NotionRecord):
+    PROPERTIES = {
+        "Sync Status": "status",
+        "Name": "name",
+        "Description": "description",
+        "Discord Role ID": "discord_role_id",
+        "Log": "log",
+    }
+    CONDITION = GroupCondition
 
-        return {
-            "status": status,
-            "name": name,
-            "notion_id": notion_id,
-            "discord_id": discord_role_id,
-            "log": log,
-            "description": description,
-            "discord_role_id": discord_role_id,
-        }
+    name: str = ""
+    description: str = ""
+    discord_role_id: str = ""
 
 
 class EventRecord(NotionRecord):
+    PROPERTIES = {
+        "Sync Status": "status",
+        "Title": ("title", "name"),  # Title을 name으로도 매핑
+        "Date": ("date_start", "date_end"),
+        "Groups": "groups",
+        "Attendees": "attendees",
+        "Location": "location",
+        "Description": "description",
+        "Log": "log",
+    }
+    CONDITION = EventCondition
+
     name: str = ""
     title: str = ""
     date_start: str = ""
@@ -205,110 +161,70 @@ class EventRecord(NotionRecord):
     attendees: list[str] = Field(default_factory=list)
     groups: list[str] = Field(default_factory=list)
 
-    @model_validator(mode="before")
-    @classmethod
-    def transform(cls, data: dict) -> list["EventRecord"]:
-        """API로 받은 event database의 record를 단순화합니다.
 
-        Args:
-            data (dict): notion data_source query 결과
+# data source query 한 번에 가져올 수 있는 최대 행 수
+MAX_PAGE_SIZE = 100
+# Notion이 query 결과의 relation 속성에 담아주는 최대 항목 수. 넘는 경우 has_more가 표시됨
+RELATION_LIMIT = 25
 
-        Returns:
-            list[EventRecord]: 변환된 EventRecord 리스트
-        """
-        results = data.get("results", [])
-        return [cls.extract(result) for result in results]
 
-    @staticmethod
-    def extract(row: dict) -> dict:
-        """Data_source의 행을 EventRecord 타입으로 변경합니다.
+class DatabaseType(Enum):
+    """Notion 데이터베이스 타입"""
 
-        Args:
-            row (dict): Data source query의 결과물 record
+    MEMBER = "member"
+    EVENT = "event"
+    GROUP = "group"
 
-        Returns:
-            dict: EventRecord 생성을 위한 데이터
-        """
-        properties = row.get("properties", {})
 
-        # Sync Status 추출
-        sync_status_prop = properties.get("Sync Status", {})
-        sync_select = sync_status_prop.get("select")
-        status = (
-            Sync.text_to_sync(sync_select.get("name")) if sync_select else Sync.Writing
-        )
+# 데이터베이스 타입별 record 클래스
+RECORD_TYPES: dict[DatabaseType, type[NotionRecord]] = {
+    DatabaseType.MEMBER: MemberRecord,
+    DatabaseType.GROUP: GroupRecord,
+    DatabaseType.EVENT: EventRecord,
+}
 
-        # Title 추출
-        title_prop = properties.get("Title", {})
-        title_list = title_prop.get("title", [])
-        title = title_list[0].get("plain_text", "") if title_list else ""
-
-        # Date 추출
-        date_prop = properties.get("Date", {})
-        date_obj = date_prop.get("date")
-        date_start = date_obj.get("start", "") if date_obj else ""
-        date_end = date_obj.get("end", "") if date_obj else ""
-
-        # Groups 추출
-        groups_prop = properties.get("Groups", {})
-        groups_relation = groups_prop.get("relation", [])
-        groups = [g.get("id", "") for g in groups_relation]
-
-        # Attendees 추출
-        attendees_prop = properties.get("Attendees", {})
-        attendees_relation = attendees_prop.get("relation", [])
-        attendees = [a.get("id", "") for a in attendees_relation]
-
-        # Location 추출
-        location_prop = properties.get("Location", {})
-        location_list = location_prop.get("rich_text", [])
-        location = location_list[0].get("plain_text", "") if location_list else ""
-
-        # Description 추출
-        desc_prop = properties.get("Description", {})
-        desc_list = desc_prop.get("rich_text", [])
-        description = desc_list[0].get("plain_text", "") if desc_list else ""
-
-        # Log 추출
-        log_prop = properties.get("Log", {})
-        log_list = log_prop.get("rich_text", [])
-        log = log_list[0].get("plain_text", "") if log_list else ""
-
-        # Notion ID
-        notion_id = row.get("id", "")
-
-        return {
-            "status": status,
-            "name": title,  # Title을 name으로 매핑
-            "groups": groups,
-            "notion_id": notion_id,
-            "log": log,
-            "title": title,
-            "date_start": date_start,
-            "date_end": date_end,
-            "location": location,
-            "description": description,
-            "attendees": attendees,
-        }
 
+# 데이터베이스 타입별 데이터베이스 id 설정 key
+DB_ID_KEYS: dict[DatabaseType, str] = {
+    DatabaseType.MEMBER: "NOTION_MEMBER_DB_ID",
+    DatabaseType.GROUP: "NOTION_GROUP_DB_ID",
+    DatabaseType.EVENT: "NOTION_EVENT_DB_ID",
+}
 
-class DatabaseType(Enum):
-    """Notion 데이터베이스 타입"""
+# 데이터베이스 타입별 data source id가 저장되는 Notion 속성 이름
+SOURCE_ATTRS: dict[DatabaseType, str] = {
+    DatabaseType.MEMBER: "member_source",
+    DatabaseType.GROUP: "group_source",
+    DatabaseType.EVENT: "event_source",
+}
 
-    MEMBER = "member"
-    EVENT = "event"
-    GROUP = "group"
+# 데이터베이스 타입별 스키마 조건
+CONDITIONS: dict[DatabaseType, Callable[[], dict]] = {
+    DatabaseType.MEMBER: MemberCondition,
+    DatabaseType.GROUP: GroupCondition,
+    DatabaseType.EVENT: EventCondition,
+}
+
+# data source 스키마 캐시 유지 시간(초)
+SCHEMA_TTL = 300
+
+# query 응답에 포함할 속성을 지정하는 query parameter 이름
+FILTER_PROPERTIES_PARAM = "filter_properties"
 
 
 class Notion:
     """
     Notion API 요청을 위한 싱글톤 패턴의 클래스입니다.
-    이 파일의 notion_client를 import하여 다른 파일에서 사용하십시오.
+    이 파일의 get_notion_client()로 다른 파일에서 사용하십시오.
     """
 
-    def __init__(self):
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None):
+        """
+        Args:
+            transport (httpx.AsyncBaseTransport | None): 요청을 보낼 transport. None이면 실제 Notion API로 보냅니다.
+        """
         self.base_url = "https://api.notion.com/v1"
-        self.client = httpx.AsyncClient()
+        self.client = httpx.AsyncClient(transport=transport)
         self.client.headers.update(
             {
                 "Content-Type": "application/json",
@@ -316,9 +232,18 @@ class Notion:
                 "Notion-Version": "2025-09-03",
             }
         )
+        # 모든 요청은 scheduler를 거쳐 Notion의 요청 제한에 맞춰 전송됨
+        self.scheduler = RequestScheduler(self.client)
         self.member_source = None
         self.group_source = None
         self.event_source = None
+        # data source id를 조회할 때 사용한 데이터베이스 id. 설정이 바뀌면 다시 조회하기 위함
+        self._db_ids: dict[DatabaseType, str] = {}
+        self._resolve_lock = asyncio.Lock()
+        # data source 스키마 캐시 (조회 시간, 응답)와 스키마 검증 결과 캐시 (None이면 통과)
+        self.schema_ttl = SCHEMA_TTL
+        self._schema_cache: dict[DatabaseType, tuple[float, dict]] = {}
+        self._validation_cache: dict[DatabaseType, NotionDBInvalidPropError | None] = {}
 
     def update_header(self, params: dict):
         self.client.headers.update(params)
@@ -329,17 +254,33 @@ class Notion:
     def change_version(self, version: str):
         self.update_header({"Notion-Version": version})
 
-    async def get(self, url: int) -> dict:
-        """해당 url로 request를 보냅니다.
+    async def request(
+        self,
+        method: str,
+        url: str,
+        payload: dict | None = None,
+        idempotent: bool | None = None,
+        params: dict | None = None,
+    ) -> dict:
+        """스케줄러를 통해 request를 보냅니다. 요청 속도 제한과 재시도는 스케줄러가 처리합니다.
 
         Args:
-            url (int): url
+            method (str): HTTP method
+            url (str): url
+            payload (dict | None): JSON body. None이면 body를 보내지 않습니다.
+            idempotent (bool | None): 재시도해도 안전한 요청인지 여부. None이면 method로 판단합니다.
+            params (dict | None): query parameter. 값이 리스트면 같은 이름으로 여러 번 전달됩니다.
 
         Returns:
-            _type_: json을 dict로 변경하여 반환합니다.
+            dict: json을 dict로 변경하여 반환합니다.
         """
+        kwargs = {} if payload is None else {"json": payload}
+        if params:
+            kwargs["params"] = params
         try:
-            response = await self.client.get(url)
+            response = await self.scheduler.request(
+                method, url, idempotent=idempotent, **kwargs
+            )
             response.raise_for_status()
             return response.json()
         except httpx.HTTPStatusError as e:
@@ -349,17 +290,64 @@ class Notion:
             print(f"잘못된 요청 에러 : {e}")
             raise
 
-    async def post(self, url: int, payload: dict = {"data": {}}) -> dict:
-        try:
-            response = await self.client.post(url, data=payload)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            print(f"HTTP 에러 발생 : {e.response.status_code} - {e.response.text}")
-            raise
-        except httpx.RequestError as e:
-            print(f"잘못된 요청 에러 : {e}")
-            raise
+    async def get(self, url: str, params: dict | None = None) -> dict:
+        """해당 url로 request를 보냅니다.
+
+        Args:
+            url (str): url
+            params (dict | None): query parameter
+
+        Returns:
+            dict: json을 dict로 변경하여 반환합니다.
+        """
+        return await self.request("GET", url, params=params)
+
+    async def post(
+        self,
+        url: str,
+        payload: dict | None = None,
+        idempotent: bool = False,
+        params: dict | None = None,
+    ) -> dict:
+        """해당 url로 payload를 JSON body로 담아 POST request를 보냅니다.
+
+        Args:
+            url (str): url
+            payload (dict | None): request body
+            idempotent (bool): 조회용 POST처럼 재시도해도 안전한 요청이라면 True
+            params (dict | None): query parameter
+
+        Returns:
+            dict: json을 dict로 변경하여 반환합니다.
+        """
+        return await self.request("POST", url, payload or {}, idempotent, params)
+
+    async def patch(self, url: str, payload: dict) -> dict:
+        """해당 url로 payload를 JSON body로 담아 PATCH request를 보냅니다.
+        속성 값을 덮어쓰는 요청만 사용하므로, 재시도해도 안전한 요청으로 취급합니다.
+
+        Args:
+            url (str): url
+            payload (dict): request body
+
+        Returns:
+            dict: json을 dict로 변경하여 반환합니다.
+        """
+        return await self.request("PATCH", url, payload, idempotent=True)
+
+    async def update_page(self, page_id: str, properties: dict) -> dict:
+        """page(data source의 행)의 속성을 수정합니다.
+
+        Args:
+            page_id (str): 수정할 page id
+            properties (dict): 속성 이름 -> Notion 속성 값
+
+        Returns:
+            dict: 수정된 page 정보
+        """
+        return await self.patch(
+            f"{self.base_url}/pages/{page_id}", {"properties": properties}
+        )
 
     async def check_health(self) -> bool:
         """Notion API가 작동하는지 확인합니다. 정상적으로 작동하지 않을 경우, 에러를 발생시킵니다.
@@ -375,61 +363,436 @@ class Notion:
         response = await self.get(f"{self.base_url}/databases/{id}")
         return response
 
-    async def validate_ds_ids(self):
-        if self.member_source is None:
-            print(f"member_source id is None -> retrieve database")
-            response = await self.get_database(get_env("NOTION_MEMBER_DB_ID"))
-            self.member_source = (
-                response.get("data_sources", [{}])[0].get("id").replace("-", "")
-            )
+    async def _stale_sources(self) -> dict[DatabaseType, str]:
+        """data source id를 다시 조회해야 하는 데이터베이스를 찾습니다.
+        아직 조회하지 않았거나, 데이터베이스 설정(NOTION_*_DB_ID)이 바뀐 경우입니다.
 
-        if self.group_source is None:
-            print(f"group_source id is None -> retrieve database")
-            response = await self.get_database(get_env("NOTION_GROUP_DB_ID"))
-            self.group_source = (
-                response.get("data_sources", [{}])[0].get("id").replace("-", "")
-            )
+        Returns:
+            dict[DatabaseType, str]: 데이터베이스 타입 -> 현재 설정된 데이터베이스 id
+        """
+        stale = {}
+        for db_type in DatabaseType:
+            db_id = await get_env_async(DB_ID_KEYS[db_type])
+            if (
+                getattr(self, SOURCE_ATTRS[db_type]) is None
+                or self._db_ids.get(db_type) != db_id
+            ):
+                stale[db_type] = db_id
+        return stale
 
-        if self.event_source is None:
-            print(f"event_source id is None -> retrieve database")
-            response = await self.get_database(get_env("NOTION_EVENT_DB_ID"))
-            self.event_source = (
-                response.get("data_sources", [{}])[0].get("id").replace("-", "")
+    async def validate_ds_ids(self):
+        """member, group, event 데이터베이스의 data source id를 동시에 조회합니다.
+        이미 조회한 id는 해당 데이터베이스 설정이 바뀌기 전까지 다시 조회하지 않습니다.
+        """
+        if not await self._stale_sources():
+            return
+
+        # 여러 요청이 동시에 들어와도 한 번만 조회하도록 lock을 잡은 뒤 다시 확인
+        async with self._resolve_lock:
+            db_ids = await self._stale_sources()
+            if not db_ids:
+                return
+
+            stale = list(db_ids)
+            print(f"{[t.value for t in stale]} source id is stale -> retrieve database")
+            responses = await asyncio.gather(
+                *(self.get_database(db_ids[t]) for t in stale)
             )
+            for db_type, response in zip(stale, responses):
+                source_id = (
+                    response.get("data_sources", [{}])[0].get("id").replace("-", "")
+                )
+                setattr(self, SOURCE_ATTRS[db_type], source_id)
+                self._db_ids[db_type] = db_ids[db_type]
+                self.invalidate_schema(db_type)
+            # relation 조건은 다른 데이터베이스 id를 참조하므로 모든 검증 결과를 다시 계산
+            self._validation_cache.clear()
+
+    def invalidate_schema(self, db_type: DatabaseType | None = None):
+        """캐시된 data source 스키마와 검증 결과를 삭제합니다.
+
+        Args:
+            db_type (DatabaseType | None): 삭제할 데이터베이스 타입. None이면 전체 삭제
+        """
+        targets = list(DatabaseType) if db_type is None else [db_type]
+        for target in targets:
+            self._schema_cache.pop(target, None)
+            self._validation_cache.pop(target, None)
 
     # 25년 notion에는 data source라는 객체가 추가되었음
-    async def get_member_ds(self):
-        await self.validate_ds_ids()
-        response = await self.get(f"{self.base_url}/data_sources/{self.member_source}")
+    async def get_data_source(self, db_type: DatabaseType, use_cache: bool = True):
+        """data source(스키마) 정보를 조회합니다. 조회 결과는 schema_ttl초 동안 캐시됩니다.
+
+        Args:
+            db_type (DatabaseType): 데이터베이스 타입
+            use_cache (bool): 캐시 사용 여부
+
+        Returns:
+            dict: data source 정보
+        """
+        source_id = await self.get_source_id(db_type)
+        cached = self._schema_cache.get(db_type)
+        if use_cache and cached and time.monotonic() - cached[0] < self.schema_ttl:
+            return cached[1]
+
+        response = await self.get(f"{self.base_url}/data_sources/{source_id}")
+        self._schema_cache[db_type] = (time.monotonic(), response)
+        self._validation_cache.pop(db_type, None)
         return response
 
+    async def get_member_ds(self):
+        return await self.get_data_source(DatabaseType.MEMBER)
+
     async def get_group_ds(self):
-        await self.validate_ds_ids()
-        response = await self.get(f"{self.base_url}/data_sources/{self.group_source}")
-        return response
+        return await self.get_data_source(DatabaseType.GROUP)
 
     async def get_event_ds(self):
-        await self.validate_ds_ids()
-        response = await self.get(f"{self.base_url}/data_sources/{self.event_source}")
-        return response
+        return await self.get_data_source(DatabaseType.EVENT)
 
-    async def get_member_records(self, payload: dict = None):
-        await self.validate_ds_ids()
-        return await self.post(
-            f"{self.base_url}/data_sources/{self.member_source}/query", payload
+    def _condition(self, db_type: DatabaseType) -> dict:
+        """스키마 조건을 만듭니다. relation 대상 데이터베이스 id는 validate_ds_ids에서 읽어둔 설정을 사용하여,
+        이벤트 루프에서 설정(db)을 다시 읽지 않습니다.
+
+        Args:
+            db_type (DatabaseType): 데이터베이스 타입
+
+        Returns:
+            dict: 스키마 조건
+        """
+        condition = CONDITIONS[db_type]
+        params = inspect.signature(condition).parameters
+        db_ids = {f"{t.value}_db_id": self._db_ids.get(t) for t in DatabaseType}
+        return condition(
+            **{key: value for key, value in db_ids.items() if key in params}
         )
 
-    async def get_group_records(self, payload: dict = None):
-        await self.validate_ds_ids()
+    async def validate_schema(self, db_type: DatabaseType) -> bool:
+        """data source가 스키마 조건에 맞는지 검증합니다.
+        검증 결과는 캐시된 스키마가 바뀌기 전까지 재사용됩니다.
+
+        Args:
+            db_type (DatabaseType): 데이터베이스 타입
+
+        Raises:
+            NotionDBInvalidPropError: 스키마가 조건에 맞지 않는 경우
+
+        Returns:
+            bool: 검증에 성공하면 True
+        """
+        data_source = await self.get_data_source(db_type)
+        if db_type not in self._validation_cache:
+            try:
+                validate_db(data_source, self._condition(db_type))
+                self._validation_cache[db_type] = None
+            except NotionDBInvalidPropError as e:
+                self._validation_cache[db_type] = e
+
+        error = self._validation_cache[db_type]
+        if error is not None:
+            raise error
+        return True
+
+    async def validate_schemas(self) -> bool:
+        """member, group, event data source를 동시에 검증합니다."""
+        await asyncio.gather(*(self.validate_schema(t) for t in DatabaseType))
+        return True
+
+    async def get_member_records(
+        self, payload: dict = None, filter_properties: list[str] | None = None
+    ):
+        return await self.query_source(DatabaseType.MEMBER, payload, filter_properties)
+
+    async def get_group_records(
+        self, payload: dict = None, filter_properties: list[str] | None = None
+    ):
+        return await self.query_source(DatabaseType.GROUP, payload, filter_properties)
+
+    async def get_event_records(
+        self, payload: dict = None, filter_properties: list[str] | None = None
+    ):
+        return await self.query_source(DatabaseType.EVENT, payload, filter_properties)
+
+    async def get_filter_properties(
+        self, db_type: DatabaseType, properties: list[str] | None = None
+    ) -> list[str]:
+        """query 응답에 포함할 속성 id 목록을 data source 스키마에서 구합니다.
+        스키마는 get_data_source의 캐시를 사용하므로 대부분 추가 요청이 발생하지 않습니다.
+
+        Args:
+            db_type (DatabaseType): 데이터베이스 타입
+            properties (list[str] | None): 포함할 속성 이름 혹은 id.
+                None이면 record 클래스가 읽는 속성(PROPERTIES)만 포함합니다.
+
+        Returns:
+            list[str]: 속성 id 목록. 빈 리스트면 모든 속성을 포함합니다.
+        """
+        if properties is not None and not properties:
+            return []
+        schema = (await self.get_data_source(db_type)).get("properties", {})
+        if properties is None:
+            # 스키마에 없는 속성은 validate_schema에서 따로 확인하므로 건너뜀
+            return [
+                schema[name]["id"]
+                for name in RECORD_TYPES[db_type].PROPERTIES
+                if name in schema
+            ]
+        # 이름으로 찾을 수 없으면 속성 id로 간주
+        return [schema[name]["id"] if name in schema else name for name in properties]
+
+    async def query_source(
+        self,
+        db_type: DatabaseType,
+        payload: dict | Query | None = None,
+        filter_properties: list[str] | None = None,
+    ) -> dict:
+        """data source를 한 번 조회합니다. (페이지 하나)
+
+        Args:
+            db_type (DatabaseType): 데이터베이스 타입
+            payload (dict | Query | None): filter, sorts, start_cursor 등 query body
+            filter_properties (list[str] | None): 응답에 포함할 속성. get_filter_properties 참고
+
+        Returns:
+            dict: data source query 결과
+        """
+        if isinstance(payload, Query):
+            payload = payload.build()
+        source_id = await self.get_source_id(db_type)
+        ids = await self.get_filter_properties(db_type, filter_properties)
         return await self.post(
-            f"{self.base_url}/data_sources/{self.group_source}/query", payload
+            f"{self.base_url}/data_sources/{source_id}/query",
+            payload,
+            idempotent=True,
+            params={FILTER_PROPERTIES_PARAM: ids} if ids else None,
+        )
+
+    async def query_pages(
+        self,
+        source_id: str,
+        payload: dict | Query | None = None,
+        page_size: int = 100,
+        filter_properties: list[str] | None = None,
+    ) -> AsyncIterator[list[dict]]:
+        """data source를 cursor 기반으로 끝까지 조회하며, 결과를 페이지 단위로 반환합니다.
+        현재 페이지를 처리하는 동안 다음 페이지를 미리 요청합니다.
+
+        Args:
+            source_id (str): 조회할 data source id
+            payload (dict | Query | None): filter, sorts 등 query body. start_cursor와 page_size는 이 함수가 관리합니다.
+            page_size (int): 한 번에 가져올 행 수 (최대 100)
+            filter_properties (list[str] | None): 응답에 포함할 속성 id 목록. None이면 모든 속성
+
+        Yields:
+            list[dict]: 한 페이지의 results
+        """
+        url = f"{self.base_url}/data_sources/{source_id}/query"
+        if isinstance(payload, Query):
+            payload = payload.build()
+        body = {**(payload or {}), "page_size": min(page_size, MAX_PAGE_SIZE)}
+        body.pop("start_cursor", None)
+        params = (
+            {FILTER_PROPERTIES_PARAM: filter_properties} if filter_properties else None
         )
 
-    async def get_event_records(self, payload: dict = None):
+        pending = asyncio.ensure_future(self.post(url, body, True, params))
+        try:
+            while pending is not None:
+                response = await pending
+                pending = None
+                if response.get("has_more") and response.get("next_cursor"):
+                    body = {**body, "start_cursor": response["next_cursor"]}
+                    pending = asyncio.ensure_future(self.post(url, body, True, params))
+                yield response.get("results", [])
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def iter_records(
+        self,
+        source_id: str,
+        record_type: type[NotionRecord],
+        payload: dict | Query | None = None,
+        page_size: int = 100,
+        filter_properties: list[str] | None = None,
+        complete_relations: bool = True,
+    ) -> AsyncIterator[NotionRecord]:
+        """data source의 모든 행을 record 객체로 변환하여 하나씩 반환합니다.
+
+        Args:
+            source_id (str): 조회할 data source id
+            record_type (type[NotionRecord]): 변환할 record 클래스
+            payload (dict | Query | None): filter, sorts 등 query body
+            page_size (int): 한 번에 가져올 행 수 (최대 100)
+            filter_properties (list[str] | None): 응답에 포함할 속성 id 목록. None이면 모든 속성
+            complete_relations (bool): 잘린 relation 속성을 끝까지 조회할지 여부
+
+        Yields:
+            NotionRecord: 변환된 record
+        """
+        decoder = get_decoder(record_type)
+        async for rows in self.query_pages(
+            source_id, payload, page_size, filter_properties
+        ):
+            if complete_relations:
+                await self.complete_relations(rows)
+            for row in rows:
+                yield decoder.decode(row)
+
+    async def get_relation_ids(self, page_id: str, property_id: str) -> list[str]:
+        """page의 relation 속성 값 전체를 property item endpoint로 끝까지 조회합니다.
+
+        Args:
+            page_id (str): page id
+            property_id (str): relation 속성 id
+
+        Returns:
+            list[str]: 연결된 page id 목록
+        """
+        url = f"{self.base_url}/pages/{page_id}/properties/{property_id}"
+        params = {"page_size": MAX_PAGE_SIZE}
+        ids = []
+        while True:
+            response = await self.get(url, params)
+            ids.extend(
+                item["relation"]["id"]
+                for item in response.get("results", [])
+                if item.get("type") == "relation"
+            )
+            if not (response.get("has_more") and response.get("next_cursor")):
+                return ids
+            params = {**params, "start_cursor": response["next_cursor"]}
+
+    async def complete_relations(self, rows: list[dict]) -> int:
+        """query 결과에서 잘린 relation 속성(has_more)의 나머지 값을 채웁니다.
+        Notion은 query 결과의 relation을 RELATION_LIMIT개까지만 반환하므로, 참석자가 많은 일정 등은 값이 누락됩니다.
+        잘린 속성들은 동시에 조회되며, 요청 속도는 scheduler가 조절합니다.
+
+        Args:
+            rows (list[dict]): data source query 결과 행 목록. 행의 속성을 직접 수정합니다.
+
+        Returns:
+            int: 다시 조회한 속성 수
+        """
+        targets = [
+            (row, name, prop)
+            for row in rows
+            for name, prop in (row.get("properties") or {}).items()
+            if prop.get("type") == "relation" and prop.get("has_more")
+        ]
+        if not targets:
+            return 0
+
+        results = await asyncio.gather(
+            *(self.get_relation_ids(row["id"], prop["id"]) for row, _, prop in targets)
+        )
+        for (row, name, prop), ids in zip(targets, results):
+            row["properties"][name] = {
+                **prop,
+                "relation": [{"id": id} for id in ids],
+                "has_more": False,
+            }
+        return len(targets)
+
+    async def get_source_id(self, db_type: "DatabaseType") -> str:
+        """데이터베이스 타입에 해당하는 data source id를 반환합니다.
+
+        Args:
+            db_type (DatabaseType): 데이터베이스 타입
+
+        Returns:
+            str: data source id
+        """
         await self.validate_ds_ids()
-        return await self.post(
-            f"{self.base_url}/data_sources/{self.event_source}/query", payload
+        return getattr(self, SOURCE_ATTRS[db_type])
+
+    async def iter_member_records(
+        self,
+        payload: dict | Query | None = None,
+        page_size: int = 100,
+        filter_properties: list[str] | None = None,
+    ) -> AsyncIterator[MemberRecord]:
+        async for record in self.iter_db_records(
+            DatabaseType.MEMBER, payload, page_size, filter_properties
+        ):
+            yield record
+
+    async def iter_group_records(
+        self,
+        payload: dict | Query | None = None,
+        page_size: int = 100,
+        filter_properties: list[str] | None = None,
+    ) -> AsyncIterator[GroupRecord]:
+        async for record in self.iter_db_records(
+            DatabaseType.GROUP, payload, page_size, filter_properties
+        ):
+            yield record
+
+    async def iter_event_records(
+        self,
+        payload: dict | Query | None = None,
+        page_size: int = 100,
+        filter_properties: list[str] | None = None,
+    ) -> AsyncIterator[EventRecord]:
+        async for record in self.iter_db_records(
+            DatabaseType.EVENT, payload, page_size, filter_properties
+        ):
+            yield record
+
+    async def iter_actionable_records(
+        self,
+        db_type: "DatabaseType",
+        statuses: tuple[Sync, ...] | None = None,
+        page_size: int = 100,
+        filter_properties: list[str] | None = None,
+    ) -> AsyncIterator[NotionRecord]:
+        """Sync Status가 업데이트 해야 하는 상태(Update, Delete)인 행만 Notion에서 filter하여 반환합니다.
+        전체 행을 가져와서 걸러내는 대신, 작업이 필요한 행만 오래 수정되지 않은 순으로 가져옵니다.
+
+        Args:
+            db_type (DatabaseType): 조회할 데이터베이스 타입
+            statuses (tuple[Sync, ...] | None): 조회할 Sync Status. None이면 Sync.actionable()
+            page_size (int): 한 번에 가져올 행 수 (최대 100)
+            filter_properties (list[str] | None): 응답에 포함할 속성. get_filter_properties 참고
+
+        Yields:
+            NotionRecord: 변환된 record
+        """
+        query = (
+            Query()
+            .where(sync_status_in(*(statuses or Sync.actionable())))
+            .sort(LAST_EDITED_TIME.ascending())
         )
+        async for record in self.iter_db_records(
+            db_type, query, page_size, filter_properties
+        ):
+            yield record
+
+    async def iter_db_records(
+        self,
+        db_type: DatabaseType,
+        payload: dict | Query | None = None,
+        page_size: int = 100,
+        filter_properties: list[str] | None = None,
+    ) -> AsyncIterator[NotionRecord]:
+        """데이터베이스 타입의 record를 하나씩 반환합니다.
+        응답에는 기본적으로 record 클래스가 읽는 속성만 포함되도록 요청합니다.
+
+        Args:
+            db_type (DatabaseType): 조회할 데이터베이스 타입
+            payload (dict | Query | None): filter, sorts 등 query body
+            page_size (int): 한 번에 가져올 행 수 (최대 100)
+            filter_properties (list[str] | None): 응답에 포함할 속성 이름 혹은 id.
+                None이면 record 클래스의 PROPERTIES, 빈 리스트면 모든 속성
+
+        Yields:
+            NotionRecord: 변환된 record
+        """
+        source_id = await self.get_source_id(db_type)
+        ids = await self.get_filter_properties(db_type, filter_properties)
+        async for record in self.iter_records(
+            source_id, RECORD_TYPES[db_type], payload, page_size, ids
+        ):
+            yield record
 
     async def close(self):
         await self.client.aclose()
@@ -511,5 +874,20 @@ def validate_db(target: dict, condition: dict) -> bool:
         return True
 
 
-# 싱글톤 패턴
-notion_client = Notion()
+# 싱글톤 패턴. 생성할 때 DB에서 API 키를 읽으므로, import 시점이 아니라 처음 사용할 때 생성함
+_notion_client: Notion | None = None
+
+
+def get_notion_client() -> Notion:
+    """Notion 클라이언트 싱글톤을 반환합니다. 처음 호출할 때 생성합니다."""
+    global _notion_client
+    if _notion_client is None:
+        _notion_client = Notion()
+    return _notion_client
+
+
+def __getattr__(name: str):
+    # 하위 호환성: `from src.services.notion.notion import notion_client`
+    if name == "notion_client":
+        return get_notion_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
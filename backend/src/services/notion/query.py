@@ -0,0 +1,257 @@
+from datetime import datetime, timezone
+from typing import Iterable
+
+from src.services.notion.schema import PropType
+from src.utils.constants import Sync
+
+# 속성 타입별로 Notion query filter에서 사용할 수 있는 조건
+_TEXT_OPERATORS = frozenset(
+    {
+        "equals",
+        "does_not_equal",
+        "contains",
+        "does_not_contain",
+        "starts_with",
+        "ends_with",
+        "is_empty",
+        "is_not_empty",
+    }
+)
+_DATE_OPERATORS = frozenset(
+    {
+        "equals",
+        "before",
+        "after",
+        "on_or_before",
+        "on_or_after",
+        "is_empty",
+        "is_not_empty",
+    }
+)
+
+OPERATORS: dict[PropType, frozenset[str]] = {
+    PropType.title: _TEXT_OPERATORS,
+    PropType.rich_text: _TEXT_OPERATORS,
+    PropType.email: _TEXT_OPERATORS,
+    PropType.phone_number: _TEXT_OPERATORS,
+    PropType.select: frozenset(
+        {"equals", "does_not_equal", "is_empty", "is_not_empty"}
+    ),
+    PropType.relation: frozenset(
+        {"contains", "does_not_contain", "is_empty", "is_not_empty"}
+    ),
+    PropType.date: _DATE_OPERATORS,
+}
+
+
+def _format_value(value):
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc).isoformat(timespec="milliseconds")
+    if isinstance(value, Sync):
+        return value.value[0]
+    return value
+
+
+class Filter:
+    """
+    Notion query filter 하나를 나타냅니다.
+    `&`, `|`로 여러 filter를 and / or 조건으로 묶을 수 있습니다.
+
+    Example:
+        >>> f = SYNC_STATUS.equals(Sync.Update) | SYNC_STATUS.equals(Sync.Delete)
+        >>> f.to_dict()
+        {'or': [{'property': 'Sync Status', 'select': {'equals': 'Update'}}, ...]}
+    """
+
+    def __init__(self, body: dict):
+        self.body = body
+
+    def _combine(self, operator: str, other: "Filter") -> "Filter":
+        # 같은 종류의 조건은 중첩하지 않고 한 단계로 합침 (Notion은 2단계까지만 중첩 허용)
+        left = self.body[operator] if operator in self.body else [self.body]
+        right = other.body[operator] if operator in other.body else [other.body]
+        return Filter({operator: [*left, *right]})
+
+    def __and__(self, other: "Filter") -> "Filter":
+        return self._combine("and", other)
+
+    def __or__(self, other: "Filter") -> "Filter":
+        return self._combine("or", other)
+
+    def to_dict(self) -> dict:
+        return self.body
+
+    def __repr__(self) -> str:
+        return f"Filter({self.body})"
+
+
+class Prop:
+    """
+    data source 속성 하나에 대한 filter / 정렬 조건을 만듭니다.
+    속성 타입에서 사용할 수 없는 조건을 만들면 ValueError를 발생시킵니다.
+    """
+
+    def __init__(self, name: str, prop_type: PropType):
+        """
+        :param name: Notion 속성 이름
+        :type name: str
+        :param prop_type: 속성 타입
+        :type prop_type: PropType
+        """
+        self.name = name
+        self.prop_type = prop_type
+
+    def condition(self, operator: str, value=True) -> Filter:
+        """
+        속성 조건을 만듭니다.
+
+        :param operator: 조건 (equals, contains, on_or_after 등)
+        :type operator: str
+        :param value: 비교할 값. is_empty / is_not_empty는 True
+        :raises ValueError: 속성 타입에서 사용할 수 없는 조건인 경우
+        :rtype: Filter
+        """
+        if operator not in OPERATORS[self.prop_type]:
+            raise ValueError(
+                f"속성 {self.name}({self.prop_type.value})에는 {operator} 조건을 사용할 수 없습니다."
+            )
+        return Filter(
+            {
+                "property": self.name,
+                self.prop_type.value: {operator: _format_value(value)},
+            }
+        )
+
+    def equals(self, value) -> Filter:
+        return self.condition("equals", value)
+
+    def does_not_equal(self, value) -> Filter:
+        return self.condition("does_not_equal", value)
+
+    def contains(self, value) -> Filter:
+        return self.condition("contains", value)
+
+    def does_not_contain(self, value) -> Filter:
+        return self.condition("does_not_contain", value)
+
+    def is_empty(self) -> Filter:
+        return self.condition("is_empty")
+
+    def is_not_empty(self) -> Filter:
+        return self.condition("is_not_empty")
+
+    def before(self, value) -> Filter:
+        return self.condition("before", value)
+
+    def after(self, value) -> Filter:
+        return self.condition("after", value)
+
+    def on_or_before(self, value) -> Filter:
+        return self.condition("on_or_before", value)
+
+    def on_or_after(self, value) -> Filter:
+        return self.condition("on_or_after", value)
+
+    def in_(self, values: Iterable) -> Filter:
+        """값 중 하나와 같은 행 (equals 조건의 or)"""
+        filters = [self.equals(value) for value in values]
+        if not filters:
+            raise ValueError("비교할 값이 없습니다.")
+        result = filters[0]
+        for f in filters[1:]:
+            result = result | f
+        return result
+
+    def ascending(self) -> dict:
+        return {"property": self.name, "direction": "ascending"}
+
+    def descending(self) -> dict:
+        return {"property": self.name, "direction": "descending"}
+
+
+class Timestamp:
+    """page의 created_time / last_edited_time에 대한 filter / 정렬 조건을 만듭니다."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def condition(self, operator: str, value=True) -> Filter:
+        if operator not in _DATE_OPERATORS:
+            raise ValueError(f"{self.name}에는 {operator} 조건을 사용할 수 없습니다.")
+        return Filter(
+            {"timestamp": self.name, self.name: {operator: _format_value(value)}}
+        )
+
+    def before(self, value: datetime) -> Filter:
+        return self.condition("before", value)
+
+    def after(self, value: datetime) -> Filter:
+        return self.condition("after", value)
+
+    def on_or_before(self, value: datetime) -> Filter:
+        return self.condition("on_or_before", value)
+
+    def on_or_after(self, value: datetime) -> Filter:
+        return self.condition("on_or_after", value)
+
+    def ascending(self) -> dict:
+        return {"timestamp": self.name, "direction": "ascending"}
+
+    def descending(self) -> dict:
+        return {"timestamp": self.name, "direction": "descending"}
+
+
+# 모든 data source에 공통으로 존재하는 속성
+SYNC_STATUS = Prop("Sync Status", PropType.select)
+LAST_EDITED_TIME = Timestamp("last_edited_time")
+CREATED_TIME = Timestamp("created_time")
+
+
+def sync_status_in(*statuses: Sync) -> Filter:
+    """Sync Status가 statuses 중 하나인 행"""
+    return SYNC_STATUS.in_(statuses)
+
+
+def actionable() -> Filter:
+    """동기화 작업이 필요한 행 (Sync Status가 Update 혹은 Delete)"""
+    return sync_status_in(*Sync.actionable())
+
+
+class Query:
+    """
+    data source query body를 만듭니다.
+
+    Example:
+        >>> Query().where(actionable()).sort(LAST_EDITED_TIME.ascending()).build()
+    """
+
+    def __init__(self):
+        self._filter: Filter | None = None
+        self._sorts: list[dict] = []
+        self._page_size: int | None = None
+
+    def where(self, f: Filter) -> "Query":
+        """filter를 추가합니다. 이미 filter가 있다면 and 조건으로 묶습니다."""
+        self._filter = f if self._filter is None else self._filter & f
+        return self
+
+    def sort(self, *sorts: dict) -> "Query":
+        """정렬 조건을 추가합니다. 먼저 추가한 조건이 우선합니다."""
+        self._sorts.extend(sorts)
+        return self
+
+    def page_size(self, size: int) -> "Query":
+        self._page_size = size
+        return self
+
+    def build(self) -> dict:
+        body = {}
+        if self._filter is not None:
+            body["filter"] = self._filter.to_dict()
+        if self._sorts:
+            body["sorts"] = list(self._sorts)
+        if self._page_size is not None:
+            body["page_size"] = self._page_size
+        return body
@@ -0,0 +1,128 @@
+import asyncio
+import random
+
+import httpx
+
+from src.utils.ratelimit import TokenBucket, parse_retry_after
+
+# Notion API는 integration 당 평균 초당 3회의 요청을 허용합니다.
+NOTION_RATE_LIMIT = 3.0
+
+# 재시도해도 결과가 달라지지 않는 HTTP method
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# 서버가 요청을 처리하지 못했음을 알리는 상태 코드. Retry-After 헤더를 따릅니다.
+THROTTLED_STATUS = frozenset({429, 503})
+
+
+class RequestScheduler:
+    """
+    httpx.AsyncClient 요청을 token bucket으로 조절하여 보내는 스케줄러입니다.
+
+    - 모든 요청은 token bucket을 거쳐 평균 rate 이하로 전송됩니다.
+    - 429/503 응답은 Retry-After 만큼 전체 요청을 멈춘 뒤 재시도합니다.
+    - 네트워크 오류와 5xx 응답은 idempotent한 요청만 jitter가 섞인 exponential backoff로 재시도합니다.
+
+    여러 요청을 asyncio.gather 등으로 동시에 보내도 스케줄러가 속도를 맞추므로, 호출하는 쪽에서 sleep을 넣을 필요가 없습니다.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        rate: float = NOTION_RATE_LIMIT,
+        burst: float | None = None,
+        max_retries: int = 5,
+        max_concurrency: int = 10,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+    ):
+        """
+        :param client: 요청을 보낼 httpx 클라이언트
+        :type client: httpx.AsyncClient
+        :param rate: 초당 평균 요청 수
+        :type rate: float
+        :param burst: 순간적으로 허용되는 요청 수 (기본값: rate)
+        :type burst: float | None
+        :param max_retries: 최대 재시도 횟수
+        :type max_retries: int
+        :param max_concurrency: 동시에 응답을 기다릴 수 있는 최대 요청 수
+        :type max_concurrency: int
+        :param backoff_base: backoff 기본 대기 시간(초)
+        :type backoff_base: float
+        :param backoff_max: backoff 최대 대기 시간(초)
+        :type backoff_max: float
+        """
+        self.client = client
+        self.bucket = TokenBucket(rate, burst)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        attempt번째 재시도 전에 기다릴 시간을 반환합니다. (full jitter)
+
+        :param attempt: 0부터 시작하는 재시도 횟수
+        :type attempt: int
+        :rtype: float
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    async def request(
+        self, method: str, url: str, idempotent: bool | None = None, **kwargs
+    ) -> httpx.Response:
+        """
+        요청을 보내고 응답을 반환합니다. 재시도가 모두 실패하면 마지막 응답을 반환하거나 마지막 예외를 raise합니다.
+
+        :param method: HTTP method
+        :type method: str
+        :param url: 요청 url
+        :type url: str
+        :param idempotent: 재시도해도 안전한 요청인지 여부. None이면 method로 판단합니다.
+            조회용 POST(data source query 등)는 True를 넘겨주십시오.
+        :type idempotent: bool | None
+        :param kwargs: httpx.AsyncClient.request에 그대로 전달할 인자
+        :return: 응답
+        :rtype: httpx.Response
+        """
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        attempt = 0
+        while True:
+            await self.bucket.acquire()
+            try:
+                async with self._semaphore:
+                    response = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError:
+                if not idempotent or attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(self.backoff(attempt))
+                attempt += 1
+                continue
+
+            if attempt >= self.max_retries:
+                return response
+
+            if response.status_code in THROTTLED_STATUS:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                # 429는 서버가 요청을 처리하지 않았음을 보장하므로 method와 상관없이 재시도
+                if response.status_code == 429 or idempotent:
+                    wait = (
+                        retry_after
+                        if retry_after is not None
+                        else self.backoff(attempt)
+                    )
+                    print(
+                        f"Notion API 요청 제한 ({response.status_code}) - {wait:.2f}초 후 재시도"
+                    )
+                    self.bucket.block(wait)
+                    attempt += 1
+                    continue
+            elif response.status_code >= 500 and idempotent:
+                await asyncio.sleep(self.backoff(attempt))
+                attempt += 1
+                continue
+
+            return response
@@ -1,4 +1,8 @@
+import inspect
 from enum import Enum
+from functools import cache
+from typing import Callable
+
 from src.utils.env import get_env
 
 
@@ -12,15 +16,19 @@ class PropType(Enum):
     date = "date"
 
 
+def MemberCondition(group_db_id: str | None = None):
+    """
+    member data source 스키마 조건
 
-def MemberCondition():
+    :param group_db_id: Groups 속성이 연결되어야 하는 group 데이터베이스 id. None이면 NOTION_GROUP_DB_ID를 사용
+    """
     return {
         "Discord ID": {"type": PropType.rich_text},
         "Email": {"type": PropType.email},
         "Groups": {
             "type": PropType.relation,
             "relation": {
-                "database_id": get_env("NOTION_GROUP_DB_ID")
+                "database_id": group_db_id or get_env("NOTION_GROUP_DB_ID")
             },  # 매 호출마다 최신 환경변수를 반영하기 위함
         },
         "Log": {"type": PropType.rich_text},
@@ -69,12 +77,18 @@ def GroupCondition():
     }
 
 
-def EventCondition():
+def EventCondition(member_db_id: str | None = None, group_db_id: str | None = None):
+    """
+    event data source 스키마 조건
+
+    :param member_db_id: Attendees 속성이 연결되어야 하는 member 데이터베이스 id. None이면 NOTION_MEMBER_DB_ID를 사용
+    :param group_db_id: Groups 속성이 연결되어야 하는 group 데이터베이스 id. None이면 NOTION_GROUP_DB_ID를 사용
+    """
     return {
         "Attendees": {
             "type": PropType.relation,
             "relation": {
-                "database_id": get_env("NOTION_MEMBER_DB_ID")
+                "database_id": member_db_id or get_env("NOTION_MEMBER_DB_ID")
             },  # 매 호출마다 최신 환경변수를 반영하기 위함
         },
         "Date": {"type": PropType.date},
@@ -82,7 +96,7 @@ def EventCondition():
         "Groups": {
             "type": PropType.relation,
             "relation": {
-                "database_id": get_env("NOTION_GROUP_DB_ID")
+                "database_id": group_db_id or get_env("NOTION_GROUP_DB_ID")
             },  # 매 호출마다 최신 환경변수를 반영하기 위함
         },
         "Location": {"type": PropType.rich_text},
@@ -101,3 +115,20 @@ def EventCondition():
         },
         "Title": {"type": PropType.title},
     }
+
+
+# 속성 타입만 필요할 때 relation 대상 데이터베이스 id 대신 넘기는 값
+_PLACEHOLDER_DB_ID = "-"
+
+
+@cache
+def prop_types(condition: Callable[..., dict]) -> dict[str, PropType]:
+    """
+    스키마 조건의 속성 이름 -> 속성 타입을 반환합니다.
+    relation 대상 데이터베이스 id 자리에 임시 값을 넘기므로, 설정(db)을 읽지 않습니다.
+
+    :param condition: MemberCondition, GroupCondition, EventCondition
+    """
+    params = inspect.signature(condition).parameters
+    schema = condition(**{name: _PLACEHOLDER_DB_ID for name in params})
+    return {name: spec["type"] for name, spec in schema.items()}
@@ -0,0 +1,642 @@
+"""
+Notion API 대역(stub)
+
+실제 Notion API 없이 Notion 클라이언트, record 변환, 스키마 검증을 실행하기 위한 httpx transport와
+합성 워크스페이스(member / group / event 데이터베이스) 생성기입니다. 벤치마크와 부하 테스트에서 사용합니다.
+
+Example:
+    >>> workspace = generate_workspace(members=10_000)
+    >>> notion = stub_notion(workspace, latency=0.05)
+    >>> async for record in notion.iter_member_records():
+    ...     ...
+"""
+
+import asyncio
+import json
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+from src.services.notion.notion import (
+    DB_ID_KEYS,
+    FILTER_PROPERTIES_PARAM,
+    MAX_PAGE_SIZE,
+    RELATION_LIMIT,
+    DatabaseType,
+    Notion,
+)
+from src.services.notion.scheduler import RequestScheduler
+from src.services.notion.schema import (
+    EventCondition,
+    GroupCondition,
+    MemberCondition,
+    PropType,
+)
+from src.utils.constants import Sync
+from src.utils.env import cache_env
+
+# 미리 정의된 워크스페이스 크기 (member 행 수)
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+
+BASE_TIME = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+
+def _format_time(value: datetime) -> str:
+    return value.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _text(value: str) -> list[dict]:
+    return [
+        {
+            "type": "text",
+            "text": {"content": value, "link": None},
+            "plain_text": value,
+            "href": None,
+        }
+    ]
+
+
+def _property_value(prop_type: PropType, value) -> dict:
+    """record 값을 Notion API의 page 속성 값 형식으로 변환합니다."""
+    if prop_type in (PropType.title, PropType.rich_text):
+        return {prop_type.value: _text(value) if value else []}
+    if prop_type == PropType.select:
+        return {"select": {"name": value} if value else None}
+    if prop_type == PropType.relation:
+        return {"relation": [{"id": page_id} for page_id in value]}
+    if prop_type == PropType.date:
+        start, end = value
+        return {"date": {"start": start, "end": end} if start else None}
+    return {prop_type.value: value or None}
+
+
+class StubDataSource:
+    """stub 워크스페이스의 data source 하나 (스키마와 행 목록)"""
+
+    def __init__(
+        self, db_type: DatabaseType, condition: dict, database_id: str, source_id: str
+    ):
+        self.db_type = db_type
+        self.database_id = database_id
+        self.id = source_id
+        self.properties = {}
+        for i, (name, item) in enumerate(condition.items()):
+            prop_type = item["type"]
+            config = {}
+            if prop_type == PropType.select:
+                config = {
+                    "options": [
+                        {"id": f"opt{j}", "name": option, "color": "default"}
+                        for j, option in enumerate(item["select"])
+                    ]
+                }
+            elif prop_type == PropType.relation:
+                config = {"database_id": item["relation"]["database_id"]}
+            self.properties[name] = {
+                "id": f"p{i:03d}",
+                "name": name,
+                "type": prop_type.value,
+                prop_type.value: config,
+            }
+        self.pages: list[dict] = []
+
+    def add_page(self, page_id: str, values: dict, edited: datetime) -> dict:
+        """
+        행을 추가합니다.
+
+        :param page_id: page id
+        :param values: 속성 이름 -> 값 (relation은 page id 목록, date는 (start, end))
+        :param edited: 마지막 수정 시간
+        """
+        properties = {}
+        for name, schema in self.properties.items():
+            prop_type = PropType(schema["type"])
+            properties[name] = {
+                "id": schema["id"],
+                "type": schema["type"],
+                **_property_value(prop_type, values.get(name)),
+            }
+        page = {
+            "object": "page",
+            "id": page_id,
+            "created_time": _format_time(BASE_TIME),
+            "last_edited_time": _format_time(edited),
+            "archived": False,
+            "in_trash": False,
+            "parent": {"type": "data_source_id", "data_source_id": self.id},
+            "properties": properties,
+        }
+        self.pages.append(page)
+        return page
+
+    def to_database(self) -> dict:
+        return {
+            "object": "database",
+            "id": self.database_id,
+            "data_sources": [{"id": self.id, "name": self.db_type.value}],
+        }
+
+    def to_data_source(self) -> dict:
+        return {
+            "object": "data_source",
+            "id": self.id,
+            "parent": {"type": "database_id", "database_id": self.database_id},
+            "properties": self.properties,
+        }
+
+
+class StubWorkspace:
+    """member, group, event data source로 구성된 stub 워크스페이스"""
+
+    def __init__(self):
+        self.member = None
+        self.group = None
+        self.event = None
+        self._data_sources: dict[str, StubDataSource] = {}
+        self._pages: dict[str, tuple[StubDataSource, dict]] = {}
+
+    def add_data_source(self, data_source: StubDataSource):
+        setattr(self, data_source.db_type.value, data_source)
+        self._data_sources[data_source.id] = data_source
+        self._data_sources[data_source.id.replace("-", "")] = data_source
+
+    def index_pages(self):
+        """page id로 행을 찾기 위한 색인을 만듭니다. 행을 추가한 뒤 호출해야 합니다."""
+        self._pages = {}
+        for data_source in (self.member, self.group, self.event):
+            for page in data_source.pages:
+                self._pages[page["id"]] = (data_source, page)
+                self._pages[page["id"].replace("-", "")] = (data_source, page)
+
+    def data_sources(self) -> list[StubDataSource]:
+        return [self.member, self.group, self.event]
+
+    def find_database(self, database_id: str) -> StubDataSource | None:
+        for data_source in self.data_sources():
+            if data_source.database_id.replace("-", "") == database_id.replace("-", ""):
+                return data_source
+        return None
+
+    def find_data_source(self, source_id: str) -> StubDataSource | None:
+        return self._data_sources.get(source_id)
+
+    def find_page(self, page_id: str) -> tuple[StubDataSource, dict] | None:
+        return self._pages.get(page_id)
+
+
+def generate_workspace(
+    members: int | str = 1_000,
+    groups: int | None = None,
+    events: int | None = None,
+    seed: int = 0,
+) -> StubWorkspace:
+    """
+    relation이 서로 맞물린 member / group / event 워크스페이스를 생성합니다.
+
+    - member는 0~3개의 group에 속합니다.
+    - event는 1~2개의 group과, 해당 group에 속한 member 일부를 참석자로 가집니다.
+      큰 행사(10개 중 1개)는 RELATION_LIMIT보다 많은 참석자를 가집니다.
+
+    :param members: member 행 수 혹은 SIZES의 key ("1k", "10k", "100k")
+    :type members: int | str
+    :param groups: group 행 수 (기본값: member 50명당 1개, 최소 5개)
+    :type groups: int | None
+    :param events: event 행 수 (기본값: member 수의 1/10, 최소 10개)
+    :type events: int | None
+    :param seed: 난수 seed. 같은 인자와 seed는 항상 같은 워크스페이스를 만듭니다.
+    :type seed: int
+    :rtype: StubWorkspace
+    """
+    if isinstance(members, str):
+        members = SIZES[members]
+    groups = groups if groups is not None else max(5, members // 50)
+    events = events if events is not None else max(10, members // 10)
+
+    rng = random.Random(seed)
+
+    def new_id() -> str:
+        return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+    def edited() -> datetime:
+        return BASE_TIME + timedelta(minutes=rng.randrange(60 * 24 * 30))
+
+    workspace = StubWorkspace()
+    # relation 조건에는 상대 데이터베이스 id가 필요하므로 id를 먼저 생성
+    db_ids = {db_type: new_id() for db_type in DatabaseType}
+    member_db_id = db_ids[DatabaseType.MEMBER].replace("-", "")
+    group_db_id = db_ids[DatabaseType.GROUP].replace("-", "")
+    conditions = {
+        DatabaseType.MEMBER: MemberCondition(group_db_id=group_db_id),
+        DatabaseType.GROUP: GroupCondition(),
+        DatabaseType.EVENT: EventCondition(
+            member_db_id=member_db_id, group_db_id=group_db_id
+        ),
+    }
+    for db_type in DatabaseType:
+        workspace.add_data_source(
+            StubDataSource(db_type, conditions[db_type], db_ids[db_type], new_id())
+        )
+    member_ds, group_ds, event_ds = workspace.data_sources()
+
+    sync_choices = [Sync.Synced] * 8 + [Sync.Update, Sync.Delete]
+
+    group_ids = []
+    for i in range(groups):
+        group_id = new_id()
+        group_ids.append(group_id)
+        group_ds.add_page(
+            group_id,
+            {
+                "Name": f"group-{i:04d}",
+                "Description": f"synthetic group {i}",
+                "Discord Role ID": str(10**17 + i),
+                "Log": "",
+                "Sync Status": rng.choice(sync_choices).value[0],
+            },
+            edited(),
+        )
+
+    group_members: dict[str, list[str]] = {group_id: [] for group_id in group_ids}
+    for i in range(members):
+        member_id = new_id()
+        member_groups = rng.sample(group_ids, rng.randint(0, min(3, len(group_ids))))
+        for group_id in member_groups:
+            group_members[group_id].append(member_id)
+        member_ds.add_page(
+            member_id,
+            {
+                "Name": f"member-{i:06d}",
+                "Student ID": str(202500000 + i),
+                "Email": f"member{i}@example.com",
+                "Role": rng.choice(["Member", "Member", "Guest", "Admin"]),
+                "Groups": member_groups,
+                "Phone": f"010-{i // 10000 % 10000:04d}-{i % 10000:04d}",
+                "Discord ID": str(10**17 + i) if i % 3 else "",
+                "Log": "",
+                "Member Status": "Active",
+                "Sync Status": rng.choice(sync_choices).value[0],
+            },
+            edited(),
+        )
+
+    for i in range(events):
+        event_groups = rng.sample(group_ids, rng.randint(1, min(2, len(group_ids))))
+        candidates = [m for g in event_groups for m in group_members[g]]
+        size = RELATION_LIMIT * 4 if i % 10 == 0 else RELATION_LIMIT // 2
+        attendees = rng.sample(candidates, min(size, len(candidates)))
+        start = BASE_TIME + timedelta(days=rng.randrange(90), hours=rng.randrange(24))
+        event_ds.add_page(
+            new_id(),
+            {
+                "Title": f"event-{i:05d}",
+                "Date": (_format_time(start), _format_time(start + timedelta(hours=2))),
+                "Groups": event_groups,
+                "Attendees": attendees,
+                "Location": f"room {i % 50}",
+                "Description": "",
+                "Log": "",
+                "Sync Status": rng.choice(sync_choices).value[0],
+            },
+            edited(),
+        )
+
+    workspace.index_pages()
+    return workspace
+
+
+# --- [ query 처리 ] ---
+
+
+def _property_text(prop: dict):
+    """filter 비교를 위해 page 속성의 값을 꺼냅니다."""
+    prop_type = prop["type"]
+    value = prop.get(prop_type)
+    if prop_type in ("title", "rich_text"):
+        return value[0]["plain_text"] if value else ""
+    if prop_type == "select":
+        return value["name"] if value else None
+    if prop_type == "relation":
+        return [r["id"] for r in value]
+    return value
+
+
+def _match_condition(actual, condition: dict) -> bool:
+    for operator, expected in condition.items():
+        if operator == "equals" and actual != expected:
+            return False
+        if operator == "does_not_equal" and actual == expected:
+            return False
+        if operator == "contains" and expected not in (actual or ""):
+            return False
+        if operator == "is_empty" and actual:
+            return False
+        if operator == "is_not_empty" and not actual:
+            return False
+        if operator == "on_or_after" and actual < expected:
+            return False
+        if operator == "after" and actual <= expected:
+            return False
+        if operator == "on_or_before" and actual > expected:
+            return False
+        if operator == "before" and actual >= expected:
+            return False
+    return True
+
+
+def _normalize_time(value: str) -> str:
+    """시간 문자열을 UTC 기준으로 맞춰 문자열 비교가 가능하게 합니다."""
+    return _format_time(datetime.fromisoformat(value.replace("Z", "+00:00")))
+
+
+def match_filter(page: dict, page_filter: dict | None) -> bool:
+    """
+    Notion query filter의 일부(and / or, timestamp, 속성별 equals 등)를 page에 적용합니다.
+
+    :param page: page 객체
+    :param page_filter: query body의 filter
+    :rtype: bool
+    """
+    if not page_filter:
+        return True
+    if "and" in page_filter:
+        return all(match_filter(page, f) for f in page_filter["and"])
+    if "or" in page_filter:
+        return any(match_filter(page, f) for f in page_filter["or"])
+    if "timestamp" in page_filter:
+        key = page_filter["timestamp"]
+        condition = {
+            operator: _normalize_time(value)
+            for operator, value in page_filter[key].items()
+        }
+        return _match_condition(_normalize_time(page[key]), condition)
+
+    prop = page["properties"].get(page_filter["property"])
+    if prop is None:
+        return False
+    for prop_type in ("select", "status", "rich_text", "title", "relation"):
+        if prop_type in page_filter:
+            return _match_condition(_property_text(prop), page_filter[prop_type])
+    return True
+
+
+def sort_pages(pages: list[dict], sorts: list[dict] | None) -> list[dict]:
+    """Notion query sorts를 적용합니다. 뒤쪽 정렬 조건부터 안정 정렬을 반복합니다."""
+    for sort in reversed(sorts or []):
+        reverse = sort.get("direction") == "descending"
+        if "timestamp" in sort:
+            key = sort["timestamp"]
+            pages = sorted(pages, key=lambda p: p[key], reverse=reverse)
+        else:
+            name = sort["property"]
+            pages = sorted(
+                pages,
+                key=lambda p: str(_property_text(p["properties"][name]) or ""),
+                reverse=reverse,
+            )
+    return pages
+
+
+def truncate_relations(page: dict) -> dict:
+    """query 결과처럼 relation 속성을 RELATION_LIMIT개로 자르고 has_more를 표시합니다."""
+    truncated = None
+    for name, prop in page["properties"].items():
+        if prop["type"] == "relation" and len(prop["relation"]) > RELATION_LIMIT:
+            if truncated is None:
+                truncated = {**page, "properties": dict(page["properties"])}
+            truncated["properties"][name] = {
+                **prop,
+                "relation": prop["relation"][:RELATION_LIMIT],
+                "has_more": True,
+            }
+    return truncated or page
+
+
+def select_properties(page: dict, property_ids: list[str]) -> dict:
+    """filter_properties처럼 지정한 id의 속성만 남깁니다."""
+    keep = set(property_ids)
+    return {
+        **page,
+        "properties": {
+            name: prop
+            for name, prop in page["properties"].items()
+            if prop["id"] in keep
+        },
+    }
+
+
+class StubTransport(httpx.AsyncBaseTransport):
+    """
+    StubWorkspace를 Notion API처럼 응답하는 httpx transport입니다.
+
+    - GET /v1/users/me
+    - GET /v1/databases/{id}
+    - GET /v1/data_sources/{id}
+    - POST /v1/data_sources/{id}/query (page_size, start_cursor, filter, sorts, filter_properties)
+    - GET /v1/pages/{id}/properties/{property_id} (page_size, start_cursor)
+    - PATCH /v1/pages/{id}
+
+    latency만큼 응답을 지연시키며, rate_limit_every번째 요청마다 429를 반환합니다.
+    """
+
+    def __init__(
+        self,
+        workspace: StubWorkspace,
+        latency: float = 0.0,
+        rate_limit_every: int = 0,
+        retry_after: float = 1.0,
+    ):
+        """
+        :param workspace: 응답에 사용할 워크스페이스
+        :param latency: 요청마다 추가할 지연 시간(초)
+        :param rate_limit_every: N번째 요청마다 429 응답 (0이면 사용하지 않음)
+        :param retry_after: 429 응답의 Retry-After 헤더 값(초)
+        """
+        self.workspace = workspace
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        # (method, endpoint 종류) -> 요청 수
+        self.requests: dict[tuple[str, str], int] = {}
+        self.total_requests = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.total_requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.rate_limit_every and self.total_requests % self.rate_limit_every == 0:
+            return self._error(
+                429,
+                "rate_limited",
+                "Rate limited",
+                headers={"Retry-After": str(self.retry_after)},
+            )
+
+        parts = request.url.path.strip("/").split("/")
+        if parts and parts[0] == "v1":
+            parts = parts[1:]
+        body = json.loads(request.content) if request.content else {}
+        return self.route(request.method, parts, body, request)
+
+    def route(
+        self, method: str, parts: list[str], body: dict, request: httpx.Request
+    ) -> httpx.Response:
+        """경로에 맞는 응답을 생성합니다. 하위 클래스에서 endpoint를 추가할 수 있습니다."""
+        endpoint = "/".join(p if i % 2 == 0 else "{id}" for i, p in enumerate(parts))
+        key = (method, endpoint)
+        self.requests[key] = self.requests.get(key, 0) + 1
+
+        if key == ("GET", "users/{id}"):
+            return self._json({"object": "user", "id": "stub", "type": "bot"})
+        if key == ("GET", "databases/{id}"):
+            data_source = self.workspace.find_database(parts[1])
+            if data_source is None:
+                return self._not_found("database", parts[1])
+            return self._json(data_source.to_database())
+        if key == ("GET", "data_sources/{id}"):
+            data_source = self.workspace.find_data_source(parts[1])
+            if data_source is None:
+                return self._not_found("data_source", parts[1])
+            return self._json(data_source.to_data_source())
+        if key == ("POST", "data_sources/{id}/query"):
+            data_source = self.workspace.find_data_source(parts[1])
+            if data_source is None:
+                return self._not_found("data_source", parts[1])
+            return self._json(self.query(data_source, body, request))
+        if key == ("GET", "pages/{id}/properties/{id}"):
+            found = self.workspace.find_page(parts[1])
+            if found is None:
+                return self._not_found("page", parts[1])
+            return self.property_item(found[1], parts[3], request)
+        if key == ("PATCH", "pages/{id}"):
+            found = self.workspace.find_page(parts[1])
+            if found is None:
+                return self._not_found("page", parts[1])
+            return self._json(self.update_page(found[1], body))
+        return self._error(400, "invalid_request_url", "Invalid request URL.")
+
+    def query(
+        self, data_source: StubDataSource, body: dict, request: httpx.Request
+    ) -> dict:
+        pages = [p for p in data_source.pages if match_filter(p, body.get("filter"))]
+        pages = sort_pages(pages, body.get("sorts"))
+
+        page_size = min(int(body.get("page_size", 100)), 100)
+        start = int(body.get("start_cursor") or 0)
+        end = start + page_size
+        has_more = end < len(pages)
+        results = [truncate_relations(p) for p in pages[start:end]]
+        property_ids = request.url.params.get_list(FILTER_PROPERTIES_PARAM)
+        if property_ids:
+            results = [select_properties(p, property_ids) for p in results]
+        return {
+            "object": "list",
+            "results": results,
+            "next_cursor": str(end) if has_more else None,
+            "has_more": has_more,
+            "type": "page_or_data_source",
+        }
+
+    def property_item(
+        self, page: dict, property_id: str, request: httpx.Request
+    ) -> httpx.Response:
+        """page 속성 하나를 반환합니다. relation 속성은 cursor 기반으로 나누어 반환합니다."""
+        prop = next(
+            (p for p in page["properties"].values() if p["id"] == property_id), None
+        )
+        if prop is None:
+            return self._not_found("property", property_id)
+        if prop["type"] != "relation":
+            return self._json({"object": "property_item", **prop})
+
+        params = request.url.params
+        page_size = min(int(params.get("page_size", MAX_PAGE_SIZE)), MAX_PAGE_SIZE)
+        start = int(params.get("start_cursor") or 0)
+        end = start + page_size
+        has_more = end < len(prop["relation"])
+        return self._json(
+            {
+                "object": "list",
+                "results": [
+                    {
+                        "object": "property_item",
+                        "id": property_id,
+                        "type": "relation",
+                        "relation": relation,
+                    }
+                    for relation in prop["relation"][start:end]
+                ],
+                "next_cursor": str(end) if has_more else None,
+                "has_more": has_more,
+                "type": "property_item",
+                "property_item": {
+                    "id": property_id,
+                    "type": "relation",
+                    "relation": {},
+                },
+            }
+        )
+
+    def update_page(self, page: dict, body: dict) -> dict:
+        for name, value in body.get("properties", {}).items():
+            prop = page["properties"].get(name)
+            if prop is not None:
+                prop.update(value)
+        page["last_edited_time"] = _format_time(datetime.now(timezone.utc))
+        return page
+
+    def _json(self, data: dict, status_code: int = 200, headers=None) -> httpx.Response:
+        return httpx.Response(status_code, json=data, headers=headers)
+
+    def _error(
+        self, status_code: int, code: str, message: str, headers=None
+    ) -> httpx.Response:
+        return self._json(
+            {
+                "object": "error",
+                "status": status_code,
+                "code": code,
+                "message": message,
+            },
+            status_code,
+            headers,
+        )
+
+    def _not_found(self, kind: str, object_id: str) -> httpx.Response:
+        return self._error(
+            404, "object_not_found", f"Could not find {kind} with ID: {object_id}."
+        )
+
+
+def stub_notion(
+    workspace: StubWorkspace,
+    rate: float | None = None,
+    transport: StubTransport | None = None,
+    **transport_options,
+) -> Notion:
+    """
+    stub 워크스페이스에 연결된 Notion 클라이언트를 생성합니다. DB나 네트워크 없이 동작합니다.
+
+    데이터베이스 id와 API key는 환경변수 캐시에만 설정되므로, 같은 프로세스에서 실제 Notion 클라이언트와 함께 사용하지 마십시오.
+
+    :param workspace: 연결할 워크스페이스
+    :type workspace: StubWorkspace
+    :param rate: 초당 요청 수 제한. None이면 Notion과 같은 제한(초당 3회)을 사용
+    :type rate: float | None
+    :param transport: 사용할 transport. 요청 수를 확인하려면 직접 생성하여 넘겨주십시오.
+    :type transport: StubTransport | None
+    :param transport_options: transport가 None일 때 StubTransport에 전달할 옵션 (latency, rate_limit_every, retry_after)
+    :rtype: Notion
+    """
+    cache_env("NOTION_API_KEY", "stub")
+    for data_source in workspace.data_sources():
+        # Notion URL에서 복사한 것처럼 '-' 없는 id를 설정
+        db_id = data_source.database_id.replace("-", "")
+        cache_env(DB_ID_KEYS[data_source.db_type], db_id)
+
+    # client를 바꿔치지 않고 처음부터 stub transport로 생성하여, 사용하지 않는 client가 남지 않도록 함
+    notion = Notion(transport or StubTransport(workspace, **transport_options))
+    if rate is not None:
+        notion.scheduler = RequestScheduler(notion.client, rate=rate)
+    return notion
@@ -0,0 +1,160 @@
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator
+
+from src.services.notion.notion import (
+    DatabaseType,
+    Notion,
+    NotionRecord,
+    RECORD_TYPES,
+)
+from src.services.notion.query import LAST_EDITED_TIME, Query
+from src.utils.env import get_env_async, set_env_async
+
+# Notion의 last_edited_time은 분 단위로 내림되어 기록되므로, 최소 1분 이상 겹쳐서 조회해야 함
+DEFAULT_OVERLAP = timedelta(minutes=2)
+# 증분 조회로 놓친 행(삭제 후 복구, 권한 변경 등)을 보정하기 위한 전체 조회 주기
+DEFAULT_FULL_SCAN_INTERVAL = timedelta(hours=24)
+
+
+def watermark_key(db_type: DatabaseType) -> str:
+    """data source별 마지막 수정 시간 기준점이 저장되는 SystemSetting key"""
+    return f"NOTION_{db_type.name}_WATERMARK"
+
+
+def full_scan_key(db_type: DatabaseType) -> str:
+    """data source별 마지막 전체 조회 시간이 저장되는 SystemSetting key"""
+    return f"NOTION_{db_type.name}_FULL_SCAN_AT"
+
+
+def parse_time(value: str) -> datetime:
+    """Notion의 ISO 8601 시간 문자열(예: 2025-01-01T00:00:00.000Z)을 datetime으로 변환합니다."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def format_time(value: datetime) -> str:
+    """datetime을 Notion filter에 사용할 수 있는 ISO 8601 문자열로 변환합니다."""
+    return value.astimezone(timezone.utc).isoformat(timespec="milliseconds")
+
+
+class IncrementalSync:
+    """
+    last_edited_time을 기준점(watermark)으로 사용하여, 마지막 동기화 이후 수정된 행만 조회합니다.
+
+    기준점은 data source id와 함께 SystemSetting에 저장되며, 조회한 행을 모두 처리한 뒤에만 갱신됩니다.
+    처리 도중 예외가 발생하면 기준점이 갱신되지 않으므로, 다음 조회에서 같은 행을 다시 가져옵니다.
+
+    Example:
+        >>> sync = IncrementalSync(notion_client)
+        >>> async for record in sync.poll(DatabaseType.MEMBER):
+        ...     handle(record)
+    """
+
+    def __init__(
+        self,
+        notion: Notion,
+        overlap: timedelta = DEFAULT_OVERLAP,
+        full_scan_interval: timedelta = DEFAULT_FULL_SCAN_INTERVAL,
+    ):
+        """
+        :param notion: Notion 클라이언트
+        :type notion: Notion
+        :param overlap: 시계 오차와 분 단위 내림을 보정하기 위해 기준점보다 앞당겨 조회할 시간
+        :type overlap: timedelta
+        :param full_scan_interval: 이 시간이 지나면 증분 조회 대신 전체 조회를 수행
+        :type full_scan_interval: timedelta
+        """
+        self.notion = notion
+        self.overlap = overlap
+        self.full_scan_interval = full_scan_interval
+
+    async def load_watermark(
+        self, db_type: DatabaseType, source_id: str
+    ) -> datetime | None:
+        """
+        저장된 기준점을 가져옵니다. 저장된 기준점이 다른 data source의 것이라면 None을 반환합니다.
+
+        :param db_type: 데이터베이스 타입
+        :type db_type: DatabaseType
+        :param source_id: 현재 data source id
+        :type source_id: str
+        :rtype: datetime | None
+        """
+        value = await get_env_async(watermark_key(db_type), use_cache=False)
+        if not value or "|" not in value:
+            return None
+        saved_source, watermark = value.split("|", 1)
+        if saved_source != source_id:
+            return None
+        return parse_time(watermark)
+
+    async def save_watermark(
+        self, db_type: DatabaseType, source_id: str, watermark: datetime
+    ):
+        await set_env_async(
+            watermark_key(db_type), f"{source_id}|{format_time(watermark)}"
+        )
+
+    async def needs_full_scan(self, db_type: DatabaseType) -> bool:
+        """마지막 전체 조회 후 full_scan_interval이 지났다면 True를 반환합니다."""
+        value = await get_env_async(full_scan_key(db_type), use_cache=False)
+        if not value:
+            return True
+        elapsed = datetime.now(timezone.utc) - parse_time(value)
+        return elapsed >= self.full_scan_interval
+
+    def build_payload(self, since: datetime | None) -> dict:
+        """
+        since 이후 수정된 행을 오래된 순으로 조회하는 query body를 생성합니다.
+        since가 None이면 전체 행을 조회합니다.
+
+        :param since: 조회 시작 시간 (overlap이 이미 적용된 값)
+        :type since: datetime | None
+        :rtype: dict
+        """
+        query = Query().sort(LAST_EDITED_TIME.ascending())
+        if since is not None:
+            query.where(LAST_EDITED_TIME.on_or_after(since))
+        return query.build()
+
+    async def poll(
+        self, db_type: DatabaseType, full_scan: bool = False
+    ) -> AsyncIterator[NotionRecord]:
+        """
+        마지막 동기화 이후 수정된 record를 반환합니다.
+        기준점이 없거나, 전체 조회 주기가 지났거나, full_scan이 True라면 전체 record를 반환합니다.
+
+        모든 record를 끝까지 순회해야 기준점이 저장됩니다.
+
+        :param db_type: 조회할 데이터베이스 타입
+        :type db_type: DatabaseType
+        :param full_scan: 강제로 전체 조회를 수행할지 여부
+        :type full_scan: bool
+        """
+        source_id = await self.notion.get_source_id(db_type)
+        watermark = await self.load_watermark(db_type, source_id)
+        full_scan = (
+            full_scan or watermark is None or await self.needs_full_scan(db_type)
+        )
+
+        # 서버 시간을 기준으로 하기 위해, 로컬 시간이 아닌 조회된 행의 last_edited_time 최대값을 기준점으로 사용
+        started_at = datetime.now(timezone.utc)
+        since = None if full_scan else watermark - self.overlap
+        latest = watermark
+
+        property_ids = await self.notion.get_filter_properties(db_type)
+        async for record in self.notion.iter_records(
+            source_id,
+            RECORD_TYPES[db_type],
+            self.build_payload(since),
+            filter_properties=property_ids,
+        ):
+            if record.last_edited_time:
+                edited = parse_time(record.last_edited_time)
+                if latest is None or edited > latest:
+                    latest = edited
+            yield record
+
+        if latest is not None:
+            await self.save_watermark(db_type, source_id, latest)
+        if full_scan:
+            await set_env_async(full_scan_key(db_type), format_time(started_at))
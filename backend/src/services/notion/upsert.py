@@ -0,0 +1,298 @@
+import re
+import uuid
+from datetime import datetime
+from enum import Enum
+from typing import Callable, Iterable
+
+from pydantic import BaseModel
+from sqlalchemy import Column, Table, func, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from src.core.id_index import normalize_notion_id
+from src.core.session_watch import notify_bulk_write
+from src.models.base import Base
+from src.models.event import Event, EventStatus
+from src.models.group import Group, GroupStatus
+from src.models.user import User, UserStatus
+from src.services.notion.notion import (
+    EventRecord,
+    GroupRecord,
+    MemberRecord,
+    NotionRecord,
+)
+from src.utils.constants import Sync
+
+# INSERT 한 번에 보낼 최대 행 수 (PostgreSQL의 parameter 수 제한 65535를 넘지 않도록)
+UPSERT_BATCH_SIZE = 1000
+
+# Sync Status -> db 상태 enum의 이름. 해당 이름이 없는 enum이면 SYNCED를 사용
+SYNC_STATUS_NAMES = {
+    Sync.Writing: "WRITING",
+    Sync.Updating: "UPDATING",
+    Sync.Deleted: "DELETED",
+    Sync.Invited: "INVITED",
+    Sync.Synced: "SYNCED",
+    Sync.Error: "UPDATE_NEEDED",
+    Sync.Update: "UPDATE_NEEDED",
+    Sync.Delete: "DELETE",
+}
+
+
+class UpsertResult(BaseModel):
+    """upsert 결과"""
+
+    # notion_id(하이픈 없음) -> 행 id. relation 연결에 사용
+    ids: dict[str, uuid.UUID] = {}
+    # 새로 추가되었거나 값이 바뀌어 실제로 쓰여진 행 수
+    written: int = 0
+    # 값이 같아 쓰지 않은 행 수
+    unchanged: int = 0
+    # 쓰지 않은 record의 notion_id -> 사유
+    # (시작 시간이 없는 일정, 이름이나 이메일이 비어있거나 다른 행과 겹치는 사용자 등)
+    skipped: dict[str, str] = {}
+
+
+def _status(enum_cls: type[Enum], sync: Sync) -> Enum:
+    name = SYNC_STATUS_NAMES.get(sync, "SYNCED")
+    return enum_cls[name] if name in enum_cls.__members__ else enum_cls.SYNCED
+
+
+def _int_or_none(value: str | int | None) -> int | None:
+    """숫자만 남겨 정수로 변환합니다. (전화번호의 하이픈 등) 숫자가 없으면 None"""
+    digits = re.sub(r"\D", "", str(value or ""))
+    return int(digits) if digits else None
+
+
+def _datetime_or_none(value: str) -> datetime | None:
+    """Notion의 date 값(날짜 혹은 ISO 8601 시간)을 db에 저장되는 서버 시간(timezone 없음)으로 변환합니다."""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def member_row(record: MemberRecord) -> dict:
+    return {
+        "notion_id": normalize_notion_id(record.notion_id),
+        "username": record.name,
+        "email": record.email,
+        "student_id": record.student_id or None,
+        "phone": _int_or_none(record.phone),
+        "discord_id": _int_or_none(record.discord_id),
+        "status": _status(UserStatus, record.status),
+        # 노션에서 가져온 사용자는 비밀번호가 없음. 비밀번호는 insert할 때만 설정됨
+        "hashed_password": "",
+    }
+
+
+def group_row(record: GroupRecord) -> dict:
+    return {
+        "notion_id": normalize_notion_id(record.notion_id),
+        "title": record.name,
+        "description": record.description or None,
+        "discord_id": _int_or_none(record.discord_role_id),
+        "ststus": _status(GroupStatus, record.status),
+    }
+
+
+def event_row(record: EventRecord) -> dict | None:
+    start_time = _datetime_or_none(record.date_start)
+    if start_time is None:
+        return None
+    return {
+        "notion_id": normalize_notion_id(record.notion_id),
+        "title": record.title or record.name,
+        "start_time": start_time,
+        # 종료 시간이 없는 일정은 시작 시간에 끝나는 것으로 저장
+        "end_time": _datetime_or_none(record.date_end) or start_time,
+        "location": record.location or None,
+        "description": record.description or None,
+        "ststus": _status(EventStatus, record.status),
+    }
+
+
+# record 타입 -> (table, 행 변환 함수)
+ROW_MAPPERS: dict[type[NotionRecord], tuple[type[Base], Callable[..., dict | None]]] = {
+    MemberRecord: (User, member_row),
+    GroupRecord: (Group, group_row),
+    EventRecord: (Event, event_row),
+}
+
+# insert할 때만 쓰고, 이미 존재하는 행에는 덮어쓰지 않는 컬럼
+INSERT_ONLY = {"id", "notion_id", "hashed_password"}
+
+
+def _insert(db: Session, model: type[Base]):
+    """session의 dialect에 맞는 INSERT ... ON CONFLICT 구문을 반환합니다."""
+    if db.get_bind().dialect.name == "sqlite":
+        # 로컬 테스트와 벤치마크용
+        return sqlite.insert(model.__table__)
+    return postgresql.insert(model.__table__)
+
+
+def _unique_columns(table: Table) -> list[Column]:
+    """notion_id 외에 unique 제약이 있는 컬럼 (username, email, title, discord_id 등)"""
+    return [
+        column
+        for column in table.columns
+        if column.unique and not column.primary_key and column.name != "notion_id"
+    ]
+
+
+def _check_rows(
+    db: Session, model: type[Base], rows: list[dict], result: UpsertResult
+) -> list[dict]:
+    """
+    INSERT 하기 전에 제약 조건을 위반하는 행을 걸러내어 result.skipped에 기록합니다.
+    ON CONFLICT는 notion_id의 충돌만 처리하므로, 다른 unique 컬럼이 겹치거나 필수 값이 없는 행이
+    하나라도 있으면 batch 전체가 실패하기 때문입니다.
+
+    - 컬럼 길이를 넘는 문자열
+    - 비어있는 필수 unique 값 (이름, 이메일 등)
+    - 앞선 행이나, notion_id가 다른 기존 행과 겹치는 unique 값
+
+    :return: 쓸 수 있는 행 목록
+    """
+    table = model.__table__
+    unique_columns = _unique_columns(table)
+
+    def reject(row: dict) -> str | None:
+        for key, value in row.items():
+            length = getattr(table.c[key].type, "length", None)
+            if isinstance(value, str) and length and len(value) > length:
+                return f"{key}의 길이가 {length}자를 넘음"
+        for column in unique_columns:
+            if not column.nullable and row.get(column.name) in (None, ""):
+                return f"{column.name} 값이 없음"
+        return None
+
+    valid = []
+    for row in rows:
+        reason = reject(row)
+        if reason is None:
+            valid.append(row)
+        else:
+            result.skipped[row["notion_id"]] = reason
+
+    # unique 값 -> 그 값을 가진 행의 notion_id. 이미 db에 있는 값을 컬럼마다 쿼리 한 번으로 조회
+    owners: dict[str, dict] = {}
+    for column in unique_columns:
+        values = {row[column.name] for row in valid if row.get(column.name) is not None}
+        owners[column.name] = (
+            dict(
+                db.execute(
+                    select(column, table.c.notion_id).where(column.in_(values))
+                ).all()
+            )
+            if values
+            else {}
+        )
+
+    # 앞선 행이나 notion_id가 다른 기존 행과 값이 겹치는 행은 제외
+    kept = []
+    for row in valid:
+        notion_id = row["notion_id"]
+        conflict = None
+        for key, values in owners.items():
+            owner = values.get(row.get(key), notion_id)
+            if owner != notion_id:
+                conflict = f"{key} 값이 {owner}와 겹침"
+                break
+        if conflict is not None:
+            result.skipped[notion_id] = conflict
+            continue
+        for key, values in owners.items():
+            if row.get(key) is not None:
+                values[row[key]] = notion_id
+        kept.append(row)
+    return kept
+
+
+def _upsert_batch(
+    db: Session, model: type[Base], rows: list[dict], result: UpsertResult
+):
+    table = model.__table__
+    rows = _check_rows(db, model, rows, result)
+    if not rows:
+        return
+    stmt = _insert(db, model)
+    columns = [key for key in rows[0] if key not in INSERT_ONLY]
+    # 값이 바뀐 컬럼이 있는 행만 update하여, 바뀌지 않은 행의 updated_at은 유지됨
+    # (ON CONFLICT DO UPDATE에는 onupdate가 적용되지 않으므로 updated_at을 직접 갱신)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.notion_id],
+        set_={
+            **{key: stmt.excluded[key] for key in columns},
+            "updated_at": func.now(),
+        },
+        where=or_(
+            *(table.c[key].is_distinct_from(stmt.excluded[key]) for key in columns)
+        ),
+    ).returning(*table.columns)
+
+    # 행 목록을 parameter로 넘기면 구문은 한 번만 compile되고,
+    # SQLAlchemy가 여러 행을 묶은 INSERT ... VALUES (insertmanyvalues)로 전송함
+    written_rows = [dict(row) for row in db.execute(stmt, rows).mappings()]
+    written = {row["notion_id"]: row["id"] for row in written_rows}
+    result.ids.update(written)
+    result.written += len(written)
+    # orm을 거치지 않았으므로, session을 watch 중인 IdIndex, ReminderScheduler 등에 직접 알림
+    notify_bulk_write(db, model, written_rows)
+
+    # 바뀌지 않은 행은 RETURNING에 포함되지 않으므로 id만 따로 조회
+    unchanged = [row["notion_id"] for row in rows if row["notion_id"] not in written]
+    if unchanged:
+        result.unchanged += len(unchanged)
+        for notion_id, id in db.execute(
+            select(table.c.notion_id, table.c.id).where(
+                table.c.notion_id.in_(unchanged)
+            )
+        ):
+            result.ids[notion_id] = id
+
+
+def upsert_records(
+    db: Session,
+    records: Iterable[NotionRecord],
+    batch_size: int = UPSERT_BATCH_SIZE,
+) -> UpsertResult:
+    """
+    Notion record를 notion_id 기준으로 users, groups, events table에 한꺼번에 upsert합니다.
+    orm 객체를 만들지 않고, batch_size개씩 INSERT ... ON CONFLICT (notion_id) DO UPDATE 한 번으로 씁니다.
+    값이 바뀌지 않은 행은 update하지 않습니다. commit은 호출한 쪽에서 합니다.
+    notion_id 외의 unique 제약(이메일, 이름 등)을 위반하는 행은 쓰지 않고 result.skipped에 사유와 함께 기록합니다.
+
+    orm을 거치지 않으므로 session의 flush 이벤트에는 나타나지 않지만, session을 watch 중인
+    IdIndex, ReminderScheduler에는 쓰여진 행이 전달되어 commit될 때 함께 반영됩니다.
+    watch 중이 아니라면 commit 후 id_index.load(db), scheduler.rebuild()를 호출하십시오.
+
+    :param db: DB Session
+    :param records: MemberRecord, GroupRecord, EventRecord 목록. 여러 타입이 섞여 있어도 됩니다.
+    :param batch_size: INSERT 한 번에 보낼 최대 행 수
+    :return: notion_id -> 행 id와 쓰여진 행 수
+    :raises KeyError: 지원하지 않는 record 타입인 경우
+    """
+    # table별로 모으고, 같은 notion_id가 여러 번 있으면 마지막 record를 사용
+    # (한 INSERT 안에서 같은 행을 두 번 update할 수 없음)
+    result = UpsertResult()
+    rows_by_model: dict[type[Base], dict[str, dict]] = {}
+    for record in records:
+        model, to_row = ROW_MAPPERS[type(record)]
+        row = to_row(record)
+        if row is None:
+            result.skipped[record.notion_id] = "필수 값이 없음"
+            continue
+        rows_by_model.setdefault(model, {})[row["notion_id"]] = row
+
+    for model, rows in rows_by_model.items():
+        rows = list(rows.values())
+        for i in range(0, len(rows), batch_size):
+            batch = rows[i : i + batch_size]
+            # INSERT 될 경우를 위해 id를 미리 생성. 이미 존재하는 행은 기존 id가 유지됨
+            for row in batch:
+                row.setdefault("id", uuid.uuid4())
+            _upsert_batch(db, model, batch, result)
+    return result
@@ -0,0 +1,135 @@
+import asyncio
+
+import httpx
+from pydantic import BaseModel
+
+from src.services.notion.notion import Notion
+from src.utils.constants import Sync
+
+# Notion rich_text 객체 하나에 담을 수 있는 최대 글자 수
+MAX_TEXT_LENGTH = 2000
+
+
+def select_value(name: str) -> dict:
+    """select 속성 값"""
+    return {"select": {"name": name}}
+
+
+def rich_text_value(text: str) -> dict:
+    """rich_text 속성 값. Notion의 글자 수 제한을 넘는 부분은 잘라냅니다."""
+    return {
+        "rich_text": [{"type": "text", "text": {"content": text[:MAX_TEXT_LENGTH]}}]
+    }
+
+
+class WriteBackResult(BaseModel):
+    """page 하나에 대한 write-back 결과"""
+
+    page_id: str
+    ok: bool
+    # 전송한 속성 이름 목록
+    properties: list[str]
+    error: str = ""
+
+
+class WriteBackQueue:
+    """
+    Notion page 속성 수정을 모아두었다가, page마다 하나의 PATCH 요청으로 합쳐서 보내는 큐입니다.
+
+    같은 page의 같은 속성이 여러 번 수정되면 마지막 값만 전송됩니다.
+    예를 들어 Sync Status를 Updating -> Synced로 바꾸고 Log를 남기면, flush 시 PATCH 한 번으로 처리됩니다.
+    요청은 Notion 클라이언트의 scheduler를 거치므로 요청 제한에 맞춰 전송됩니다.
+
+    Example:
+        >>> queue = WriteBackQueue(notion_client)
+        >>> queue.set_sync_status(record.notion_id, Sync.Updating)
+        >>> queue.set_sync_status(record.notion_id, Sync.Synced)
+        >>> queue.set_log(record.notion_id, "동기화 완료")
+        >>> results = await queue.flush()
+    """
+
+    def __init__(self, notion: Notion, concurrency: int = 3):
+        """
+        :param notion: Notion 클라이언트
+        :type notion: Notion
+        :param concurrency: 동시에 전송할 최대 PATCH 요청 수
+        :type concurrency: int
+        """
+        self.notion = notion
+        self.concurrency = concurrency
+        # page id -> 속성 이름 -> 속성 값
+        self._pending: dict[str, dict[str, dict]] = {}
+
+    def __len__(self) -> int:
+        """전송 대기 중인 page 수"""
+        return len(self._pending)
+
+    def update(self, page_id: str, properties: dict):
+        """
+        page 속성 수정을 큐에 추가합니다. 이미 대기 중인 수정이 있다면 합칩니다.
+
+        :param page_id: 수정할 page id
+        :type page_id: str
+        :param properties: 속성 이름 -> Notion 속성 값
+        :type properties: dict
+        """
+        self._pending.setdefault(page_id, {}).update(properties)
+
+    def set_sync_status(self, page_id: str, status: Sync):
+        """Sync Status 속성 수정을 큐에 추가합니다."""
+        self.update(page_id, {"Sync Status": select_value(status.value[0])})
+
+    def set_log(self, page_id: str, log: str):
+        """Log 속성 수정을 큐에 추가합니다."""
+        self.update(page_id, {"Log": rich_text_value(log)})
+
+    async def _send(
+        self, semaphore: asyncio.Semaphore, page_id: str, properties: dict
+    ) -> WriteBackResult:
+        async with semaphore:
+            try:
+                await self.notion.update_page(page_id, properties)
+            except httpx.HTTPStatusError as e:
+                error = f"{e.response.status_code} - {e.response.text}"
+            except httpx.RequestError as e:
+                error = str(e)
+            else:
+                return WriteBackResult(
+                    page_id=page_id, ok=True, properties=list(properties)
+                )
+        return WriteBackResult(
+            page_id=page_id, ok=False, properties=list(properties), error=error
+        )
+
+    async def flush(self, requeue_failed: bool = False) -> list[WriteBackResult]:
+        """
+        대기 중인 모든 수정을 page마다 하나의 PATCH 요청으로 전송합니다.
+        전송 중에 추가된 수정은 다음 flush에서 전송됩니다.
+
+        :param requeue_failed: True면 전송에 실패한 수정을 다시 큐에 넣습니다.
+            그 사이 같은 속성에 새로운 값이 들어왔다면 새로운 값을 유지합니다.
+        :type requeue_failed: bool
+        :return: page별 전송 결과
+        :rtype: list[WriteBackResult]
+        """
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return []
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results = await asyncio.gather(
+            *(
+                self._send(semaphore, page_id, properties)
+                for page_id, properties in pending.items()
+            )
+        )
+
+        if requeue_failed:
+            for result in results:
+                if not result.ok:
+                    newer = self._pending.get(result.page_id, {})
+                    self._pending[result.page_id] = {
+                        **pending[result.page_id],
+                        **newer,
+                    }
+        return results
@@ -0,0 +1,150 @@
+import asyncio
+import uuid
+
+import discord
+from pydantic import BaseModel
+from sqlalchemy import update
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.core.database import SessionLocal
+from src.models.group import Group
+from src.services.discord import Discord
+from src.utils.constants import Color
+
+
+class ProvisionResult(BaseModel):
+    """그룹 하나의 디스코드 리소스 생성 결과"""
+
+    group_id: str
+    ok: bool
+    role_id: int | None = None
+    category_id: int | None = None
+    channel_id: int | None = None
+    # 이번에 새로 만든 리소스 (role, category, channel)
+    created: list[str] = []
+    error: str = ""
+
+
+class GroupProvisioner:
+    """
+    그룹의 디스코드 리소스를 만드는 pipeline입니다.
+
+    그룹마다 역할 -> 카테고리(해당 역할만 접근 가능) -> 텍스트 채널 순서로 만들고, 만든 id를 그룹 행에 저장합니다.
+    여러 그룹은 동시에 진행하며, 그룹 하나의 단계는 항상 순서대로 진행합니다.
+
+    리소스를 만들 때마다 id를 별도 session으로 바로 commit하므로(별도 thread에서 실행),
+    프로세스가 중간에 종료되어도 이미 만든 리소스의 id는 db에 남습니다.
+    db에 id가 있고 길드에도 아직 존재하는 리소스는 다시 만들지 않으므로,
+    중간에 실패한 그룹은 다시 실행하면 남은 단계만 진행합니다.
+
+    Example:
+        >>> provisioner = GroupProvisioner(discord_client)
+        >>> results = await provisioner.provision(groups)
+    """
+
+    def __init__(
+        self,
+        discord: Discord,
+        concurrency: int = 5,
+        session_factory: sessionmaker = SessionLocal,
+    ):
+        """
+        :param discord: Discord 클라이언트
+        :param concurrency: 동시에 진행할 그룹 수
+        :param session_factory: 만든 id를 저장할 db session 생성 함수
+        """
+        self.discord = discord
+        self.concurrency = concurrency
+        self.session_factory = session_factory
+
+    def _save(self, group_id: uuid.UUID, values: dict):
+        with self.session_factory() as db:
+            db.execute(update(Group).where(Group.id == group_id).values(**values))
+            db.commit()
+
+    async def _record(self, group: Group, **values):
+        """
+        만든 리소스의 id를 db에 바로 저장하고 그룹 객체에도 기록합니다.
+        그룹 객체가 속한 session은 이미 저장된 값으로 보고 다시 쓰지 않습니다.
+
+        :param group: 그룹
+        :param values: 컬럼 이름 -> 값
+        """
+        await asyncio.to_thread(self._save, group.id, values)
+        for key, value in values.items():
+            set_committed_value(group, key, value)
+
+    async def provision_group(self, group: Group) -> ProvisionResult:
+        """
+        그룹 하나의 역할, 카테고리, 채널을 만듭니다. 만든 id는 바로 db와 그룹 객체에 기록합니다.
+
+        :param group: 그룹
+        :return: 결과
+        """
+        result = ProvisionResult(group_id=str(group.id), ok=False)
+        try:
+            guild = await self.discord.get_guild()
+
+            # 1. 역할
+            role = guild.get_role(group.discord_id) if group.discord_id else None
+            if role is None:
+                color = group.color or Color.BASIC
+                role = await self.discord.create_role(
+                    name=group.title, color=color.discord_color
+                )
+                await self._record(group, discord_id=role.id)
+                result.created.append("role")
+            result.role_id = role.id
+
+            # 2. 카테고리. 방금 만든 역할은 길드 캐시에 없을 수 있으므로 역할 객체로 권한을 지정
+            category = (
+                guild.get_channel(group.category_id) if group.category_id else None
+            )
+            if not isinstance(category, discord.CategoryChannel):
+                category = await guild.create_category(
+                    name=group.title,
+                    overwrites={
+                        guild.default_role: discord.PermissionOverwrite(
+                            view_channel=False
+                        ),
+                        role: discord.PermissionOverwrite(view_channel=True),
+                    },
+                )
+                await self._record(group, category_id=category.id)
+                result.created.append("category")
+            elif "role" in result.created:
+                # 역할을 새로 만들었다면 기존 카테고리에 접근 권한을 추가
+                await category.set_permissions(role, view_channel=True)
+            result.category_id = category.id
+
+            # 3. 채널. 카테고리에 텍스트 채널이 이미 있다면 만들지 않음
+            channel = category.text_channels[0] if category.text_channels else None
+            if channel is None:
+                channel = await guild.create_text_channel(
+                    name=group.title, category=category
+                )
+                result.created.append("channel")
+            result.channel_id = channel.id
+
+            result.ok = True
+        except Exception as e:
+            print(f"Failed to provision group {group.title}: {e}")
+            result.error = str(e)
+        return result
+
+    async def provision(self, groups: list[Group]) -> list[ProvisionResult]:
+        """
+        여러 그룹의 디스코드 리소스를 동시에 만들고, 만든 id를 db에 저장합니다.
+        일부 그룹이 실패하거나 작업이 취소되어도 성공한 단계의 id는 이미 저장되어 있으므로 다시 실행할 때 이어서 진행합니다.
+
+        :param groups: 그룹 목록
+        :return: 그룹별 결과
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(group: Group) -> ProvisionResult:
+            async with semaphore:
+                return await self.provision_group(group)
+
+        return await asyncio.gather(*(run(group) for group in groups))
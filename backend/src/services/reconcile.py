@@ -0,0 +1,149 @@
+from typing import TYPE_CHECKING
+
+from discord.guild import Guild
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.models.assiciation import user_group_association
+from src.models.group import Group
+from src.models.user import User, UserStatus
+from src.services.discord_roles import RoleSyncResult, plan_roles
+
+if TYPE_CHECKING:
+    from src.services.discord import Discord
+
+# 비교하지 않는 사용자 상태
+IGNORED_STATUSES = (UserStatus.DELETE, UserStatus.DELETED)
+
+
+class RoleDrift(BaseModel):
+    """멤버 한 명의 역할 차이"""
+
+    user_id: int
+    # db에는 있지만 길드 멤버에게 없는 역할
+    missing: list[int] = []
+    # db에는 없지만 길드 멤버에게 있는 역할 (동기화 대상 역할만)
+    extra: list[int] = []
+
+
+class MembershipDiff(BaseModel):
+    """길드 멤버와 db 사용자의 차이"""
+
+    # 길드에는 있지만 db에 연결된 사용자가 없는 멤버 (봇 제외)
+    unknown_members: list[int] = []
+    # db에는 연결되어 있지만 길드에 없는 사용자
+    missing_members: list[int] = []
+    role_drift: list[RoleDrift] = []
+    # 비교한 길드 멤버 수 / db 사용자 수
+    guild_count: int = 0
+    db_count: int = 0
+
+    @property
+    def in_sync(self) -> bool:
+        return not (self.unknown_members or self.missing_members or self.role_drift)
+
+
+def load_db_roles(db: Session) -> tuple[dict[int, set[int]], set[int]]:
+    """
+    db에서 디스코드 사용자별로 가져야 하는 역할을 읽습니다. orm 객체 없이 필요한 컬럼만 쿼리 세 번으로 조회합니다.
+
+    :param db: DB Session
+    :return: (디스코드 사용자 ID -> 역할 ID 목록, 동기화 대상 역할 ID 목록(모든 그룹의 역할))
+    """
+    desired: dict[int, set[int]] = {
+        discord_id: set()
+        for discord_id in db.scalars(
+            select(User.discord_id).where(
+                User.discord_id.is_not(None), User.status.not_in(IGNORED_STATUSES)
+            )
+        )
+    }
+    rows = db.execute(
+        select(User.discord_id, Group.discord_id)
+        .join(user_group_association, user_group_association.c.user_id == User.id)
+        .join(Group, Group.id == user_group_association.c.group_id)
+        .where(User.discord_id.is_not(None), Group.discord_id.is_not(None))
+    )
+    for user_discord_id, role_id in rows:
+        if user_discord_id in desired:
+            desired[user_discord_id].add(role_id)
+    managed = set(
+        db.scalars(select(Group.discord_id).where(Group.discord_id.is_not(None)))
+    )
+    return desired, managed
+
+
+async def scan_guild(guild: Guild, managed: set[int]) -> dict[int, set[int]]:
+    """
+    길드 멤버 전체를 REST API로 1000명씩 나누어 받으며, 동기화 대상 역할만 남긴 index를 만듭니다.
+
+    :param guild: 길드
+    :param managed: 동기화 대상 역할 ID 목록
+    :return: 디스코드 사용자 ID -> 동기화 대상 역할 ID 목록 (봇 제외)
+    """
+    current: dict[int, set[int]] = {}
+    async for member in guild.fetch_members(limit=None):
+        if member.bot:
+            continue
+        current[member.id] = {role.id for role in member.roles} & managed
+    return current
+
+
+def diff_membership(
+    current: dict[int, set[int]],
+    desired: dict[int, set[int]],
+    managed: set[int],
+) -> MembershipDiff:
+    """
+    길드 멤버의 역할과 db의 역할을 비교합니다.
+
+    :param current: 디스코드 사용자 ID -> 길드 멤버의 현재 역할 ID 목록
+    :param desired: 디스코드 사용자 ID -> db 기준으로 가져야 하는 역할 ID 목록
+    :param managed: 동기화 대상 역할 ID 목록. 이 목록에 없는 역할은 비교하지 않습니다.
+    :return: 차이
+    """
+    diff = MembershipDiff(
+        unknown_members=sorted(current.keys() - desired.keys()),
+        missing_members=sorted(desired.keys() - current.keys()),
+        guild_count=len(current),
+        db_count=len(desired),
+    )
+    for user_id in sorted(current.keys() & desired.keys()):
+        added, removed = plan_roles(current[user_id], desired[user_id], managed)
+        if added or removed:
+            diff.role_drift.append(
+                RoleDrift(user_id=user_id, missing=sorted(added), extra=sorted(removed))
+            )
+    return diff
+
+
+async def reconcile_members(
+    discord: "Discord",
+    db: Session,
+    apply: bool = False,
+    guild_id: int = None,
+) -> tuple[MembershipDiff, list[RoleSyncResult]]:
+    """
+    길드 멤버와 db 사용자(users, user_group_association)를 한 번에 비교합니다.
+    fetch_member를 사용자마다 호출하지 않고, 길드 멤버 목록을 한 번 훑어 양쪽의 set을 비교합니다.
+
+    :param discord: Discord 클라이언트
+    :param db: DB Session
+    :param apply: True면 역할 차이를 sync_roles로 한 번에 반영합니다. (unknown/missing 멤버는 보고만 함)
+    :param guild_id: 길드 ID
+    :return: (차이, 역할 반영 결과)
+    """
+    desired, managed = load_db_roles(db)
+    guild = await discord.get_guild(guild_id)
+    current = await scan_guild(guild, managed)
+    diff = diff_membership(current, desired, managed)
+
+    results = []
+    if apply and diff.role_drift:
+        results = await discord.sync_roles(
+            {d.user_id: desired[d.user_id] for d in diff.role_drift},
+            managed=managed,
+            guild_id=guild_id,
+        )
+    return diff, results
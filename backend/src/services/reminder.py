@@ -0,0 +1,385 @@
+import asyncio
+import heapq
+import itertools
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.core.database import SessionLocal
+from src.core.repository import Profile, list_events
+from src.core.session_watch import SessionWatcher
+from src.models.base import Base
+from src.models.event import Event, EventStatus
+from src.utils.env import get_env_async
+
+if TYPE_CHECKING:
+    from discord.ext import commands
+
+    from src.services.discord import Discord
+
+# 일정 시작 전 알림을 보낼 시점
+REMINDER_OFFSETS = (timedelta(days=1), timedelta(hours=1))
+# 재시작 등으로 알림 시간을 놓친 경우, 이 시간 안이라면 늦게라도 알림을 보냄
+REMINDER_GRACE = timedelta(minutes=10)
+# 알림을 보내지 않는 일정 상태
+INACTIVE_STATUSES = (EventStatus.DELETE, EventStatus.DELETED)
+# 취소된 알림이 heap의 절반을 넘으면 heap을 다시 만듦
+COMPACT_RATIO = 0.5
+
+
+def _timestamp(value: datetime) -> float:
+    """db의 시간(timezone 없음, 서버 시간 기준)을 timestamp로 변환합니다."""
+    return value.timestamp()
+
+
+def format_offset(offset: timedelta) -> str:
+    """알림 시점을 '1일', '1시간', '30분' 형식으로 변환합니다."""
+    minutes = int(offset.total_seconds() // 60)
+    if minutes % (60 * 24) == 0:
+        return f"{minutes // (60 * 24)}일"
+    if minutes % 60 == 0:
+        return f"{minutes // 60}시간"
+    return f"{minutes}분"
+
+
+def build_reminder(event: Event, offset: timedelta) -> str:
+    """
+    일정 알림 메시지를 만듭니다. 일정에 할당된 사용자와 그룹을 멘션합니다.
+
+    :param event: users, groups가 로드된 일정
+    :param offset: 일정 시작까지 남은 시간
+    :return: 메시지 내용
+    """
+    mentions = [f"<@&{g.discord_id}>" for g in event.groups if g.discord_id]
+    mentions += [f"<@{u.discord_id}>" for u in event.users if u.discord_id]
+    lines = [
+        f"📅 **{event.title}** 일정이 {format_offset(offset)} 후 시작됩니다.",
+        f"- 시작: {event.start_time:%Y-%m-%d %H:%M}",
+    ]
+    if event.location:
+        lines.append(f"- 장소: {event.location}")
+    if mentions:
+        lines.append(" ".join(mentions))
+    return "\n".join(lines)
+
+
+class ReminderScheduler(SessionWatcher):
+    """
+    일정 시작 전에 관련된 사용자와 그룹을 멘션하는 알림을 보내는 스케줄러입니다.
+
+    앞으로의 일정을 db에서 한 번에 읽어 알림 시간 순서의 heap에 넣고,
+    가장 가까운 알림 시간까지 잠들었다가 깨어나서 알림을 보냅니다. (주기적으로 db를 조회하지 않음)
+    heap에는 (알림 시간, 순번, 버전, 일정 id, 알림 시점)만 저장하며, 사용자와 그룹은 알림을 보낼 때 조회합니다.
+    일정이 바뀌면 버전을 올려 이전 알림을 무효화하고 새로운 알림을 추가합니다.
+
+    재시작하면 db에서 heap을 다시 만들며, REMINDER_GRACE 안에 놓친 알림은 늦게라도 보냅니다.
+    watch한 session에서 commit된 일정 변경은 자동으로 다시 예약됩니다. (SessionWatcher)
+    Discord 클라이언트는 봇이 준비되면(on_ready) 알림 루프를 시작합니다. (attach)
+
+    Example:
+        >>> scheduler = ReminderScheduler(discord_client)
+        >>> scheduler.watch(db)
+        >>> scheduler.start()
+    """
+
+    def __init__(
+        self,
+        discord: "Discord",
+        session_factory: sessionmaker = SessionLocal,
+        offsets: tuple[timedelta, ...] = REMINDER_OFFSETS,
+        channel_id: int = None,
+    ):
+        """
+        :param discord: 알림을 보낼 Discord 클라이언트
+        :param session_factory: db session 생성 함수
+        :param offsets: 일정 시작 전 알림을 보낼 시점 목록
+        :param channel_id: 알림을 보낼 채널 ID. 없으면 환경변수 DISCORD_REMINDER_CHANNEL_ID를 사용
+        """
+        super().__init__()
+        self.discord = discord
+        self.session_factory = session_factory
+        self.offsets = offsets
+        self.channel_id = channel_id
+        # (알림 시간, 순번, 버전, 일정 id, 알림 시점)
+        self._heap: list[tuple[float, int, int, uuid.UUID, timedelta]] = []
+        # 일정 id -> 현재 버전. heap의 버전이 다르면 취소된 알림
+        self._versions: dict[uuid.UUID, int] = {}
+        # 일정 id -> heap에 남아있는 현재 버전의 알림 수
+        self._live: dict[uuid.UUID, int] = {}
+        self._counter = itertools.count()
+        self._stale = 0
+        self._wakeup = asyncio.Event()
+        # flush 시점에 시작 시간이나 상태가 로드되어 있지 않아, db에서 다시 읽어야 하는 일정 id
+        self._refresh: set[uuid.UUID] = set()
+        self._task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        """예약된 알림 수 (취소된 알림 제외)"""
+        return len(self._heap) - self._stale
+
+    def rebuild(self, db: Session = None) -> int:
+        """
+        db에서 앞으로의 일정을 읽어 heap을 다시 만듭니다. 일정 id와 시작 시간만 조회합니다.
+        이벤트 루프 안에서는 쿼리가 루프를 막지 않도록 rebuild_async를 사용하십시오.
+
+        :param db: DB Session. 없으면 새로 생성합니다.
+        :return: 예약된 알림 수
+        """
+        return self._reset(self._load_upcoming(db))
+
+    async def rebuild_async(self) -> int:
+        """rebuild와 같지만, 쿼리는 별도 thread에서 실행합니다. heap은 이벤트 루프에서 다시 만듭니다."""
+        return self._reset(await asyncio.to_thread(self._load_upcoming))
+
+    def _load_events(
+        self, event_ids: set[uuid.UUID]
+    ) -> list[tuple[uuid.UUID, datetime, EventStatus]]:
+        """일정의 (id, 시작 시간, 상태)를 조회합니다. 삭제된 일정은 결과에 없습니다."""
+        with self.session_factory() as db:
+            return db.execute(
+                select(Event.id, Event.start_time, Event.ststus).where(
+                    Event.id.in_(event_ids)
+                )
+            ).all()
+
+    async def _refresh_pending(self):
+        """변경된 값을 알 수 없었던 일정을 db에서 다시 읽어 예약합니다."""
+        event_ids, self._refresh = self._refresh, set()
+        rows = await asyncio.to_thread(self._load_events, event_ids)
+        for event_id, start_time, status in rows:
+            event_ids.discard(event_id)
+            self.schedule(event_id, start_time, status not in INACTIVE_STATUSES)
+        for event_id in event_ids:
+            self.cancel(event_id)
+
+    def _load_upcoming(self, db: Session = None) -> list[tuple[uuid.UUID, datetime]]:
+        """알림을 보내야 하는 일정의 (id, 시작 시간) 목록을 조회합니다."""
+        own = db is None
+        db = db or self.session_factory()
+        try:
+            since = datetime.now() - REMINDER_GRACE + min(self.offsets)
+            return db.execute(
+                select(Event.id, Event.start_time).where(
+                    Event.start_time >= since, Event.ststus.not_in(INACTIVE_STATUSES)
+                )
+            ).all()
+        finally:
+            if own:
+                db.close()
+
+    def _reset(self, rows: list[tuple[uuid.UUID, datetime]]) -> int:
+        self._heap.clear()
+        self._versions.clear()
+        self._live.clear()
+        self._stale = 0
+        for event_id, start_time in rows:
+            self._heap.extend(self._entries(event_id, start_time))
+        heapq.heapify(self._heap)
+        self._wakeup.set()
+        return len(self._heap)
+
+    def _entries(self, event_id: uuid.UUID, start_time: datetime) -> list[tuple]:
+        """일정 하나의 heap 항목을 만듭니다. 이미 지난 알림은 제외합니다."""
+        version = self._versions.get(event_id, 0)
+        start = _timestamp(start_time)
+        now = time.time()
+        entries = []
+        for offset in self.offsets:
+            due = start - offset.total_seconds()
+            if due + REMINDER_GRACE.total_seconds() >= now:
+                entries.append((due, next(self._counter), version, event_id, offset))
+        if entries:
+            self._live[event_id] = self._live.get(event_id, 0) + len(entries)
+        return entries
+
+    def cancel(self, event_id: uuid.UUID):
+        """
+        일정의 예약된 알림을 모두 취소합니다. heap에서 바로 제거하지 않고 꺼낼 때 건너뜁니다.
+
+        :param event_id: 일정 id
+        """
+        self._stale += self._live.pop(event_id, 0)
+        self._versions[event_id] = self._versions.get(event_id, 0) + 1
+        if self._stale > len(self._heap) * COMPACT_RATIO:
+            self._compact()
+
+    def schedule(
+        self, event_id: uuid.UUID, start_time: datetime | None, active: bool = True
+    ):
+        """
+        일정이 추가되거나 바뀌었을 때 알림을 다시 예약합니다.
+
+        :param event_id: 일정 id
+        :param start_time: 일정 시작 시간
+        :param active: False면 알림을 취소만 합니다. (삭제된 일정 등)
+        """
+        self.cancel(event_id)
+        if active and start_time is not None:
+            for entry in self._entries(event_id, start_time):
+                heapq.heappush(self._heap, entry)
+        self._wakeup.set()
+
+    def _compact(self):
+        self._heap = [e for e in self._heap if self._versions.get(e[3], 0) == e[2]]
+        heapq.heapify(self._heap)
+        self._stale = 0
+        # heap에 취소된 알림이 남아있지 않으므로, 알림이 없는 일정의 버전은 지워도 됨
+        self._versions = {k: v for k, v in self._versions.items() if k in self._live}
+
+    def _pop_due(self) -> tuple[float | None, list[tuple[uuid.UUID, timedelta]]]:
+        """
+        알림 시간이 지난 알림을 꺼냅니다.
+
+        :return: (다음 알림까지 남은 시간(초), 보낼 알림 목록)
+        """
+        now = time.time()
+        due = []
+        while self._heap:
+            at, _, version, event_id, offset = self._heap[0]
+            if self._versions.get(event_id, 0) != version:
+                heapq.heappop(self._heap)
+                self._stale -= 1
+                continue
+            if at > now:
+                return at - now, due
+            heapq.heappop(self._heap)
+            self._live[event_id] -= 1
+            if not self._live[event_id]:
+                del self._live[event_id]
+            due.append((event_id, offset))
+        return None, due
+
+    async def run(self):
+        """알림 루프를 실행합니다. db에서 heap을 만든 뒤, 다음 알림 시간까지 잠들기를 반복합니다."""
+        await self.rebuild_async()
+        while True:
+            self._wakeup.clear()
+            if self._refresh:
+                try:
+                    await self._refresh_pending()
+                except Exception as e:
+                    print(f"Failed to refresh reminders: {e}")
+            timeout, due = self._pop_due()
+            if due:
+                try:
+                    await self.send(due)
+                except Exception as e:
+                    print(f"Failed to send reminders: {e}")
+                continue
+            try:
+                # 새로운 일정이 예약되면 깨어나 다음 알림 시간을 다시 계산
+                # wait_for는 이벤트와 취소가 동시에 발생하면 취소를 무시할 수 있으므로 timeout을 사용
+                async with asyncio.timeout(timeout):
+                    await self._wakeup.wait()
+            except TimeoutError:
+                pass
+
+    def attach(self, bot: "commands.Bot"):
+        """
+        봇이 준비되면(on_ready) 알림 루프를 시작하도록 listener를 등록합니다.
+        알림은 봇으로 보내므로, gateway에 연결되기 전에는 시작하지 않습니다.
+
+        :param bot: 이벤트를 받을 봇
+        """
+        bot.add_listener(self.on_ready, "on_ready")
+
+    async def on_ready(self):
+        self.start()
+
+    def start(self):
+        """background에서 알림 루프를 시작합니다. 이미 실행 중이면 아무것도 하지 않습니다."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def send(self, due: list[tuple[uuid.UUID, timedelta]]):
+        """
+        알림을 보냅니다.
+
+        :param due: (일정 id, 알림 시점) 목록
+        """
+        channel_id = self.channel_id or int(
+            await get_env_async("DISCORD_REMINDER_CHANNEL_ID")
+        )
+        # 쿼리는 이벤트 루프를 막지 않도록 별도 thread에서 실행하고, 메시지는 이벤트 루프에서 보냄
+        for content in await asyncio.to_thread(self._build_reminders, due):
+            self.discord.queue_message(channel_id, content)
+        await self.discord.flush_messages()
+
+    def _build_reminders(self, due: list[tuple[uuid.UUID, timedelta]]) -> list[str]:
+        """
+        알림 메시지를 만듭니다. 일정과 사용자, 그룹을 한 번에 조회합니다.
+
+        :param due: (일정 id, 알림 시점) 목록
+        :return: 메시지 내용 목록. 삭제된 일정은 제외합니다.
+        """
+        with self.session_factory() as db:
+            events = {
+                e.id: e
+                for e in list_events(
+                    db,
+                    Profile.EVENT_WITH_ATTENDEES_AND_GROUPS,
+                    ids=(event_id for event_id, _ in due),
+                )
+            }
+            reminders = []
+            for event_id, offset in due:
+                event = events.get(event_id)
+                if event is None or event.ststus in INACTIVE_STATUSES:
+                    continue
+                reminders.append(build_reminder(event, offset))
+            return reminders
+
+    @staticmethod
+    def _event_id(row: Event) -> uuid.UUID:
+        # 새로운 행은 after_flush 이후에 identity가 등록되므로, flush로 채워진 id를 읽음
+        state = inspect(row)
+        return state.identity[0] if state.has_identity else state.dict["id"]
+
+    def _collect(self, session: Session, pending: dict):
+        # flush 중에 만료된 속성을 읽으면 쿼리가 발생하므로, 로드된 값만 읽음
+        # 값을 알 수 없는 일정은 None으로 저장하고, commit 후 db에서 다시 읽음
+        for row in session.new | session.dirty:
+            if not isinstance(row, Event):
+                continue
+            values = inspect(row).dict
+            if "start_time" in values and "ststus" in values:
+                pending[self._event_id(row)] = (
+                    values["start_time"],
+                    values["ststus"] not in INACTIVE_STATUSES,
+                )
+            elif row in session.new or "start_time" in values or "ststus" in values:
+                pending[self._event_id(row)] = None
+            # 둘 다 로드되지 않은 수정이라면 시작 시간과 상태는 바뀌지 않음
+        for row in session.deleted:
+            if isinstance(row, Event):
+                pending[self._event_id(row)] = (None, False)
+
+    def _collect_bulk(self, model: type[Base], rows: list[dict], pending: dict):
+        if model is not Event:
+            return
+        for row in rows:
+            pending[row["id"]] = (
+                row["start_time"],
+                row["ststus"] not in INACTIVE_STATUSES,
+            )
+
+    def _apply(self, pending: dict):
+        for event_id, values in pending.items():
+            if values is None:
+                self._refresh.add(event_id)
+                self._wakeup.set()
+                continue
+            self.schedule(event_id, *values)
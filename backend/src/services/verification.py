@@ -0,0 +1,260 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+import discord
+from discord.ext import commands
+from pydantic import BaseModel
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session, selectinload, sessionmaker
+
+from src.core.database import SessionLocal
+from src.models.user import User, UserStatus
+from src.services.discord_roles import desired_roles
+
+if TYPE_CHECKING:
+    from src.services.discord import Discord
+
+# 대기할 수 있는 최대 작업 수. 가득 차면 이벤트 handler가 자리가 날 때까지 기다림
+VERIFY_QUEUE_SIZE = 1000
+# 동시에 작업을 처리하는 worker 수
+VERIFY_WORKERS = 4
+# worker가 한 번에 꺼내 처리할 최대 작업 수 (db 조회와 역할 부여를 묶는 단위)
+VERIFY_BATCH_SIZE = 50
+
+PROMPT_MESSAGE = (
+    "CIS 서버에 오신 것을 환영합니다! 본인 확인을 위해 학번을 이 DM으로 보내주세요."
+)
+SUCCESS_MESSAGE = "{username}님, 인증이 완료되었습니다."
+
+
+class VerifyResult(BaseModel):
+    """학번 인증 결과"""
+
+    discord_id: int
+    student_id: int
+    ok: bool
+    # 연결된 사용자 id
+    user_id: str | None = None
+    error: str = ""
+
+
+def parse_student_id(content: str) -> int | None:
+    """DM 내용에서 학번을 읽습니다. 숫자가 아니면 None을 반환합니다."""
+    content = content.strip()
+    return int(content) if content.isdigit() else None
+
+
+class VerificationQueue:
+    """
+    새로 입장한 멤버의 학번 인증을 처리하는 작업 큐입니다.
+
+    gateway 이벤트 handler는 작업을 큐에 넣기만 하고, 실제 처리는 worker들이 합니다.
+    1. 멤버 입장(on_member_join): 학번을 묻는 DM 전송
+    2. DM 답장(on_message): 학번으로 사용자를 찾아 discord_id와 상태를 저장하고, 그룹 역할을 부여
+
+    worker는 대기 중인 작업을 VERIFY_BATCH_SIZE개까지 한 번에 꺼내,
+    학번 조회와 저장은 쿼리 한 번과 commit 한 번으로(별도 thread에서), 역할 부여는 sync_roles 한 번으로 처리합니다.
+    따라서 여러 명이 동시에 입장해도 gateway 이벤트 루프가 막히지 않습니다.
+
+    Example:
+        >>> verification = VerificationQueue(discord_client)
+        >>> verification.attach(bot)
+        >>> verification.start()
+    """
+
+    def __init__(
+        self,
+        discord: "Discord",
+        session_factory: sessionmaker = SessionLocal,
+        workers: int = VERIFY_WORKERS,
+        batch_size: int = VERIFY_BATCH_SIZE,
+        maxsize: int = VERIFY_QUEUE_SIZE,
+    ):
+        """
+        :param discord: Discord 클라이언트
+        :param session_factory: db session 생성 함수
+        :param workers: worker 수
+        :param batch_size: worker가 한 번에 처리할 최대 작업 수
+        :param maxsize: 큐의 최대 크기
+        """
+        self.discord = discord
+        self.session_factory = session_factory
+        self.workers = workers
+        self.batch_size = batch_size
+        self.maxsize = maxsize
+        # (멤버, 학번). 학번이 None이면 학번을 묻는 DM을 보내는 작업
+        self._queue: asyncio.Queue | None = None
+        self._tasks: list[asyncio.Task] = []
+        # 여러 worker가 같은 학번을 서로 다른 계정에 연결하지 않도록, 학번 조회와 저장은 한 번에 하나씩 실행
+        self._verify_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        """대기 중인 작업 수"""
+        return self._queue.qsize() if self._queue else 0
+
+    @property
+    def queue(self) -> asyncio.Queue:
+        # 큐는 이벤트 루프 안에서 만들어야 하므로 처음 사용할 때 생성
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+        return self._queue
+
+    def attach(self, bot: commands.Bot):
+        """
+        봇에 멤버 입장, DM 이벤트 listener를 등록합니다.
+
+        :param bot: 이벤트를 받을 봇
+        """
+        bot.add_listener(self.on_member_join, "on_member_join")
+        bot.add_listener(self.on_message, "on_message")
+
+    async def on_member_join(self, member: discord.Member):
+        await self.queue.put((member, None))
+
+    async def on_message(self, message: discord.Message):
+        # 서버 채널의 메시지와 봇의 메시지는 무시
+        if message.guild is not None or message.author.bot:
+            return
+        student_id = parse_student_id(message.content)
+        if student_id is None:
+            return
+        await self.queue.put((message.author, student_id))
+
+    def start(self):
+        """worker를 시작합니다. 실행 중인 이벤트 루프에서 호출해야 합니다."""
+        self._tasks = [t for t in self._tasks if not t.done()]
+        for _ in range(self.workers - len(self._tasks)):
+            self._tasks.append(asyncio.create_task(self._run()))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def join(self):
+        """대기 중인 작업이 모두 처리될 때까지 기다립니다."""
+        await self.queue.join()
+
+    async def _run(self):
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            try:
+                await self.process(batch)
+            except Exception as e:
+                print(f"Failed to process verification batch: {e}")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    async def process(
+        self, batch: list[tuple[discord.abc.User, int | None]]
+    ) -> list[VerifyResult]:
+        """
+        작업 묶음을 처리합니다.
+
+        :param batch: (멤버, 학번) 목록. 학번이 None이면 학번을 묻는 DM을 보냅니다.
+        :return: 학번 인증 결과 목록
+        """
+        prompts = [user for user, student_id in batch if student_id is None]
+        # 같은 멤버가 여러 번 답장했다면 마지막 답장만 사용
+        requests = {user.id: (user, sid) for user, sid in batch if sid is not None}
+
+        await asyncio.gather(*(self._dm(user, PROMPT_MESSAGE) for user in prompts))
+        if not requests:
+            return []
+
+        # db 조회와 저장은 동기 I/O이므로 이벤트 루프를 막지 않도록 별도 thread에서 실행
+        async with self._verify_lock:
+            results, desired = await asyncio.to_thread(
+                self.verify, {uid: sid for uid, (_, sid) in requests.items()}
+            )
+        desired = {uid: roles for uid, roles in desired.items() if roles}
+        if desired:
+            for r in await self.discord.sync_roles(desired):
+                if not r.ok:
+                    print(f"Failed to assign roles to {r.user_id}: {r.error}")
+
+        replies = []
+        for r in results:
+            user = requests[r.discord_id][0]
+            content = SUCCESS_MESSAGE.format(username=user.name) if r.ok else r.error
+            replies.append(self._dm(user, content))
+        await asyncio.gather(*replies)
+        return results
+
+    def verify(
+        self, requests: dict[int, int]
+    ) -> tuple[list[VerifyResult], dict[int, set[int]]]:
+        """
+        학번으로 사용자를 찾아 discord_id와 상태를 저장합니다. 쿼리 한 번으로 모든 요청의 사용자를 조회합니다.
+
+        :param requests: 디스코드 사용자 ID -> 학번
+        :return: (인증 결과 목록, 디스코드 사용자 ID -> 부여할 역할 ID 목록)
+        """
+        with self.session_factory() as db:
+            results, users = self._match(db, requests)
+            # commit하면 객체가 만료되므로 commit 전에 역할을 구함
+            desired = desired_roles(users)
+            db.commit()
+            return results, desired
+
+    def _match(
+        self, db: Session, requests: dict[int, int]
+    ) -> tuple[list[VerifyResult], list[User]]:
+        # 학번(ix_users_student_id)이나 디스코드 계정으로 연결될 수 있는 사용자만 조회
+        rows = db.scalars(
+            select(User)
+            .where(
+                or_(
+                    User.student_id.in_(set(requests.values())),
+                    User.discord_id.in_(requests.keys()),
+                )
+            )
+            .options(selectinload(User.groups))
+        ).all()
+        by_student: dict[int, list[User]] = {}
+        by_discord: dict[int, User] = {}
+        for user in rows:
+            by_student.setdefault(user.student_id, []).append(user)
+            if user.discord_id:
+                by_discord[user.discord_id] = user
+
+        results, matched = [], []
+        for discord_id, student_id in requests.items():
+            result = VerifyResult(
+                discord_id=discord_id, student_id=student_id, ok=False
+            )
+            candidates = [
+                u
+                for u in by_student.get(student_id, [])
+                if u.status not in (UserStatus.DELETE, UserStatus.DELETED)
+            ]
+            linked = by_discord.get(discord_id)
+            if not candidates:
+                result.error = f"학번 {student_id}에 해당하는 사용자가 없습니다."
+            elif len(candidates) > 1:
+                result.error = f"학번 {student_id}에 해당하는 사용자가 여러 명입니다. 관리자에게 문의하세요."
+            elif candidates[0].discord_id not in (None, discord_id):
+                result.error = "이미 다른 디스코드 계정과 연결된 학번입니다."
+            elif linked is not None and linked is not candidates[0]:
+                result.error = "이미 다른 사용자와 연결된 디스코드 계정입니다."
+            else:
+                user = candidates[0]
+                user.discord_id = discord_id
+                user.status = UserStatus.SYNCED
+                by_discord[discord_id] = user
+                result.ok = True
+                result.user_id = str(user.id)
+                matched.append(user)
+            results.append(result)
+        return results, matched
+
+    async def _dm(self, user: discord.abc.User, content: str):
+        try:
+            await user.send(content)
+        except discord.HTTPException as e:
+            # DM을 막아둔 사용자 등
+            print(f"Failed to send DM to {user.id}: {e}")
@@ -1,29 +1,40 @@
 from enum import Enum
-from discord import Colour as DiscordColour
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from discord import Colour as DiscordColour
 
 
 class Color(Enum):
     """색상 정의 및 플랫폼별 색상 코드 관리"""
 
     # (value, hex_code, notion_color, discord_color)
-    BASIC = (0, "#FFFFFF", "default", DiscordColour.light_grey())
-    GREY = (1, "#808080", "gray", DiscordColour.dark_grey())
-    BROWN = (2, "#8B4513", "brown", DiscordColour.dark_orange())
-    ORANGE = (3, "#FF8C00", "orange", DiscordColour.orange())
-    YELLOW = (4, "#FFD700", "yellow", DiscordColour.yellow())
-    GREEN = (5, "#32CD32", "green", DiscordColour.green())
-    BLUE = (6, "#4169E1", "blue", DiscordColour.blue())
-    PURPLE = (7, "#9370DB", "purple", DiscordColour.purple())
-    PINK = (8, "#FF69B4", "pink", DiscordColour.pink())
-    RED = (9, "#FF0000", "red", DiscordColour.red())
+    # discord_color는 discord.Colour의 classmethod 이름. discord 패키지는 import가 느리므로 사용할 때 import함
+    BASIC = (0, "#FFFFFF", "default", "light_grey")
+    GREY = (1, "#808080", "gray", "dark_grey")
+    BROWN = (2, "#8B4513", "brown", "dark_orange")
+    ORANGE = (3, "#FF8C00", "orange", "orange")
+    YELLOW = (4, "#FFD700", "yellow", "yellow")
+    GREEN = (5, "#32CD32", "green", "green")
+    BLUE = (6, "#4169E1", "blue", "blue")
+    PURPLE = (7, "#9370DB", "purple", "purple")
+    PINK = (8, "#FF69B4", "pink", "pink")
+    RED = (9, "#FF0000", "red", "red")
 
     def __init__(
-        self, value: int, hex_code: str, notion_color: str, discord_color: DiscordColour
+        self, value: int, hex_code: str, notion_color: str, discord_color: str
     ):
         self._value_ = value
         self.hex_code = hex_code
         self.notion_color = notion_color
-        self.discord_color = discord_color
+        self._discord_color = discord_color
+
+    @property
+    def discord_color(self) -> "DiscordColour":
+        """Discord 색상 반환"""
+        from discord import Colour as DiscordColour
+
+        return getattr(DiscordColour, self._discord_color)()
 
     @property
     def color_code(self) -> str:
@@ -67,10 +78,15 @@ class Sync(Enum):
     
     @classmethod
     def text_to_sync(cls, text: str):
-        for sync in cls:
-            if text == sync.value[0]:
-                return sync
-        raise ValueError(f"{text}는 올바르지 않는 Sync Status입니다.")
+        try:
+            return SYNC_BY_TEXT[text]
+        except KeyError:
+            raise ValueError(f"{text}는 올바르지 않는 Sync Status입니다.")
+
+    @classmethod
+    def actionable(cls) -> tuple["Sync", ...]:
+        """업데이트 해야 하는 상태 (Update, Delete)"""
+        return (cls.Update, cls.Delete)
 
 class Role(Enum):
     Admin = "Admin"
@@ -84,13 +100,26 @@ class Role(Enum):
 
     @classmethod
     def text_to_role(cls, text: str):
-        for role in cls:
-            if text == role.value:
-                return role
-        print(text)
-        raise ValueError(f"{text}는 올바르지 않은 Role입니다.")
-    
+        try:
+            return ROLE_BY_TEXT[text]
+        except KeyError:
+            raise ValueError(f"{text}는 올바르지 않은 Role입니다.")
+
+
+# Notion에 표시되는 텍스트로 enum을 찾기 위한 lookup 테이블
+SYNC_BY_TEXT = {sync.value[0]: sync for sync in Sync}
+ROLE_BY_TEXT = {role.value: role for role in Role}
+
 # 하위 호환성을 위한 딕셔너리 (deprecated)
 ColorCode = {color.value: color.hex_code for color in Color}
 NotionColor = {color.value: color.notion_color for color in Color}
-DiscordColor = {color.value: color.discord_color for color in Color}
+
+
+def __getattr__(name: str):
+    # DiscordColor는 discord 패키지를 import해야 하므로 처음 사용할 때 만듦
+    if name == "DiscordColor":
+        global DiscordColor
+        DiscordColor = {color.value: color.discord_color for color in Color}
+        return DiscordColor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
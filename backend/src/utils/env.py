@@ -1,5 +1,5 @@
 from typing import Optional
-from src.core.database import SessionLocal
+from src.core.database import AsyncSessionLocal, SessionLocal
 from src.models.system_setting import SystemSetting
 
 # 환경변수 캐시
@@ -69,6 +69,79 @@ def set_env(key: str, value: str, update_cache: bool = True) -> None:
         db.close()
 
 
+async def get_env_async(key: str, default: Optional[str] = None, use_cache: bool = True) -> Optional[str]:
+    """
+    환경변수 가져오기 (비동기)
+    
+    get_env와 같지만, 비동기 session을 사용하여 DB를 조회하는 동안 이벤트 루프를 막지 않습니다.
+    async 함수 안에서는 이 함수를 사용하십시오.
+    
+    :param key: 환경변수 키
+    :type key: str
+    :param default: 값이 없을 경우 반환할 기본값
+    :type default: Optional[str]
+    :param use_cache: 캐시 사용 여부
+    :type use_cache: bool
+    :return: 환경변수 값
+    :rtype: Optional[str]
+    
+    Example:
+        >>> token = await get_env_async("DISCORD_BOT_TOKEN")
+    """
+    # 캐시에서 확인
+    if use_cache and key in _env_cache:
+        return _env_cache[key]
+    
+    # DB에서 가져오기
+    try:
+        async with AsyncSessionLocal() as db:
+            value = await SystemSetting.get_config_async(db, key)
+        if value and use_cache:
+            _env_cache[key] = value
+        return value if value else default
+    except Exception as e:
+        print(f"Error getting env variable {key}: {e}")
+        return default
+
+
+async def set_env_async(key: str, value: str, update_cache: bool = True) -> None:
+    """
+    환경변수 설정 (비동기)
+    
+    set_env와 같지만, 비동기 session을 사용하여 이벤트 루프를 막지 않습니다.
+    
+    :param key: 환경변수 키
+    :type key: str
+    :param value: 환경변수 값
+    :type value: str
+    :param update_cache: 캐시 업데이트 여부
+    :type update_cache: bool
+    
+    Example:
+        >>> await set_env_async("NOTION_API_KEY", "new_api_key")
+    """
+    async with AsyncSessionLocal() as db:
+        await SystemSetting.update_config_async(db, key, value)
+    if update_cache:
+        _env_cache[key] = value
+
+
+def cache_env(key: str, value: str) -> None:
+    """
+    환경변수를 DB에 저장하지 않고, 현재 프로세스의 캐시에만 설정합니다.
+    DB 없이 실행하는 로컬 테스트나 벤치마크에서 사용합니다.
+    
+    :param key: 환경변수 키
+    :type key: str
+    :param value: 환경변수 값
+    :type value: str
+    
+    Example:
+        >>> cache_env("NOTION_API_KEY", "stub")
+    """
+    _env_cache[key] = value
+
+
 def clear_env_cache():
     """
     환경변수 캐시 초기화
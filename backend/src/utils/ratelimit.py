@@ -0,0 +1,85 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+class TokenBucket:
+    """
+    초당 rate개의 토큰이 채워지는 token bucket입니다.
+    요청 전에 acquire()로 토큰을 하나 가져가며, 토큰이 없으면 다음 토큰이 채워질 때까지 기다립니다.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """
+        :param rate: 초당 채워지는 토큰 수
+        :type rate: float
+        :param capacity: 버킷의 최대 토큰 수 (순간적으로 허용되는 burst). 기본값은 rate
+        :type capacity: float | None
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        # 서버가 Retry-After를 보내면 이 시간까지 모든 요청을 멈춤
+        self.blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+    def block(self, seconds: float):
+        """
+        seconds 동안 토큰 발급을 중단합니다. 이미 더 긴 시간 동안 중단되어 있다면 무시합니다.
+
+        :param seconds: 중단할 시간(초)
+        :type seconds: float
+        """
+        until = time.monotonic() + seconds
+        if until > self.blocked_until:
+            self.blocked_until = until
+            # 중단이 풀렸을 때 한꺼번에 요청이 몰리지 않도록 버킷을 비움
+            self.tokens = 0.0
+            self.updated_at = until
+
+    async def acquire(self):
+        """토큰을 하나 가져갑니다. 토큰이 없다면 채워질 때까지 기다립니다."""
+        # lock을 잡은 채로 기다리므로, 대기 중인 요청은 도착한 순서대로 토큰을 받음
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Retry-After 헤더 값을 초 단위로 변환합니다. 초 혹은 HTTP-date 형식을 모두 지원합니다.
+
+    :param value: Retry-After 헤더 값
+    :type value: str | None
+    :return: 기다려야 하는 시간(초). 해석할 수 없으면 None
+    :rtype: float | None
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,63 @@
+"""
+테스트 공통 fixture
+
+모든 테스트는 메모리 SQLite를 사용하며, PostgreSQL이나 외부 API 없이 실행됩니다.
+backend 디렉토리에서 실행하십시오.
+    python -m pytest -q
+"""
+
+import os
+
+from cryptography.fernet import Fernet
+
+# 설정 값 암호화 키. .env가 없는 환경에서도 model을 import할 수 있도록 테스트용 키를 사용
+os.environ.setdefault("ENC_KEY", Fernet.generate_key().decode())
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from src.models.base import Base
+
+# relationship을 설정하기 위해 모든 model을 import
+import src.models.event, src.models.group, src.models.system_setting, src.models.user
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    with Session(engine) as session:
+        yield session
+
+
+class QueryCounter:
+    """engine으로 실행된 SQL 구문 수를 셉니다."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args):
+        self.count += 1
+
+
+@pytest.fixture
+def queries(engine):
+    """
+    engine으로 실행되는 쿼리 수를 세는 counter
+
+    Example:
+        >>> queries.count = 0
+        >>> list_members(db, Profile.MEMBER_WITH_GROUPS)
+        >>> assert queries.count == 2
+    """
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(engine, "before_cursor_execute", counter)
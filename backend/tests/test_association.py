@@ -0,0 +1,123 @@
+from datetime import datetime
+
+from sqlalchemy import insert, select
+
+from src.core.association import (
+    _pairs,
+    sync_association,
+    sync_event_users,
+    sync_user_groups,
+)
+from src.models.assiciation import user_event_association, user_group_association
+from src.models.event import Event
+from src.models.group import Group
+from src.models.user import User
+
+
+def seed(db, users: int = 3, groups: int = 2, events: int = 0):
+    """사용자, 그룹, 일정을 만들고 id 목록을 반환합니다."""
+    now = datetime.now()
+    user_rows = [
+        User(
+            username=f"u{i}",
+            email=f"u{i}@pusan.ac.kr",
+            hashed_password="",
+            notion_id=f"u{i}",
+        )
+        for i in range(users)
+    ]
+    group_rows = [Group(title=f"g{i}", notion_id=f"g{i}") for i in range(groups)]
+    event_rows = [
+        Event(title=f"e{i}", notion_id=f"e{i}", start_time=now, end_time=now)
+        for i in range(events)
+    ]
+    db.add_all(user_rows + group_rows + event_rows)
+    db.commit()
+    return (
+        [u.id for u in user_rows],
+        [g.id for g in group_rows],
+        [e.id for e in event_rows],
+    )
+
+
+def rows(db, table) -> set[tuple]:
+    return set(db.execute(select(*table.primary_key.columns)).all())
+
+
+def test_unscoped_sync_adds_and_removes(db):
+    users, groups, _ = seed(db)
+    sync_user_groups(db, [(users[0], groups[0]), (users[1], groups[0])])
+    db.commit()
+
+    result = sync_user_groups(db, [(users[1], groups[0]), (users[2], groups[1])])
+    db.commit()
+
+    assert (result.added, result.removed) == (1, 1)
+    assert rows(db, user_group_association) == {
+        (users[1], groups[0]),
+        (users[2], groups[1]),
+    }
+
+
+def test_scoped_sync_keeps_rows_outside_scope(db):
+    users, groups, _ = seed(db)
+    sync_user_groups(db, [(users[0], groups[0]), (users[1], groups[1])])
+    db.commit()
+
+    # users[0]만 동기화. 범위 밖의 쌍(users[2])은 무시하고, users[1]의 행은 그대로 둠
+    result = sync_user_groups(
+        db, [(users[0], groups[1]), (users[2], groups[0])], user_ids=[users[0]]
+    )
+    db.commit()
+
+    assert (result.added, result.removed) == (1, 1)
+    assert rows(db, user_group_association) == {
+        (users[0], groups[1]),
+        (users[1], groups[1]),
+    }
+
+
+def test_scope_on_right_column(db):
+    users, _, events = seed(db, groups=0, events=2)
+    sync_event_users(db, [(users[0], events[0]), (users[0], events[1])])
+    db.commit()
+
+    result = sync_event_users(db, [(users[1], events[0])], event_ids=[events[0]])
+    db.commit()
+
+    assert (result.added, result.removed) == (1, 1)
+    assert rows(db, user_event_association) == {
+        (users[1], events[0]),
+        (users[0], events[1]),
+    }
+
+
+def test_rerun_is_a_noop(db):
+    users, groups, _ = seed(db)
+    pairs = [(users[0], groups[0]), (users[1], groups[1])]
+    sync_user_groups(db, pairs)
+    db.commit()
+
+    result = sync_user_groups(db, pairs)
+    db.commit()
+    assert (result.added, result.removed) == (0, 0)
+
+    result = sync_user_groups(db, pairs, user_ids=[users[0]])
+    db.commit()
+    assert (result.added, result.removed) == (0, 0)
+    assert rows(db, user_group_association) == set(pairs)
+
+
+def test_stale_temp_table_pairs_are_ignored(db):
+    users, groups, _ = seed(db)
+    # 이전 호출이 실패한 뒤 rollback 대신 commit되어, 임시 table에 쌍이 남은 경우
+    bind = db.connection()
+    _pairs.create(bind, checkfirst=True)
+    db.execute(insert(_pairs), [{"left_id": users[2], "right_id": groups[1]}])
+    db.commit()
+
+    result = sync_association(db, user_group_association, [(users[0], groups[0])])
+    db.commit()
+
+    assert (result.added, result.removed) == (1, 0)
+    assert rows(db, user_group_association) == {(users[0], groups[0])}
@@ -0,0 +1,57 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.services.discord_ratelimit import DiscordRateLimiter, route_key
+from src.utils.ratelimit import TokenBucket
+
+URL = "https://discord.com/api/v10/guilds/1/members/2"
+
+
+def limiter_with(handler) -> DiscordRateLimiter:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return DiscordRateLimiter(client)
+
+
+def route_bucket(limiter: DiscordRateLimiter):
+    return limiter._get_bucket(*route_key("GET", URL))
+
+
+def test_cancel_while_waiting_for_global_limit_releases_route_bucket():
+    async def main():
+        limiter = limiter_with(lambda request: httpx.Response(200))
+        limiter.global_bucket.block(60)
+
+        task = asyncio.create_task(limiter.request("GET", URL))
+        # route bucket을 얻고 전역 한도를 기다리는 중에 취소
+        for _ in range(5):
+            await asyncio.sleep(0)
+        bucket = route_bucket(limiter)
+        assert bucket.remaining == 0
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert bucket.remaining == 1 and bucket.in_flight == 0
+
+        # 전역 한도가 풀리면 같은 route의 다음 요청이 바로 전송됨
+        limiter.global_bucket = TokenBucket(50)
+        async with asyncio.timeout(1):
+            response = await limiter.request("GET", URL)
+        assert response.status_code == 200
+
+    asyncio.run(main())
+
+
+def test_failed_request_releases_route_bucket():
+    def handler(request):
+        raise httpx.ConnectError("down", request=request)
+
+    async def main():
+        limiter = limiter_with(handler)
+        with pytest.raises(httpx.ConnectError):
+            await limiter.request("GET", URL)
+        bucket = route_bucket(limiter)
+        assert bucket.remaining == 1 and bucket.in_flight == 0
+
+    asyncio.run(main())
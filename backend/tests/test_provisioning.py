@@ -0,0 +1,86 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.models.base import Base
+from src.models.group import Group
+from src.services.provisioning import GroupProvisioner
+
+
+@pytest.fixture
+def shared_engine():
+    # 만든 id는 별도 thread의 session으로 저장하므로, 모든 thread가 같은 메모리 db를 사용하도록 함
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+class Guild:
+    """역할은 만들 수 있지만 카테고리를 만들다 실패하는 길드"""
+
+    default_role = None
+
+    def get_role(self, role_id):
+        return None
+
+    def get_channel(self, channel_id):
+        return None
+
+    async def create_category(self, **kwargs):
+        raise RuntimeError("category failed")
+
+
+class GuildWithRoles(Guild):
+    """이전에 만든 역할이 남아있는 길드"""
+
+    def get_role(self, role_id):
+        return SimpleNamespace(id=role_id)
+
+
+class FakeDiscord:
+    def __init__(self):
+        self.guild = Guild()
+        self.roles = 0
+
+    async def get_guild(self, guild_id=None):
+        return self.guild
+
+    async def create_role(self, name, color):
+        self.roles += 1
+        return SimpleNamespace(id=1000 + self.roles)
+
+
+def test_created_ids_are_saved_before_a_later_step_fails(shared_engine):
+    with Session(shared_engine) as db:
+        db.add(Group(title="group0", notion_id="g0"))
+        db.commit()
+        group = db.scalar(select(Group))
+
+        discord = FakeDiscord()
+        provisioner = GroupProvisioner(
+            discord, session_factory=sessionmaker(bind=shared_engine)
+        )
+        [result] = asyncio.run(provisioner.provision([group]))
+
+        assert not result.ok and result.created == ["role"]
+        # 호출한 쪽의 session은 저장된 값을 다시 쓰지 않음
+        assert group.discord_id == result.role_id and group not in db.dirty
+
+    # 호출한 쪽의 session을 commit하지 않아도 역할 id는 저장되어 있음
+    with Session(shared_engine) as db:
+        assert db.scalar(select(Group.discord_id)) == result.role_id
+
+    # 다시 실행하면 저장된 역할은 다시 만들지 않음 (길드에 남아있는 경우)
+    discord.guild = GuildWithRoles()
+    with Session(shared_engine) as db:
+        [result] = asyncio.run(provisioner.provision([db.scalar(select(Group))]))
+    assert discord.roles == 1 and "role" not in result.created
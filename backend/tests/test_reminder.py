@@ -0,0 +1,111 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.models.base import Base
+from src.models.event import Event, EventStatus
+from src.services.reminder import ReminderScheduler
+
+
+@pytest.fixture
+def shared_engine():
+    # 알림 스케줄러는 별도 thread에서 db를 읽으므로, 모든 thread가 같은 메모리 db를 사용하도록 함
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def add_event(db: Session, **fields) -> Event:
+    start = datetime.now() + timedelta(days=3)
+    values = {
+        "title": "event",
+        "notion_id": "e0",
+        "start_time": start,
+        "end_time": start + timedelta(hours=1),
+    }
+    values.update(fields)
+    event = Event(**values)
+    db.add(event)
+    db.commit()
+    return event
+
+
+def test_collect_does_not_load_expired_attributes(db, queries):
+    scheduler = ReminderScheduler(discord=None)
+    scheduler.watch(db)
+    event = add_event(db)
+    assert len(scheduler) == len(scheduler.offsets)
+
+    # commit으로 만료된 행의 다른 속성만 바꾸면, flush 중에 시작 시간과 상태를 읽지 않음
+    db.refresh(event, ["id", "title"])
+    queries.count = 0
+    event.title = "renamed"
+    db.flush()
+    assert queries.count == 1
+    db.commit()
+    assert len(scheduler) == len(scheduler.offsets)
+    assert not scheduler._refresh
+
+
+def test_unloaded_start_time_is_refreshed_from_db(shared_engine):
+    scheduler = ReminderScheduler(
+        discord=None, session_factory=sessionmaker(bind=shared_engine)
+    )
+    with Session(shared_engine) as db:
+        scheduler.watch(db)
+        event = add_event(db)
+        event_id = event.id
+        assert len(scheduler) == len(scheduler.offsets)
+
+        # 시작 시간은 로드되지 않은 채로 상태만 바뀜
+        db.expire(event, ["start_time"])
+        event.ststus = EventStatus.DELETE
+        db.commit()
+    assert scheduler._refresh == {event_id}
+
+    asyncio.run(scheduler._refresh_pending())
+    assert len(scheduler) == 0
+    assert not scheduler._refresh
+
+
+def test_starts_on_bot_ready_and_rebuilds_from_db(shared_engine):
+    with Session(shared_engine) as db:
+        add_event(db)
+
+    class Bot:
+        def __init__(self):
+            self.listeners = {}
+
+        def add_listener(self, func, name):
+            self.listeners[name] = func
+
+    async def main():
+        scheduler = ReminderScheduler(
+            discord=None, session_factory=sessionmaker(bind=shared_engine)
+        )
+        bot = Bot()
+        scheduler.attach(bot)
+        await bot.listeners["on_ready"]()
+        # 재연결로 on_ready가 다시 발생해도 루프는 하나만 실행됨
+        task = scheduler._task
+        await bot.listeners["on_ready"]()
+        assert scheduler._task is task
+
+        async with asyncio.timeout(1):
+            while len(scheduler) == 0:
+                await asyncio.sleep(0.01)
+        assert len(scheduler) == len(scheduler.offsets)
+
+        await scheduler.stop()
+        assert task.cancelled()
+
+    asyncio.run(main())
@@ -0,0 +1,124 @@
+import random
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from src.core.repository import (
+    Profile,
+    get_event,
+    get_member,
+    list_events,
+    list_groups,
+    list_members,
+)
+from src.models.event import Event
+from src.models.group import Group
+from src.models.user import User
+
+LIST_FUNCTIONS = {User: list_members, Group: list_groups, Event: list_events}
+
+# profile별 쿼리 수: 목록 조회 1 + profile에 포함된 관계 경로의 관계마다 1
+EXPECTED_QUERIES = {
+    Profile.MEMBER: 1,
+    Profile.MEMBER_WITH_GROUPS: 2,
+    Profile.MEMBER_WITH_GROUPS_AND_EVENTS: 3,
+    Profile.GROUP: 1,
+    Profile.GROUP_WITH_MEMBERS: 2,
+    Profile.EVENT: 1,
+    Profile.EVENT_WITH_ATTENDEES: 2,
+    Profile.EVENT_WITH_ATTENDEES_AND_GROUPS: 3,
+    Profile.EVENT_WITH_GROUP_MEMBERS: 4,
+}
+
+
+def seed(db, size: int) -> tuple[list[uuid.UUID], list[uuid.UUID]]:
+    """
+    사용자 size명, 그룹과 일정 size/10개를 만들고 무작위로 연결합니다.
+    이미 로드된 객체가 쿼리 수에 영향을 주지 않도록 session을 비웁니다.
+
+    :return: (사용자 id 목록, 일정 id 목록)
+    """
+    rng = random.Random(size)
+    now = datetime.now()
+    groups = [Group(title=f"g{i}", notion_id=f"g{i}") for i in range(size // 10)]
+    users = [
+        User(
+            username=f"u{i}",
+            email=f"u{i}@pusan.ac.kr",
+            hashed_password="",
+            notion_id=f"u{i}",
+            groups=rng.sample(groups, 2),
+        )
+        for i in range(size)
+    ]
+    events = [
+        Event(
+            title=f"e{i}",
+            notion_id=f"e{i}",
+            start_time=now + timedelta(hours=i),
+            end_time=now + timedelta(hours=i + 1),
+            users=rng.sample(users, 5),
+            groups=rng.sample(groups, 1),
+        )
+        for i in range(size // 10)
+    ]
+    db.add_all(users + groups + events)
+    db.commit()
+    ids = [u.id for u in users], [e.id for e in events]
+    db.expunge_all()
+    return ids
+
+
+def touch(rows: list, profile: Profile) -> int:
+    """profile에 포함된 관계를 모두 읽고, 읽은 객체 수를 반환합니다."""
+    loaded = 0
+    for row in rows:
+        for path in profile.paths:
+            targets = [row]
+            for attr in path:
+                targets = [t for target in targets for t in getattr(target, attr.key)]
+                loaded += len(targets)
+    return loaded
+
+
+@pytest.mark.parametrize("size", [20, 200])
+@pytest.mark.parametrize("profile", list(Profile), ids=lambda p: p.name)
+def test_query_count_is_fixed_per_profile(db, queries, profile, size):
+    seed(db, size)
+
+    queries.count = 0
+    rows = LIST_FUNCTIONS[profile.model](db, profile)
+    loaded = touch(rows, profile)
+
+    assert rows
+    assert loaded or not profile.paths
+    assert queries.count == EXPECTED_QUERIES[profile]
+
+
+def test_get_uses_the_same_query_count(db, queries):
+    user_ids, event_ids = seed(db, 20)
+
+    queries.count = 0
+    user = get_member(db, user_ids[0], Profile.MEMBER_WITH_GROUPS)
+    assert len(user.groups) == 2
+    assert queries.count == 2
+
+    queries.count = 0
+    event = get_event(db, event_ids[0], Profile.EVENT_WITH_GROUP_MEMBERS)
+    assert [u for g in event.groups for u in g.users]
+    assert queries.count == 4
+
+
+def test_relationship_outside_profile_raises(db):
+    seed(db, 20)
+    user = list_members(db, Profile.MEMBER_WITH_GROUPS)[0]
+    user.groups
+    with pytest.raises(InvalidRequestError):
+        user.evnets
+
+
+def test_profile_of_another_model_is_rejected(db):
+    with pytest.raises(ValueError):
+        list_events(db, Profile.MEMBER)
@@ -0,0 +1,151 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from src.core.id_index import IdIndex
+from src.core.session_watch import SessionWatcher
+from src.models.group import Group
+from src.models.user import User
+from src.services.notion.notion import EventRecord, GroupRecord, MemberRecord
+from src.services.notion.upsert import upsert_records
+from src.services.reminder import ReminderScheduler
+from src.utils.constants import Sync
+
+
+def member(i: int, **fields) -> MemberRecord:
+    values = {
+        "status": Sync.Synced,
+        "notion_id": f"{i:032x}",
+        "log": "",
+        "name": f"member{i}",
+        "student_id": 202400000 + i,
+        "email": f"m{i}@pusan.ac.kr",
+        "phone": "010-0000-0000",
+        "discord_id": str(10**17 + i),
+    }
+    values.update(fields)
+    return MemberRecord(**values)
+
+
+def group(i: int, **fields) -> GroupRecord:
+    values = {
+        "status": Sync.Synced,
+        "notion_id": f"{1000 + i:032x}",
+        "log": "",
+        "name": f"group{i}",
+    }
+    values.update(fields)
+    return GroupRecord(**values)
+
+
+def event(i: int, start: datetime) -> EventRecord:
+    return EventRecord(
+        status=Sync.Synced,
+        notion_id=f"{2000 + i:032x}",
+        log="",
+        title=f"event{i}",
+        date_start=start.isoformat(),
+    )
+
+
+def user_count(db) -> int:
+    return db.scalar(select(func.count()).select_from(User))
+
+
+def test_insert_then_unchanged(db):
+    records = [member(i) for i in range(5)]
+    result = upsert_records(db, records)
+    db.commit()
+    assert result.written == 5 and len(result.ids) == 5
+
+    result = upsert_records(db, records)
+    db.commit()
+    assert result.written == 0 and result.unchanged == 5 and len(result.ids) == 5
+
+
+def test_empty_email_and_name_are_skipped(db):
+    records = [member(0), member(1, email=""), member(2, email=""), member(3, name="")]
+    result = upsert_records(db, records)
+    db.commit()
+
+    assert result.written == 1
+    assert set(result.skipped) == {r.notion_id for r in records[1:]}
+    assert user_count(db) == 1
+
+
+def test_duplicates_within_batch_are_skipped(db):
+    records = [
+        member(0, email="same@pusan.ac.kr"),
+        member(1, email="same@pusan.ac.kr"),
+        member(2, name="member0"),
+        member(3, discord_id=str(10**17)),
+    ]
+    result = upsert_records(db, records)
+    db.commit()
+
+    assert list(result.ids) == [records[0].notion_id]
+    assert set(result.skipped) == {r.notion_id for r in records[1:]}
+
+
+def test_conflict_with_existing_row_is_skipped(db):
+    upsert_records(db, [member(0)])
+    db.commit()
+
+    # 다른 notion_id가 이미 사용 중인 이메일. 기존 행의 값은 바꾸지 않음
+    result = upsert_records(db, [member(1, email="m0@pusan.ac.kr"), member(2)])
+    db.commit()
+
+    assert set(result.skipped) == {member(1).notion_id}
+    assert result.written == 1
+    assert user_count(db) == 2
+
+
+def test_group_title_too_long_or_duplicated(db):
+    records = [group(0), group(1, name="x" * 31), group(2, name="group0")]
+    result = upsert_records(db, records)
+    db.commit()
+
+    assert result.written == 1
+    assert set(result.skipped) == {records[1].notion_id, records[2].notion_id}
+    assert db.scalar(select(Group.title)) == "group0"
+
+
+def test_watchers_apply_bulk_writes_on_commit(db):
+    index = IdIndex()
+    index.load(db)
+    index.watch(db)
+    scheduler = ReminderScheduler(discord=None)
+    scheduler.watch(db)
+
+    start = datetime.now() + timedelta(days=3)
+    result = upsert_records(db, [member(0), event(0, start)])
+    # commit 전에는 반영하지 않음
+    assert index.users.id_of(member(0).notion_id) is None
+    assert len(scheduler) == 0
+
+    db.commit()
+    assert index.users.id_of(member(0).notion_id) == result.ids[member(0).notion_id]
+    assert index.users.id_of_discord(10**17) == result.ids[member(0).notion_id]
+    assert index.events.id_of(event(0, start).notion_id) is not None
+    assert len(scheduler) == len(scheduler.offsets)
+
+
+def test_watchers_discard_bulk_writes_on_rollback(db):
+    index = IdIndex()
+    index.load(db)
+    index.watch(db)
+
+    upsert_records(db, [member(0)])
+    db.rollback()
+    db.commit()
+    assert index.users.id_of(member(0).notion_id) is None
+
+
+def test_watcher_without_apply_cannot_be_created():
+    class Incomplete(SessionWatcher):
+        def _collect(self, session, pending):
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete()